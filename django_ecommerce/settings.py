@@ -108,6 +108,19 @@ DATABASES = {
 }
 
 
+# Cache
+# https://docs.djangoproject.com/en/4.2/ref/settings/#caches
+
+CACHES = {
+    "default": {
+        "BACKEND": os.environ.get(
+            "CACHE_BACKEND", "django.core.cache.backends.locmem.LocMemCache"
+        ),
+        "LOCATION": os.environ.get("CACHE_LOCATION", ""),
+    }
+}
+
+
 # Password validation
 # https://docs.djangoproject.com/en/4.2/ref/settings/#auth-password-validators
 
@@ -215,9 +228,39 @@ CELERY_BEAT_SCHEDULE = {
         "task": "accounts.tasks.delete_expired_otps",
         "schedule": timedelta(hours=1),
     },
+    "delete-expired-category-tombstones": {
+        "task": "inventory.tasks.delete_expired_category_tombstones",
+        "schedule": timedelta(days=1),
+    },
 }
 
 
+# inventory settings
+
+# Categories with more descendants than this are deleted in the background.
+CATEGORY_BACKGROUND_DELETE_THRESHOLD = 1000
+# The number of categories deleted in a single transaction by the background deletion.
+CATEGORY_DELETE_BATCH_SIZE = 500
+# The maximum depth of categories, top level categories have a depth of 0. Paths hold the ids of all
+# ancestors, so with ids of up to 19 digits they always fit in their 1024 characters.
+CATEGORY_MAX_DEPTH = 50
+# The default and the maximum number of categories returned on a single page.
+CATEGORY_PAGE_SIZE = 100
+CATEGORY_MAX_PAGE_SIZE = 1000
+# The maximum number of categories looked up by a single batch request.
+CATEGORY_BATCH_MAX_SIZE = 100
+# The number of categories checked and inserted at once when categories are created in bulk.
+CATEGORY_BULK_BATCH_SIZE = 1000
+# The number of categories read from the database at once by the streaming export.
+CATEGORY_EXPORT_CHUNK_SIZE = 2000
+# The maximum number of rejected rows returned with the progress of a category import.
+CATEGORY_IMPORT_MAX_SHOWN_REJECTS = 100
+# How long records of deleted categories are kept for the change feed.
+CATEGORY_TOMBSTONE_RETENTION = timedelta(days=30)
+# How long the change feed waits for transactions to commit before moving its position past a change.
+CATEGORY_CHANGES_SAFETY_WINDOW = timedelta(minutes=1)
+
+
 # For debug toolbar
 
 if DEBUG:
@@ -1,11 +1,37 @@
 from django.contrib import admin
-from .models import Category
+from django.conf import settings
+from .models import Category, CategoryDeletion, CategoryImport
+from .search import search_categories
 
 
 class CategoryAdmin(admin.ModelAdmin):
-    list_display = ["name", "slug", "short_description", "has_image", "parent"]
+    list_display = [
+        "name",
+        "slug",
+        "short_description",
+        "has_image",
+        "parent",
+        "child_count",
+        "descendant_count",
+    ]
     search_fields = ["name", "description"]
 
+    def get_search_results(self, request, queryset, search_term):
+        """
+        Searches categories with the full-text index instead of scanning names and descriptions.
+        """
+        if not search_term:
+            return queryset, False
+        ids = search_categories(search_term, limit=settings.CATEGORY_MAX_PAGE_SIZE)
+        return queryset.filter(pk__in=ids), False
+
+    def delete_queryset(self, request, queryset):
+        """
+        Deletes selected categories one by one, so that counts of their ancestors are updated.
+        """
+        for category in queryset:
+            category.delete()
+
     @admin.display(description="Description")
     def short_description(self, obj):
         """
@@ -26,4 +52,31 @@ class CategoryAdmin(admin.ModelAdmin):
         return True if obj.image else False
 
 
+class CategoryDeletionAdmin(admin.ModelAdmin):
+    list_display = [
+        "name",
+        "status",
+        "deleted_count",
+        "total_count",
+        "created_at",
+        "completed_at",
+    ]
+    list_filter = ["status"]
+
+
+class CategoryImportAdmin(admin.ModelAdmin):
+    list_display = [
+        "source",
+        "status",
+        "processed_count",
+        "total_count",
+        "rejected_count",
+        "created_at",
+        "completed_at",
+    ]
+    list_filter = ["status"]
+
+
 admin.site.register(Category, CategoryAdmin)
+admin.site.register(CategoryDeletion, CategoryDeletionAdmin)
+admin.site.register(CategoryImport, CategoryImportAdmin)
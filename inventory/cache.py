@@ -0,0 +1,130 @@
+import contextlib
+import functools
+import hashlib
+import threading
+import time
+import uuid
+from django.core.cache import cache
+from django.db import transaction
+from rest_framework import status
+from rest_framework.response import Response
+
+
+CATEGORIES_VERSION_KEY = "inventory:categories:version"
+
+# State of `deferred_invalidation` blocks of the current thread.
+_deferred = threading.local()
+
+# Cached entries are keyed by version, so they never have to be deleted explicitly,
+# this timeout only lets the cache drop entries of outdated versions.
+CATEGORY_CACHE_TIMEOUT = 60 * 60 * 24
+
+
+def get_categories_version():
+    """
+    Returns the token identifying the current state of the categories table.
+
+    The token changes every time any category is created, updated or deleted, so it can be used
+    as a part of cache keys for data derived from categories.
+    """
+
+    version = cache.get(CATEGORIES_VERSION_KEY)
+    if version is None:
+        cache.add(CATEGORIES_VERSION_KEY, _new_categories_version(), None)
+        version = cache.get(CATEGORIES_VERSION_KEY)
+    return version
+
+
+def get_categories_last_modified(version=None):
+    """
+    Returns the time (as a Unix timestamp) when the categories were changed last, read from the version.
+
+    If the version was lost from the cache, the time the new version was created is returned, which is
+    never earlier than the actual change.
+    """
+
+    timestamp, _, _ = (version or get_categories_version()).partition("-")
+    return int(timestamp) / 1_000_000_000
+
+
+def _new_categories_version():
+    # The version starts with the time of the change, so it doubles as the last modification time.
+    return f"{time.time_ns()}-{uuid.uuid4().hex}"
+
+
+def _bump_categories_version():
+    cache.set(CATEGORIES_VERSION_KEY, _new_categories_version(), None)
+
+
+def invalidate_categories():
+    """
+    Invalidates all cached data derived from categories by changing the categories version.
+
+    Version is changed immediately, so the current transaction does not read stale data, and
+    once again after the transaction commits, discarding anything other workers cached from
+    the state that was not committed yet.
+    """
+
+    if getattr(_deferred, "depth", 0):
+        _deferred.pending = True
+        return
+
+    _bump_categories_version()
+    transaction.on_commit(_bump_categories_version)
+
+
+@contextlib.contextmanager
+def deferred_invalidation():
+    """
+    Invalidates categories only once at the end of the block, no matter how many changes are made in it.
+
+    Deleting categories with signals invalidates them once for every deleted row, wrapping the deletion
+    in this block makes it a single invalidation. It has to be used inside of the transaction making the
+    changes, so the version is changed again after that transaction commits.
+    """
+
+    _deferred.depth = getattr(_deferred, "depth", 0) + 1
+    if _deferred.depth == 1:
+        _deferred.pending = False
+    try:
+        yield
+    finally:
+        _deferred.depth -= 1
+        if not _deferred.depth and _deferred.pending:
+            invalidate_categories()
+
+
+def category_cache_key(*parts):
+    """
+    Builds a cache key for data derived from categories that is bound to the current version.
+    """
+
+    return ":".join(
+        ["inventory:categories", get_categories_version(), *map(str, parts)]
+    )
+
+
+def cache_category_response(view_method):
+    """
+    Read-through cache for read endpoints of categories.
+
+    Data of successful responses is cached under the full URL of the request, bound to the current
+    categories version, so cached responses are dropped on the next write to categories.
+    """
+
+    @functools.wraps(view_method)
+    def wrapper(self, request, *args, **kwargs):
+        url_hash = hashlib.md5(
+            request.build_absolute_uri().encode(), usedforsecurity=False
+        ).hexdigest()
+        cache_key = category_cache_key("response", url_hash)
+        data = cache.get(cache_key)
+        if data is not None:
+            return Response(data)
+
+        response = view_method(self, request, *args, **kwargs)
+        if response.status_code == status.HTTP_200_OK:
+            cache.set(cache_key, response.data, CATEGORY_CACHE_TIMEOUT)
+        return response
+
+    return wrapper
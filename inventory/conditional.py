@@ -0,0 +1,62 @@
+import hashlib
+from datetime import datetime, timezone
+from .cache import get_categories_last_modified, get_categories_version
+from .snapshot import get_category_snapshot
+
+
+def _etag(request, *parts):
+    """
+    Builds an ETag from `parts` and the requested URL and media type, so every representation gets its own.
+    """
+    key = ":".join(
+        map(str, [*parts, request.get_full_path(), request.accepted_media_type])
+    )
+    return hashlib.md5(key.encode(), usedforsecurity=False).hexdigest()
+
+
+def categories_etag(request, *args, **kwargs):
+    """
+    ETag of responses derived from many categories, which changes together with the categories version.
+    """
+    return _etag(request, get_categories_version())
+
+
+def categories_last_modified(request, *args, **kwargs):
+    """
+    Last modification time of responses derived from many categories, read from the categories version.
+    """
+    return datetime.fromtimestamp(get_categories_last_modified(), timezone.utc)
+
+
+def _get_category_times(slug):
+    """
+    Returns the id of the category and modification times of the category and its parent read from
+    the snapshot, or None if the category does not exist.
+    """
+    category = get_category_snapshot().by_slug.get(slug)
+    if category is None:
+        return None
+    times = [category.updated_at]
+    # Parent can be expanded in the response, so its changes are taken into account as well.
+    if category.parent is not None:
+        times.append(category.parent.updated_at)
+    return category.pk, times
+
+
+def category_etag(request, slug, *args, **kwargs):
+    """
+    ETag of a single category, which changes only when the category or its parent changes.
+    """
+    found = _get_category_times(slug)
+    if found is None:
+        return None
+    pk, times = found
+    return _etag(request, pk, *times)
+
+
+def category_last_modified(request, slug, *args, **kwargs):
+    """
+    Last modification time of a single category or its parent.
+    """
+    found = _get_category_times(slug)
+    return max(found[1]) if found is not None else None
@@ -0,0 +1,82 @@
+import csv
+import json
+import zlib
+from itertools import islice
+from .models import Category
+
+# Columns of the exported categories, `parent` holds the id of the parent category.
+EXPORT_FIELDS = [
+    "id",
+    "name",
+    "slug",
+    "description",
+    "image",
+    "parent",
+    "child_count",
+    "descendant_count",
+]
+
+# Content types of the supported export formats.
+EXPORT_FORMATS = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
+
+class _Echo:
+    """
+    File-like object that returns what is written to it, so csv.writer formats rows without buffering them.
+    """
+
+    def write(self, value):
+        return value
+
+
+def iter_category_export(export_format="ndjson", after=None, chunk_size=2000):
+    """
+    Yields all active categories ordered by id as NDJSON or CSV text, one block of lines per `chunk_size` rows.
+
+    Rows are read with `.iterator(chunk_size=...)`, which uses a server-side cursor where the database
+    supports it, so memory use does not grow with the number of exported categories.
+
+    Parameters:
+    - export_format (str): Either 'ndjson' or 'csv'.
+    - after (int): Id of the last category received by an interrupted export, the export continues after it.
+    The CSV header is written only when the export is not resumed.
+    - chunk_size (int): The number of rows read from the database and formatted at once.
+    """
+
+    categories = Category.objects.active().order_by("pk")
+    if after is not None:
+        categories = categories.filter(pk__gt=after)
+    rows = categories.values_list(
+        "pk",
+        "name",
+        "slug",
+        "description",
+        "image",
+        "parent_id",
+        "child_count",
+        "descendant_count",
+    ).iterator(chunk_size=chunk_size)
+
+    if export_format == "csv":
+        format_row = csv.writer(_Echo()).writerow
+        if after is None:
+            yield format_row(EXPORT_FIELDS)
+    else:
+
+        def format_row(row):
+            return json.dumps(dict(zip(EXPORT_FIELDS, row))) + "\n"
+
+    while block := list(islice(rows, chunk_size)):
+        yield "".join(format_row(row) for row in block)
+
+
+def gzip_stream(chunks):
+    """
+    Compresses text chunks into a gzip stream on the fly, keeping only the compressor state in memory.
+    """
+    compressor = zlib.compressobj(wbits=16 + zlib.MAX_WBITS)
+    for chunk in chunks:
+        data = compressor.compress(chunk.encode())
+        if data:
+            yield data
+    yield compressor.flush()
@@ -0,0 +1,345 @@
+import csv
+import json
+from array import array
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F, Q
+from django.db.models.functions import Lower
+from django.utils import timezone
+from django.utils.text import slugify
+from .models import Category, CategoryImport, CategoryImportReject, check_depth
+from .serializers import CategoryImportRowSerializer
+
+# Columns of the imported files, `parent_name` is the name of the parent category.
+IMPORT_FIELDS = ["name", "description", "parent_name"]
+
+# Parent index of rows whose parent is not in the file.
+EXTERNAL = -1
+
+# Levels of rows while they are being ordered, rejected rows are imported with the top level.
+UNVISITED, VISITING, BROKEN = -1, -2, -3
+
+
+def iter_import_rows(file, import_format):
+    """
+    Yields `(line, row, error)` for every row of a NDJSON or CSV file opened in text mode.
+
+    `row` is a dict of the values of the row, or None if the line could not be parsed, in which case
+    `error` describes the problem. Empty lines of NDJSON files are skipped.
+    """
+
+    if import_format == "csv":
+        reader = csv.DictReader(file)
+        for row in reader:
+            yield reader.line_num, row, None
+        return
+
+    for line, text in enumerate(file, start=1):
+        if not text.strip():
+            continue
+        try:
+            row = json.loads(text)
+        except ValueError:
+            yield line, None, "Invalid JSON."
+            continue
+        if not isinstance(row, dict):
+            yield line, None, "Expected a JSON object."
+            continue
+        yield line, row, None
+
+
+def _name_key(value):
+    """
+    Returns the lowercased name used for matching categories, or None if the value is not a name.
+    """
+    if not isinstance(value, str) or not value.strip():
+        return None
+    return value.strip().lower()
+
+
+class CategoryImporter:
+    """
+    Imports categories from the file of a `CategoryImport`, creating new categories and updating descriptions
+    and parents of existing categories with the same names (ignoring case). Rows with a blank `parent_name`
+    are imported as top level categories, rows without it keep the parents of existing categories.
+
+    The file is read once to find the parents of the rows and order the rows by their depth in the imported
+    tree, keeping only the names of the rows in memory. It is then read once for every depth and the rows are
+    upserted in chunks of `batch_size` rows, so parents are always written before their children. New
+    categories are inserted with `Category.objects.bulk_create_tree`, which uses COPY on PostgreSQL. Every
+    chunk is written in its own transaction together with the progress of the import and its rejected rows,
+    so an import interrupted by a crash can be run again and skips the rows that were already written.
+
+    Parameters:
+    - category_import (CategoryImport): The import to run.
+    - open_file (callable): Returns the imported file opened in text mode, it is called for every read.
+    - batch_size (int): The number of rows written in a single transaction.
+    - progress (callable): Optional function called with the import after every written chunk.
+    """
+
+    def __init__(self, category_import, open_file, batch_size=None, progress=None):
+        self.category_import = category_import
+        self.open_file = open_file
+        self.batch_size = batch_size or settings.CATEGORY_BULK_BATCH_SIZE
+        self.progress = progress
+
+    def run(self):
+        imports = CategoryImport.objects.filter(pk=self.category_import.pk)
+        imports.update(status="in_progress", error="")
+        try:
+            levels = self._order_rows()
+            self._import_rows(levels)
+        except Exception as error:
+            imports.update(status="failed", error=str(error))
+            raise
+        imports.update(status="completed", completed_at=timezone.now())
+        self.category_import.refresh_from_db()
+        return self.category_import
+
+    def _read_rows(self):
+        with self.open_file() as file:
+            yield from enumerate(iter_import_rows(file, self.category_import.format))
+
+    def _order_rows(self):
+        """
+        Returns the level of every row in the imported tree, rows whose parent is not in the file are on
+        the top level. Rows that can not be imported because of the structure of the file are kept in
+        `self.rejected` together with their errors.
+        """
+
+        self.rejected = {}
+        rows_by_name = {}
+        parent_names = []
+        for index, (_, row, error) in self._read_rows():
+            parent_names.append(None)
+            if error is not None:
+                self.rejected[index] = {"non_field_errors": [error]}
+                continue
+            name = _name_key(row.get("name"))
+            if name is None:
+                # Left to the validation of the row.
+                continue
+            if name in rows_by_name:
+                self.rejected[index] = {
+                    "name": ["Category appears more than once in the file."]
+                }
+                continue
+            rows_by_name[name] = index
+            parent_names[index] = _name_key(row.get("parent_name"))
+
+        parents = array(
+            "q",
+            (rows_by_name.get(name, EXTERNAL) for name in parent_names),
+        )
+        del rows_by_name, parent_names
+
+        levels = array("q", [UNVISITED]) * len(parents)
+        for start in range(len(parents)):
+            walk = []
+            i = start
+            while i != EXTERNAL and levels[i] == UNVISITED:
+                levels[i] = VISITING
+                walk.append(i)
+                i = parents[i]
+
+            if i != EXTERNAL and levels[i] in (VISITING, BROKEN):
+                for j in walk[walk.index(i) :] if levels[i] == VISITING else ():
+                    self.rejected[j] = {
+                        "parent_name": [
+                            "This change would create a circular relationship."
+                        ]
+                    }
+                for j in walk:
+                    levels[j] = BROKEN
+                    self.rejected.setdefault(
+                        j, {"parent_name": ["The parent category was not imported."]}
+                    )
+                continue
+
+            level = levels[i] if i != EXTERNAL else -1
+            for j in reversed(walk):
+                level += 1
+                levels[j] = level
+
+        for i in self.rejected:
+            levels[i] = 0
+        if self.category_import.total_count is None:
+            CategoryImport.objects.filter(pk=self.category_import.pk).update(
+                total_count=len(levels)
+            )
+            self.category_import.total_count = len(levels)
+        return levels
+
+    def _import_rows(self, levels):
+        """
+        Upserts the rows level by level in chunks, skipping the rows written by an interrupted run.
+        """
+        skipped = self.category_import.processed_count
+        position = 0
+        for level in range(max(levels, default=-1) + 1):
+            chunk = []
+            for index, (line, row, _) in self._read_rows():
+                if levels[index] != level:
+                    continue
+                position += 1
+                if position <= skipped:
+                    continue
+                chunk.append((index, line, row))
+                if len(chunk) == self.batch_size:
+                    self._import_chunk(chunk)
+                    chunk = []
+            if chunk:
+                self._import_chunk(chunk)
+
+    def _import_chunk(self, chunk):
+        """
+        Validates the rows of a chunk, looks up all existing categories they refer to with a single query
+        and writes them in a single transaction together with the progress of the import.
+        """
+
+        rejects = []
+        rows = []
+        for index, line, row in chunk:
+            name = str(row.get("name") or "")[:255] if row else ""
+            if index in self.rejected:
+                errors = self.rejected[index]
+            else:
+                serializer = CategoryImportRowSerializer(data=row)
+                if serializer.is_valid():
+                    rows.append((line, name, serializer.validated_data))
+                    continue
+                errors = serializer.errors
+            rejects.append(self._reject(line, name, errors))
+
+        names = set()
+        for _, _, data in rows:
+            names.add(data["name"].lower())
+            if data.get("parent_name"):
+                names.add(data["parent_name"].lower())
+        existing = {}
+        slugs = set()
+        for category in (
+            Category.objects.annotate(lower_name=Lower("name"))
+            .filter(
+                Q(lower_name__in=names)
+                | Q(slug__in=[slugify(data["name"]) for _, _, data in rows])
+            )
+            .only(
+                "id",
+                "name",
+                "slug",
+                "description",
+                "parent_id",
+                "path",
+                "depth",
+                "is_pending_deletion",
+            )
+        ):
+            existing[category.lower_name] = category
+            slugs.add(category.slug)
+
+        created = []
+        updated = []
+        moves = []
+        for line, name, data in rows:
+            parent = None
+            if data.get("parent_name"):
+                parent = existing.get(data["parent_name"].lower())
+                if parent is None or parent.is_pending_deletion:
+                    rejects.append(
+                        self._reject(
+                            line,
+                            name,
+                            {
+                                "parent_name": [
+                                    f'Category with name "{data["parent_name"]}" does not exist.'
+                                ]
+                            },
+                        )
+                    )
+                    continue
+
+            category = existing.get(data["name"].lower())
+            if category is None:
+                try:
+                    check_depth(parent.depth + 1 if parent is not None else 0)
+                except ValueError as error:
+                    rejects.append(
+                        self._reject(line, name, {"parent_name": [str(error)]})
+                    )
+                    continue
+                slug = slugify(data["name"])
+                if slug in slugs:
+                    rejects.append(
+                        self._reject(
+                            line,
+                            name,
+                            {"name": ["category with this slug already exists."]},
+                        )
+                    )
+                    continue
+                slugs.add(slug)
+                created.append(
+                    Category(
+                        name=data["name"],
+                        description=data.get("description"),
+                        parent=parent,
+                    )
+                )
+            elif category.is_pending_deletion:
+                rejects.append(
+                    self._reject(
+                        line, name, {"name": ["The category is being deleted."]}
+                    )
+                )
+            else:
+                if (
+                    "description" in data
+                    and data["description"] != category.description
+                ):
+                    category.description = data["description"]
+                    updated.append(category)
+                if (
+                    "parent_name" in data
+                    and getattr(parent, "pk", None) != category.parent_id
+                ):
+                    moves.append((line, name, category, parent))
+
+        with transaction.atomic():
+            # New categories are inserted first, so later moves rewrite their paths along with their parents.
+            Category.objects.bulk_create_tree(
+                created, batch_size=self.batch_size, copy=True
+            )
+            if updated:
+                updated_at = timezone.now()
+                for category in updated:
+                    category.updated_at = updated_at
+                Category.objects.bulk_update(updated, ["description", "updated_at"])
+
+            moved = set()
+            for line, name, category, parent in moves:
+                try:
+                    category.move_to(parent)
+                    moved.add(category.pk)
+                except ValueError as error:
+                    rejects.append(
+                        self._reject(line, name, {"parent_name": [str(error)]})
+                    )
+
+            CategoryImportReject.objects.bulk_create(rejects)
+            CategoryImport.objects.filter(pk=self.category_import.pk).update(
+                processed_count=F("processed_count") + len(chunk),
+                created_count=F("created_count") + len(created),
+                updated_count=F("updated_count")
+                + len(moved.union(category.pk for category in updated)),
+                rejected_count=F("rejected_count") + len(rejects),
+            )
+
+        if self.progress is not None:
+            self.category_import.refresh_from_db()
+            self.progress(self.category_import)
+
+    def _reject(self, line, name, errors):
+        return CategoryImportReject(
+            category_import=self.category_import, line=line, name=name, errors=errors
+        )
@@ -0,0 +1,224 @@
+from array import array
+from bisect import bisect_left
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils import timezone
+from django.utils.text import slugify
+from inventory.cache import invalidate_categories
+from inventory.models import PATH_SEPARATOR, Category, CategorySlugHistory
+
+# Values of the parent index for categories without a parent and with a parent that does not exist.
+ROOT = -1
+DANGLING = -2
+
+# States of the categories while walking up their parents.
+UNVISITED, VISITING, VALID, BROKEN = range(4)
+
+
+class Command(BaseCommand):
+    help = (
+        "Checks the category tree for cycles, dangling parents, wrong materialized paths "
+        "and slugs that do not match names, and optionally repairs them."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--repair",
+            action="store_true",
+            help="Repairs the found problems instead of only reporting them.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="The number of categories read and updated at once.",
+        )
+
+    def handle(self, *args, **options):
+        self.batch_size = options["batch_size"]
+        repair = options["repair"]
+        categories = Category.objects.order_by("pk")
+
+        # Only ids and parent ids of all categories are kept in memory, as compact int arrays ordered by id.
+        self.ids = array("q")
+        parents = array("q")
+        slug_mismatches = []
+        for pk, parent_id, name, slug in categories.values_list(
+            "pk", "parent_id", "name", "slug"
+        ).iterator(chunk_size=self.batch_size):
+            self.ids.append(pk)
+            parents.append(parent_id or 0)
+            # Slugs taken by another category get the id appended when they are repaired.
+            if slug not in (slugify(name), f"{slugify(name)}-{pk}"):
+                slug_mismatches.append(pk)
+
+        self.parent_index = array(
+            "q",
+            (self._index(parent_id) if parent_id else ROOT for parent_id in parents),
+        )
+        dangling = [
+            self.ids[i]
+            for i, index in enumerate(self.parent_index)
+            if index == DANGLING
+        ]
+        cycles = self._walk_parents()
+
+        self.stdout.write(f"Found {len(dangling)} categories with dangling parents.")
+        self.stdout.write(f"Found {len(cycles)} cycles of categories.")
+        self.stdout.write(
+            f"Found {len(slug_mismatches)} categories with slugs not matching names."
+        )
+
+        if repair:
+            # Dangling parents and one category of every cycle are moved to the top level.
+            detached = dangling + [min(cycle) for cycle in cycles]
+            for start in range(0, len(detached), self.batch_size):
+                Category.objects.filter(
+                    pk__in=detached[start : start + self.batch_size]
+                ).update(parent=None, updated_at=timezone.now())
+            for pk in detached:
+                self.parent_index[self._index(pk)] = ROOT
+            self._walk_parents()
+
+        wrong_paths = self._check_paths(categories, repair)
+        self.stdout.write(f"Found {wrong_paths} categories with wrong paths.")
+
+        problems = len(dangling) + len(cycles) + len(slug_mismatches) + wrong_paths
+        if not problems:
+            self.stdout.write(self.style.SUCCESS("Category tree is consistent."))
+            return
+        if not repair:
+            raise CommandError(
+                f"Found {problems} problems, run the command with --repair to fix them."
+            )
+
+        self._repair_slugs(slug_mismatches)
+        invalidate_categories()
+        # Counts are derived from the paths, so they are recomputed after the tree was repaired.
+        call_command(
+            "recompute_category_counts",
+            batch_size=self.batch_size,
+            stdout=self.stdout,
+        )
+        self.stdout.write(self.style.SUCCESS(f"Repaired {problems} problems."))
+
+    def _index(self, pk):
+        """
+        Returns the position of the category in the id array, or DANGLING if it does not exist.
+        """
+        i = bisect_left(self.ids, pk)
+        return i if i < len(self.ids) and self.ids[i] == pk else DANGLING
+
+    def _walk_parents(self):
+        """
+        Walks up the parents of every category once and returns the cycles found.
+
+        Categories that are part of a cycle or have a cycle or a dangling parent above them are
+        marked as BROKEN, as their paths can not be determined.
+        """
+        self.states = bytearray(len(self.ids))
+        cycles = []
+        for start in range(len(self.ids)):
+            walk = []
+            i = start
+            while i >= 0 and self.states[i] == UNVISITED:
+                self.states[i] = VISITING
+                walk.append(i)
+                i = self.parent_index[i]
+
+            broken = i == DANGLING or (i >= 0 and self.states[i] == BROKEN)
+            if i >= 0 and self.states[i] == VISITING:
+                cycles.append([self.ids[j] for j in walk[walk.index(i) :]])
+                broken = True
+            for j in walk:
+                self.states[j] = BROKEN if broken else VALID
+        return cycles
+
+    def _get_path(self, i):
+        """
+        Returns the path and depth following from the parents of a category that is not BROKEN.
+
+        Paths of parents are memoized, so the parents are only walked up to the first one seen before.
+        """
+        walk = []
+        i = self.parent_index[i]
+        while i >= 0 and i not in self.child_paths:
+            walk.append(i)
+            i = self.parent_index[i]
+
+        path, depth = self.child_paths[i] if i >= 0 else ("", 0)
+        for j in reversed(walk):
+            path, depth = f"{path}{self.ids[j]}{PATH_SEPARATOR}", depth + 1
+            self.child_paths[j] = (path, depth)
+        return path, depth
+
+    def _check_paths(self, categories, repair):
+        """
+        Compares stored paths and depths with the ones following from the parents and returns the number
+        of categories that differ, updating them in batches when repairing.
+        """
+        wrong_paths = 0
+        changed = []
+        # Paths and depths of the children of categories, by the position of the category.
+        self.child_paths = {}
+        for pk, path, depth in categories.values_list("pk", "path", "depth").iterator(
+            chunk_size=self.batch_size
+        ):
+            i = self._index(pk)
+            if i == DANGLING or self.states[i] != VALID:
+                continue
+            expected_path, expected_depth = self._get_path(i)
+            if (path, depth) == (expected_path, expected_depth):
+                continue
+
+            wrong_paths += 1
+            if repair:
+                changed.append(
+                    Category(pk=pk, path=expected_path, depth=expected_depth)
+                )
+            if len(changed) >= self.batch_size:
+                self._update(changed, ["path", "depth"])
+                changed = []
+        self._update(changed, ["path", "depth"])
+        return wrong_paths
+
+    def _repair_slugs(self, slug_mismatches):
+        """
+        Regenerates slugs from the names, appending the id when the slug is already taken. Replaced
+        slugs are kept in the slug history, so their URLs are redirected, and unchanged slugs are skipped.
+        """
+        pks = sorted(slug_mismatches)
+        for start in range(0, len(pks), self.batch_size):
+            with transaction.atomic():
+                batch = list(
+                    Category.objects.filter(pk__in=pks[start : start + self.batch_size])
+                )
+                slugs = {category.pk: slugify(category.name) for category in batch}
+                owners = dict(
+                    Category.objects.filter(slug__in=slugs.values()).values_list(
+                        "slug", "pk"
+                    )
+                )
+                taken = set()
+                old_slugs = {}
+                for category in batch:
+                    slug = slugs[category.pk]
+                    if slug in taken or owners.get(slug, category.pk) != category.pk:
+                        slug = f"{slug}-{category.pk}"
+                    taken.add(slug)
+                    if slug != category.slug:
+                        old_slugs[category.slug] = category
+                        category.slug = slug
+                self._update(list(old_slugs.values()), ["slug"])
+                CategorySlugHistory.record(old_slugs)
+
+    def _update(self, categories, fields):
+        if not categories:
+            return
+        updated_at = timezone.now()
+        for category in categories:
+            category.updated_at = updated_at
+        Category.objects.bulk_update(
+            categories, [*fields, "updated_at"], batch_size=len(categories)
+        )
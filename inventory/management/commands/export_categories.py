@@ -0,0 +1,66 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from inventory.export import EXPORT_FORMATS, gzip_stream, iter_category_export
+
+
+class Command(BaseCommand):
+    help = (
+        "Streams all active categories ordered by id as NDJSON or CSV, optionally gzip-compressed, "
+        "to a file or to the standard output."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--format",
+            choices=list(EXPORT_FORMATS),
+            default="ndjson",
+            help="The format of the exported categories.",
+        )
+        parser.add_argument(
+            "--output",
+            help="The file the categories are written to, the standard output is used if it is not given.",
+        )
+        parser.add_argument(
+            "--gzip",
+            action="store_true",
+            help="Compresses the output with gzip, requires --output.",
+        )
+        parser.add_argument(
+            "--after",
+            type=int,
+            help="Resumes an interrupted export after the category with this id, appending to the output file.",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=settings.CATEGORY_EXPORT_CHUNK_SIZE,
+            help="The number of categories read and written at once.",
+        )
+
+    def handle(self, *args, **options):
+        output = options["output"]
+        compress = options["gzip"]
+        if compress and output is None:
+            raise CommandError(
+                "Compressed export has to be written to a file, use --output."
+            )
+
+        chunks = iter_category_export(
+            options["format"], after=options["after"], chunk_size=options["chunk_size"]
+        )
+        if output is None:
+            for chunk in chunks:
+                self.stdout.write(chunk, ending="")
+            return
+
+        # Resumed exports are appended, gzip streams written one after another form a valid gzip file.
+        mode = "a" if options["after"] is not None else "w"
+        if compress:
+            with open(output, f"{mode}b") as file:
+                for data in gzip_stream(chunks):
+                    file.write(data)
+        else:
+            with open(output, mode, newline="", encoding="utf-8") as file:
+                for chunk in chunks:
+                    file.write(chunk)
+        self.stdout.write(self.style.SUCCESS(f"Exported categories to {output}."))
@@ -0,0 +1,93 @@
+import os
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from inventory.imports import CategoryImporter
+from inventory.models import CategoryImport
+
+
+class Command(BaseCommand):
+    help = (
+        "Imports categories from a NDJSON or CSV file in chunked transactions, creating new categories "
+        "and updating existing ones with the same names."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("file", nargs="?", help="The imported file.")
+        parser.add_argument(
+            "--format",
+            choices=[value for value, _ in CategoryImport.FORMAT_CHOICES],
+            help="The format of the file, detected from its extension when not given.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=settings.CATEGORY_BULK_BATCH_SIZE,
+            help="The number of rows written in a single transaction.",
+        )
+        parser.add_argument(
+            "--resume",
+            type=int,
+            metavar="ID",
+            help="Resumes an interrupted import with this id, skipping the rows that were already written.",
+        )
+
+    def handle(self, *args, **options):
+        if options["resume"] is not None:
+            category_import = CategoryImport.objects.filter(
+                pk=options["resume"]
+            ).first()
+            if category_import is None:
+                raise CommandError(f"Import {options['resume']} does not exist.")
+            if category_import.status == "completed":
+                raise CommandError(f"Import {category_import.pk} is already completed.")
+        elif options["file"] is not None:
+            path = os.path.abspath(options["file"])
+            if not os.path.isfile(path):
+                raise CommandError(f"File {options['file']} does not exist.")
+            import_format = options["format"] or (
+                "csv" if path.lower().endswith(".csv") else "ndjson"
+            )
+            category_import = CategoryImport.objects.create(
+                source=path, format=import_format
+            )
+        else:
+            raise CommandError("Provide the imported file or --resume.")
+
+        if category_import.file:
+            open_file = category_import.open_file
+        else:
+            # Imports started from the command keep the path of the file as their source.
+            def open_file():
+                return open(category_import.source, newline="", encoding="utf-8-sig")
+
+        importer = CategoryImporter(
+            category_import,
+            open_file,
+            batch_size=options["batch_size"],
+            progress=self._write_progress,
+        )
+        try:
+            category_import = importer.run()
+        except Exception as error:
+            raise CommandError(
+                f"Import {category_import.pk} failed: {error}. "
+                f"Run the command with --resume {category_import.pk} to continue it."
+            ) from error
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Imported {category_import.processed_count} rows: "
+                f"{category_import.created_count} created, "
+                f"{category_import.updated_count} updated, "
+                f"{category_import.rejected_count} rejected."
+            )
+        )
+        for reject in category_import.rejects.all()[
+            : settings.CATEGORY_IMPORT_MAX_SHOWN_REJECTS
+        ]:
+            self.stdout.write(f"Line {reject.line}: {reject.errors}")
+
+    def _write_progress(self, category_import):
+        self.stdout.write(
+            f"Processed {category_import.processed_count} of {category_import.total_count} rows."
+        )
@@ -0,0 +1,73 @@
+from collections import Counter
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from inventory.cache import invalidate_categories
+from inventory.models import Category, split_path
+
+
+class Command(BaseCommand):
+    help = (
+        "Recomputes child_count and descendant_count of all categories from their "
+        "materialized paths and updates the categories whose counts drifted."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="The number of categories read and updated at once.",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        categories = Category.objects.active().order_by()
+
+        # First pass counts children and descendants of every category using only the paths.
+        child_counts = Counter()
+        descendant_counts = Counter()
+        for parent_id, path in categories.values_list("parent_id", "path").iterator(
+            chunk_size=batch_size
+        ):
+            child_counts[parent_id] += 1
+            descendant_counts.update(split_path(path))
+
+        # Second pass compares them with stored counts and writes only those that differ.
+        updated_at = timezone.now()
+        updated_count = 0
+        changed = []
+        for pk, child_count, descendant_count in categories.values_list(
+            "pk", "child_count", "descendant_count"
+        ).iterator(chunk_size=batch_size):
+            if (child_count, descendant_count) != (
+                child_counts[pk],
+                descendant_counts[pk],
+            ):
+                changed.append(
+                    Category(
+                        pk=pk,
+                        child_count=child_counts[pk],
+                        descendant_count=descendant_counts[pk],
+                        updated_at=updated_at,
+                    )
+                )
+            if len(changed) >= batch_size:
+                updated_count += self._update(changed)
+                changed = []
+        updated_count += self._update(changed)
+
+        if updated_count:
+            invalidate_categories()
+        self.stdout.write(
+            self.style.SUCCESS(f"Updated counts of {updated_count} categories.")
+        )
+
+    def _update(self, categories):
+        if not categories:
+            return 0
+        Category.objects.bulk_update(
+            categories,
+            ["child_count", "descendant_count", "updated_at"],
+            batch_size=len(categories),
+        )
+        return len(categories)
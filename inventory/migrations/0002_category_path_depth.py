@@ -0,0 +1,47 @@
+# Generated by Django 4.2.9 on 2026-10-17 04:30
+
+from django.db import migrations, models
+
+
+def populate_category_paths(apps, schema_editor):
+    """
+    Computes path and depth of existing categories by walking the tree from the roots in memory.
+    """
+    Category = apps.get_model("inventory", "Category")
+    children = {}
+    for pk, parent_id in Category.objects.values_list("pk", "parent_id").iterator():
+        children.setdefault(parent_id, []).append(pk)
+
+    updated = []
+    stack = [(pk, "", 0) for pk in children.get(None, [])]
+    while stack:
+        pk, path, depth = stack.pop()
+        updated.append(Category(pk=pk, path=path, depth=depth))
+        stack.extend(
+            (child_pk, f"{path}{pk}/", depth + 1) for child_pk in children.get(pk, [])
+        )
+
+    Category.objects.bulk_update(updated, ["path", "depth"], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("inventory", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="category",
+            name="depth",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="category",
+            name="path",
+            field=models.CharField(
+                blank=True, db_index=True, default="", editable=False, max_length=1024
+            ),
+        ),
+        migrations.RunPython(populate_category_paths, migrations.RunPython.noop),
+    ]
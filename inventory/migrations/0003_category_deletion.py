@@ -0,0 +1,51 @@
+# Generated by Django 4.2.9 on 2026-10-17 04:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("inventory", "0002_category_path_depth"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="CategoryDeletion",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("category_id", models.BigIntegerField()),
+                ("name", models.CharField(max_length=128)),
+                ("subtree_path", models.CharField(max_length=1024)),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("pending", "Pending"),
+                            ("in_progress", "In progress"),
+                            ("completed", "Completed"),
+                        ],
+                        default="pending",
+                        max_length=16,
+                    ),
+                ),
+                ("total_count", models.PositiveIntegerField(default=0)),
+                ("deleted_count", models.PositiveIntegerField(default=0)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("completed_at", models.DateTimeField(blank=True, null=True)),
+            ],
+        ),
+        migrations.AddField(
+            model_name="category",
+            name="is_pending_deletion",
+            field=models.BooleanField(db_index=True, default=False, editable=False),
+        ),
+    ]
@@ -0,0 +1,52 @@
+# Generated by Django 4.2.9 on 2026-10-17 04:39
+
+from collections import Counter
+from django.db import migrations, models
+
+
+def populate_category_counts(apps, schema_editor):
+    """
+    Counts children and descendants of existing categories from their materialized paths.
+    """
+    Category = apps.get_model("inventory", "Category")
+    child_counts = Counter()
+    descendant_counts = Counter()
+    for parent_id, path in Category.objects.filter(
+        is_pending_deletion=False
+    ).values_list("parent_id", "path"):
+        child_counts[parent_id] += 1
+        descendant_counts.update(int(pk) for pk in path.split("/") if pk)
+
+    Category.objects.bulk_update(
+        [
+            Category(
+                pk=pk,
+                child_count=child_counts[pk],
+                descendant_count=descendant_counts[pk],
+            )
+            for pk in descendant_counts
+        ],
+        ["child_count", "descendant_count"],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("inventory", "0003_category_deletion"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="category",
+            name="child_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="category",
+            name="descendant_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(populate_category_counts, migrations.RunPython.noop),
+    ]
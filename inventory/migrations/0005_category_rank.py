@@ -0,0 +1,41 @@
+# Generated by Django 4.2.9 on 2026-10-17 04:41
+
+from django.db import migrations, models
+
+
+def populate_category_ranks(apps, schema_editor):
+    """
+    Ranks existing categories among their siblings by name, leaving gaps of 2**20 between them.
+    """
+    Category = apps.get_model("inventory", "Category")
+    positions = {}
+    ranked = []
+    for pk, parent_id in Category.objects.order_by(
+        "parent_id", "name", "pk"
+    ).values_list("pk", "parent_id"):
+        positions[parent_id] = positions.get(parent_id, 0) + 1
+        ranked.append(Category(pk=pk, rank=positions[parent_id] * 2**20))
+
+    Category.objects.bulk_update(ranked, ["rank"], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("inventory", "0004_category_counts"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="category",
+            name="rank",
+            field=models.BigIntegerField(default=0, editable=False),
+        ),
+        migrations.AddIndex(
+            model_name="category",
+            index=models.Index(
+                fields=["parent", "rank"], name="inventory_c_parent__6ee7f6_idx"
+            ),
+        ),
+        migrations.RunPython(populate_category_ranks, migrations.RunPython.noop),
+    ]
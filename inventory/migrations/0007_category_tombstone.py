@@ -0,0 +1,41 @@
+# Generated by Django 4.2.9 on 2026-10-17 04:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("inventory", "0006_category_updated_at"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="CategoryTombstone",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("category_id", models.BigIntegerField()),
+                ("deleted_at", models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+        migrations.AddIndex(
+            model_name="category",
+            index=models.Index(
+                fields=["updated_at", "id"], name="inventory_c_updated_71905d_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="categorytombstone",
+            index=models.Index(
+                fields=["deleted_at", "id"], name="inventory_c_deleted_6f3c9d_idx"
+            ),
+        ),
+    ]
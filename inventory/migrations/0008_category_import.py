@@ -0,0 +1,87 @@
+# Generated by Django 4.2.9 on 2026-10-17 05:15
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("inventory", "0007_category_tombstone"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="CategoryImport",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("file", models.FileField(blank=True, upload_to="category_imports/")),
+                ("source", models.CharField(max_length=255)),
+                (
+                    "format",
+                    models.CharField(
+                        choices=[("ndjson", "NDJSON"), ("csv", "CSV")],
+                        default="ndjson",
+                        max_length=8,
+                    ),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("pending", "Pending"),
+                            ("in_progress", "In progress"),
+                            ("completed", "Completed"),
+                            ("failed", "Failed"),
+                        ],
+                        default="pending",
+                        max_length=16,
+                    ),
+                ),
+                ("total_count", models.PositiveIntegerField(blank=True, null=True)),
+                ("processed_count", models.PositiveIntegerField(default=0)),
+                ("created_count", models.PositiveIntegerField(default=0)),
+                ("updated_count", models.PositiveIntegerField(default=0)),
+                ("rejected_count", models.PositiveIntegerField(default=0)),
+                ("error", models.TextField(blank=True)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("completed_at", models.DateTimeField(blank=True, null=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name="CategoryImportReject",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("line", models.PositiveIntegerField()),
+                ("name", models.CharField(blank=True, max_length=255)),
+                ("errors", models.JSONField()),
+                (
+                    "category_import",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="rejects",
+                        to="inventory.categoryimport",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["line"],
+            },
+        ),
+    ]
@@ -0,0 +1,59 @@
+# Generated by Django 4.2.9 on 2026-10-17 05:21
+
+from django.db import migrations, models
+from django.db.models import Count, Min
+from django.db.models.functions import Lower
+from django.utils.text import slugify
+import django.db.models.functions.text
+
+
+def rename_duplicate_names(apps, schema_editor):
+    """
+    Renames categories whose name, ignoring case, is already used by a category with a lower id by
+    appending their id, so the unique constraint can be created.
+    """
+    Category = apps.get_model("inventory", "Category")
+    max_length = Category._meta.get_field("name").max_length
+    duplicate_names = (
+        Category.objects.order_by()
+        .values(lower_name=Lower("name"))
+        .annotate(count=Count("pk"), first_pk=Min("pk"))
+        .filter(count__gt=1)
+    )
+
+    renamed = []
+    for group in duplicate_names:
+        for category in (
+            Category.objects.annotate(lower_name=Lower("name"))
+            .filter(lower_name=group["lower_name"])
+            .exclude(pk=group["first_pk"])
+        ):
+            suffix = f" {category.pk}"
+            category.name = category.name[: max_length - len(suffix)] + suffix
+            category.slug = slugify(category.name)
+            renamed.append(category)
+
+    Category.objects.bulk_update(renamed, ["name", "slug"], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("inventory", "0008_category_import"),
+    ]
+
+    operations = [
+        migrations.RunPython(rename_duplicate_names, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name="category",
+            name="name",
+            field=models.CharField(max_length=128),
+        ),
+        migrations.AddConstraint(
+            model_name="category",
+            constraint=models.UniqueConstraint(
+                django.db.models.functions.text.Lower("name"),
+                name="inventory_category_lower_name_unique",
+            ),
+        ),
+    ]
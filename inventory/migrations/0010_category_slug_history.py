@@ -0,0 +1,41 @@
+# Generated by Django 4.2.9 on 2026-10-17 05:26
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("inventory", "0009_category_lower_name_unique"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="CategorySlugHistory",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("slug", models.SlugField(unique=True)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                (
+                    "category",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="old_slugs",
+                        to="inventory.category",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name_plural": "Category slug history",
+            },
+        ),
+    ]
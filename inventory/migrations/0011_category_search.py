@@ -0,0 +1,73 @@
+# Generated by Django 4.2.9 on 2026-10-17 05:40
+
+from django.db import migrations
+
+# Weighted document of the category, it has to match `PG_SEARCH_VECTOR` in inventory/search.py.
+PG_SEARCH_VECTOR = (
+    "setweight(to_tsvector('simple', coalesce(name, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce(description, '')), 'B')"
+)
+
+PG_FORWARDS = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    f"CREATE INDEX inventory_category_search_idx ON inventory_category USING gin (({PG_SEARCH_VECTOR}))",
+    "CREATE INDEX inventory_category_name_trgm_idx ON inventory_category USING gin (name gin_trgm_ops)",
+]
+PG_BACKWARDS = [
+    "DROP INDEX inventory_category_name_trgm_idx",
+    "DROP INDEX inventory_category_search_idx",
+]
+
+# FTS5 table reading its content from the categories table, triggers keep it in sync with every write,
+# including set-based updates and raw deletes. Triggers are dropped when SQLite rebuilds the categories
+# table, so they are created again after every migration by `create_search_triggers` in inventory/search.py.
+SQLITE_FORWARDS = [
+    "CREATE VIRTUAL TABLE inventory_category_search USING fts5("
+    "name, description, content='inventory_category', content_rowid='id', "
+    "tokenize='unicode61 remove_diacritics 2')",
+    "CREATE TRIGGER inventory_category_search_insert AFTER INSERT ON inventory_category BEGIN "
+    "INSERT INTO inventory_category_search(rowid, name, description) "
+    "VALUES (new.id, new.name, new.description); END",
+    "CREATE TRIGGER inventory_category_search_delete AFTER DELETE ON inventory_category BEGIN "
+    "INSERT INTO inventory_category_search(inventory_category_search, rowid, name, description) "
+    "VALUES ('delete', old.id, old.name, old.description); END",
+    "CREATE TRIGGER inventory_category_search_update AFTER UPDATE OF name, description "
+    "ON inventory_category BEGIN "
+    "INSERT INTO inventory_category_search(inventory_category_search, rowid, name, description) "
+    "VALUES ('delete', old.id, old.name, old.description); "
+    "INSERT INTO inventory_category_search(rowid, name, description) "
+    "VALUES (new.id, new.name, new.description); END",
+    "INSERT INTO inventory_category_search(inventory_category_search) VALUES ('rebuild')",
+]
+SQLITE_BACKWARDS = [
+    "DROP TRIGGER inventory_category_search_update",
+    "DROP TRIGGER inventory_category_search_delete",
+    "DROP TRIGGER inventory_category_search_insert",
+    "DROP TABLE inventory_category_search",
+]
+
+
+def run_for_vendor(statements):
+    """
+    Returns a migration function executing the statements of the current database vendor.
+    """
+
+    def run(apps, schema_editor):
+        for sql in statements.get(schema_editor.connection.vendor, []):
+            schema_editor.execute(sql)
+
+    return run
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("inventory", "0010_category_slug_history"),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            run_for_vendor({"postgresql": PG_FORWARDS, "sqlite": SQLITE_FORWARDS}),
+            run_for_vendor({"postgresql": PG_BACKWARDS, "sqlite": SQLITE_BACKWARDS}),
+        ),
+    ]
@@ -1,5 +1,323 @@
-from django.db import models
+import io
+from collections import Counter, defaultdict
+from django.conf import settings
+from django.db import connections, models, transaction
+from django.db.models import Case, F, Max, Q, Value, When
+from django.db.models.functions import Concat, Lower, Substr
+from django.utils import timezone
 from django.utils.text import slugify
+from .cache import invalidate_categories
+
+
+# Separator between ancestor ids in the materialized path of a category.
+PATH_SEPARATOR = "/"
+
+# Gap left between ranks of neighbouring siblings, so that a category can be placed
+# between two of them by changing only its own rank.
+RANK_GAP = 2**20
+
+# The number of subtrees matched by path prefixes in a single query. Every prefix adds a term to an OR
+# of the query, which SQLite can not nest more than about 1000 levels deep.
+SUBTREE_QUERY_BATCH_SIZE = 100
+
+# Paths of the routes next to the category detail route, a category with one of these slugs could
+# not be reached by its detail URL.
+RESERVED_SLUGS = frozenset(
+    ["batch", "bulk", "changes", "deletions", "export", "imports", "tree"]
+)
+
+# Name of the unique constraint on lowercased category names, used to tell its violations apart.
+NAME_CONSTRAINT = "inventory_category_lower_name_unique"
+
+
+def split_path(path):
+    """
+    Returns the ancestor ids stored in a materialized path, ordered from the root down.
+    """
+    return [int(pk) for pk in path.split(PATH_SEPARATOR) if pk]
+
+
+def check_depth(depth):
+    """
+    Raises ValueError if a category at `depth` would be nested deeper than `CATEGORY_MAX_DEPTH`.
+    """
+    if depth > settings.CATEGORY_MAX_DEPTH:
+        raise ValueError(
+            f"Categories can not be nested more than {settings.CATEGORY_MAX_DEPTH} levels deep."
+        )
+
+
+def batched(values, batch_size):
+    """
+    Splits a list into consecutive batches of `batch_size` values, or returns it whole if `batch_size` is None.
+    """
+    step = batch_size or len(values) or 1
+    return [values[start : start + step] for start in range(0, len(values), step)]
+
+
+def encode_copy_csv(rows):
+    """
+    Encodes rows of database values as the text read by PostgreSQL `COPY ... WITH (FORMAT csv)`.
+
+    In this format only an unquoted empty value is NULL, a quoted empty value is an empty string. So
+    None is written as an empty value, strings and other values are always quoted, and numbers and
+    booleans are written as they are.
+    """
+    lines = []
+    for row in rows:
+        values = []
+        for value in row:
+            if value is None:
+                values.append("")
+            elif isinstance(value, bool):
+                values.append("t" if value else "f")
+            elif isinstance(value, (int, float)):
+                values.append(str(value))
+            else:
+                values.append('"' + str(value).replace('"', '""') + '"')
+        lines.append(",".join(values) + "\n")
+    return "".join(lines)
+
+
+class CategoryQuerySet(models.QuerySet):
+    def active(self):
+        """
+        Excludes categories that are marked for deletion and are being deleted in the background.
+        """
+        return self.filter(is_pending_deletion=False)
+
+    def bulk_create_tree(self, categories, batch_size=None, copy=False):
+        """
+        Inserts new categories with `bulk_create`, filling in their slugs, paths, depths, ranks and
+        counts in memory instead of saving them one by one.
+
+        The parent of every category is either an existing category with its `path` and `depth` loaded,
+        or another one of the new `categories`. Categories are inserted level by level, so ids of new
+        parents are known before their children are inserted. New categories are placed after their
+        existing siblings and counts of existing ancestors are updated with set-based UPDATEs of
+        `batch_size` categories.
+
+        With `copy` set, categories are inserted through a staging table filled with COPY on PostgreSQL,
+        which is faster for large numbers of rows. Other databases always use `bulk_create`.
+
+        Returns:
+        - list: The created categories, in the given order.
+
+        Raises:
+        - ValueError: If a category would be nested deeper than `CATEGORY_MAX_DEPTH`, nothing is inserted then.
+        """
+
+        if not categories:
+            return categories
+
+        new = {id(category) for category in categories}
+        level_of = {}
+        for category in categories:
+            # Following new parents up to a category of a known level, or to an existing category.
+            chain = []
+            node = category
+            while id(node) in new and id(node) not in level_of:
+                chain.append(node)
+                node = node.parent
+            level = level_of.get(id(node), -1)
+            for node in reversed(chain):
+                level += 1
+                level_of[id(node)] = level
+        levels = [[] for _ in range(max(level_of.values()) + 1)]
+        for category in categories:
+            levels[level_of[id(category)]].append(category)
+
+        child_counts = Counter()
+        descendant_counts = Counter()
+        # Children and descendants added to the existing categories, keyed by their ids.
+        ancestor_counts = defaultdict(lambda: [0, 0])
+        for category in (c for level in reversed(levels) for c in level):
+            category.slug = slugify(category.name)
+            category.child_count = child_counts[id(category)]
+            category.descendant_count = descendant_counts[id(category)]
+            parent = category.parent
+            if parent is None:
+                continue
+            if id(parent) in new:
+                child_counts[id(parent)] += 1
+                descendant_counts[id(parent)] += 1 + category.descendant_count
+            else:
+                ancestor_counts[parent.pk][0] += 1
+                for pk in [*parent.ancestor_ids, parent.pk]:
+                    ancestor_counts[pk][1] += 1 + category.descendant_count
+
+        existing_parent_ids = list(
+            {category.parent_id for category in levels[0] if category.parent_id}
+        )
+
+        with transaction.atomic():
+            last_ranks = {}
+            if any(category.parent is None for category in categories):
+                last_ranks[None] = self.filter(parent=None).aggregate(Max("rank"))[
+                    "rank__max"
+                ]
+            for batch in batched(existing_parent_ids, batch_size):
+                last_ranks.update(
+                    self.filter(parent_id__in=batch)
+                    .order_by()
+                    .values_list("parent_id")
+                    .annotate(Max("rank"))
+                )
+
+            for level in levels:
+                for category in level:
+                    if category.parent is not None:
+                        # Assigning the parent again copies the id of a parent inserted with the previous level.
+                        category.parent = category.parent
+                    category.path, category.depth = category._get_tree_position()
+                    check_depth(category.depth)
+                    category.rank = last_ranks[category.parent_id] = (
+                        last_ranks.get(category.parent_id) or 0
+                    ) + RANK_GAP
+                if copy and connections[self.db].vendor == "postgresql":
+                    self._copy_insert(level)
+                else:
+                    self.bulk_create(level, batch_size=batch_size)
+
+            self._add_to_counts(ancestor_counts, batch_size)
+
+        for category in categories:
+            category._loaded_parent_id = category.parent_id
+            category._loaded_name = category.name
+        # bulk_create does not send post_save signals, so cached data is invalidated here.
+        invalidate_categories()
+        return categories
+
+    def _copy_insert(self, categories):
+        """
+        Inserts categories on PostgreSQL by copying them into a temporary staging table with COPY and
+        moving them to the categories table with a single INSERT ... SELECT, which returns their ids.
+        """
+        connection = connections[self.db]
+        quote_name = connection.ops.quote_name
+        table = quote_name(self.model._meta.db_table)
+        fields = [f for f in self.model._meta.concrete_fields if not f.primary_key]
+        columns = ", ".join(quote_name(field.column) for field in fields)
+
+        data = io.StringIO(
+            encode_copy_csv(
+                [
+                    field.get_db_prep_save(field.pre_save(category, True), connection)
+                    for field in fields
+                ]
+                for category in categories
+            )
+        )
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"CREATE TEMPORARY TABLE category_staging AS SELECT {columns} FROM {table} WITH NO DATA"
+            )
+            cursor.copy_expert(
+                f"COPY category_staging ({columns}) FROM STDIN WITH (FORMAT csv)", data
+            )
+            cursor.execute(
+                f"INSERT INTO {table} ({columns}) SELECT {columns} FROM category_staging "
+                f"RETURNING {quote_name('id')}, {quote_name('name')}"
+            )
+            ids = {name: pk for pk, name in cursor.fetchall()}
+            cursor.execute("DROP TABLE category_staging")
+
+        for category in categories:
+            category.pk = ids[category.name]
+            category._state.adding = False
+            category._state.db = self.db
+
+    def delete_subtrees(self, categories, batch_size=None):
+        """
+        Deletes active categories together with all of their descendants, using a single DELETE for every
+        `SUBTREE_QUERY_BATCH_SIZE` categories.
+
+        Categories must not be placed below each other. Deleted subtrees contain every child of their
+        categories, so the rows are deleted without collecting them and no signals are sent. Image files of
+        the deleted categories are removed from the storage once the transaction is committed. Counts of the
+        remaining ancestors are updated with set-based UPDATEs of `batch_size` categories and a tombstone is
+        recorded for every deleted subtree, as in `Category.delete`.
+
+        Returns:
+        - int: The number of deleted categories.
+        """
+
+        if not categories:
+            return 0
+
+        # Children and descendants removed from the remaining ancestors, keyed by their ids.
+        ancestor_counts = defaultdict(lambda: [0, 0])
+        for category in categories:
+            ancestor_ids = category.ancestor_ids
+            if ancestor_ids:
+                ancestor_counts[ancestor_ids[-1]][0] -= 1
+            for pk in ancestor_ids:
+                ancestor_counts[pk][1] -= 1 + category.descendant_count
+
+        deleted_count = 0
+        images = []
+        with transaction.atomic():
+            for batch in batched(categories, SUBTREE_QUERY_BATCH_SIZE):
+                subtrees = Q(pk__in=[category.pk for category in batch])
+                for category in batch:
+                    subtrees |= Q(path__startswith=category.subtree_path)
+
+                images += (
+                    self.model.objects.filter(subtrees)
+                    .exclude(Q(image__isnull=True) | Q(image=""))
+                    .values_list("image", flat=True)
+                )
+                # Raw deletes do not cascade, so old slugs of the deleted categories are deleted first.
+                CategorySlugHistory.objects.filter(
+                    category__in=self.model.objects.filter(subtrees)
+                )._raw_delete(self.db)
+                deleted_count += self.model.objects.filter(subtrees)._raw_delete(
+                    self.db
+                )
+
+            # Raw deletes do not send post_delete signals, which remove the image files, so they are
+            # removed here once the rows are gone for good.
+            if images:
+                storage = self.model._meta.get_field("image").storage
+                transaction.on_commit(
+                    lambda: [storage.delete(name) for name in images], using=self.db
+                )
+            self._add_to_counts(ancestor_counts, batch_size)
+            CategoryTombstone.objects.bulk_create(
+                [CategoryTombstone(category_id=category.pk) for category in categories],
+                batch_size=batch_size,
+            )
+
+        # Raw deletes do not send post_delete signals, so cached data is invalidated here.
+        invalidate_categories()
+        return deleted_count
+
+    def _add_to_counts(self, counts, batch_size=None):
+        """
+        Adds children and descendants to the counts of categories, given as `{id: [children, descendants]}`.
+        """
+        updated_at = timezone.now()
+        for batch in batched(list(counts), batch_size):
+            self.model.objects.filter(pk__in=batch).update(
+                child_count=Case(
+                    *(
+                        When(pk=pk, then=F("child_count") + counts[pk][0])
+                        for pk in batch
+                    ),
+                    default=F("child_count"),
+                    output_field=models.PositiveIntegerField(),
+                ),
+                descendant_count=Case(
+                    *(
+                        When(pk=pk, then=F("descendant_count") + counts[pk][1])
+                        for pk in batch
+                    ),
+                    default=F("descendant_count"),
+                    output_field=models.PositiveIntegerField(),
+                ),
+                updated_at=updated_at,
+            )
 
 
 class Category(models.Model):
@@ -7,17 +325,29 @@ class Category(models.Model):
     Model representing a category in the E-commerce platform.
 
     Attributes:
-        name (str): The name of the category.
+        name (str): The name of the category, unique ignoring case.
         slug (str): The URL-friendly slug generated from the name.
         description (str): Optional description of the category.
         image (str): The filename of the image representing the category.
         parent (Category): The parent category, creating a hierarchical relationship, this field is optional.
+        path (str): Materialized path made of the ids of all ancestors from the root down (e.g. "1/4/"),
+        root categories have an empty path. It is maintained automatically in `save`.
+        depth (int): The number of ancestors of the category, root categories have a depth of 0.
+        child_count (int): The number of direct subcategories of the category.
+        descendant_count (int): The number of all categories below the category in the hierarchy.
+        Both counts are maintained incrementally when categories are created, moved or deleted.
+        rank (int): Position of the category among its siblings. Ranks are spaced by `RANK_GAP`, so
+        placing a category between two siblings updates only its own row.
+        is_pending_deletion (bool): Whether the category is marked for deletion together with its subtree
+        and waits to be deleted in the background.
+        updated_at (datetime): The time of the last change of the category, set-based updates of the tree
+        set it explicitly.
     """
 
     def category_image_filename(self, filename):
         return f"category_images/{filename}"
 
-    name = models.CharField(max_length=128, unique=True)
+    name = models.CharField(max_length=128)
     slug = models.SlugField(unique=True, blank=True)
     description = models.TextField(blank=True, null=True)
     image = models.ImageField(upload_to=category_image_filename, blank=True, null=True)
@@ -28,14 +358,579 @@ class Category(models.Model):
         blank=True,
         related_name="subcategories",
     )
+    path = models.CharField(
+        max_length=1024,
+        blank=True,
+        default="",
+        editable=False,
+        db_index=True,
+    )
+    depth = models.PositiveIntegerField(default=0, editable=False)
+    child_count = models.PositiveIntegerField(default=0, editable=False)
+    descendant_count = models.PositiveIntegerField(default=0, editable=False)
+    rank = models.BigIntegerField(default=0, editable=False)
+    is_pending_deletion = models.BooleanField(
+        default=False, editable=False, db_index=True
+    )
+    updated_at = models.DateTimeField(auto_now=True)
+
+    objects = CategoryQuerySet.as_manager()
 
     class Meta:
         verbose_name_plural = "Categories"
+        indexes = [
+            models.Index(fields=["parent", "rank"]),
+            models.Index(fields=["updated_at", "id"]),
+        ]
+        constraints = [
+            models.UniqueConstraint(Lower("name"), name=NAME_CONSTRAINT),
+        ]
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remembering the persisted parent and name, so that save() can tell when the category is
+        # reparented or renamed.
+        instance._loaded_parent_id = instance.__dict__.get("parent_id", models.DEFERRED)
+        instance._loaded_name = instance.__dict__.get("name", models.DEFERRED)
+        return instance
+
+    @property
+    def subtree_path(self):
+        """
+        Path prefix shared by all descendants of the category. Children have exactly this path.
+        """
+        return f"{self.path}{self.pk}{PATH_SEPARATOR}"
+
+    @property
+    def ancestor_ids(self):
+        """
+        Ids of all ancestors of the category ordered from the root down, read from the path.
+        """
+        return split_path(self.path)
+
+    def get_ancestors(self):
+        """
+        Returns the ancestors of the category ordered from the root down, using a single query.
+        """
+        return Category.objects.filter(pk__in=self.ancestor_ids).order_by("depth")
+
+    def is_descendant_of(self, category):
+        """
+        Checks if the category is placed anywhere below `category`, reading the ancestors from the path.
+        """
+        return category.pk in self.ancestor_ids
+
+    def get_descendants(self):
+        """
+        Returns all descendants of the category using a single indexed prefix query on the path.
+        """
+        return Category.objects.filter(path__startswith=self.subtree_path)
+
+    def get_subtree_height(self):
+        """
+        Returns the number of levels of descendants below the category, 0 if it has no descendants.
+        """
+        deepest = self.get_descendants().aggregate(Max("depth"))["depth__max"]
+        return 0 if deepest is None else deepest - self.depth
+
+    def get_subtree(self):
+        """
+        Returns the category together with all of its descendants using a single query.
+        """
+        return Category.objects.filter(
+            Q(pk=self.pk) | Q(path__startswith=self.subtree_path)
+        )
+
+    def schedule_deletion(self):
+        """
+        Marks the category and its whole subtree for deletion with a single UPDATE and
+        creates a `CategoryDeletion` that tracks the progress of the background deletion.
+
+        Returns:
+        - CategoryDeletion: The record of the scheduled deletion.
+        """
+
+        with transaction.atomic():
+            total_count = (
+                self.get_subtree()
+                .active()
+                .update(is_pending_deletion=True, updated_at=timezone.now())
+            )
+            # Marked categories are no longer counted as descendants of their ancestors.
+            if total_count:
+                self._update_ancestor_counts(self.path, -total_count)
+            deletion = CategoryDeletion.objects.create(
+                category_id=self.pk,
+                name=self.name,
+                subtree_path=self.subtree_path,
+                total_count=total_count,
+            )
+            CategoryTombstone.objects.create(category_id=self.pk)
+
+        self.is_pending_deletion = True
+        # Set-based updates do not send post_save signals, so cached data is invalidated here.
+        invalidate_categories()
+        return deletion
 
     def save(self, *args, **kwargs):
-        # Generates slug automatically from the category name
-        self.slug = slugify(self.name)
-        super().save(*args, **kwargs)
+        adding = self._state.adding
+        # Generates slug automatically from the category name, only when the name changes.
+        old_slug = self.slug
+        if adding or self.name != getattr(self, "_loaded_name", models.DEFERRED):
+            self.slug = slugify(self.name)
+        renamed = not adding and bool(old_slug) and old_slug != self.slug
+        reparented = not adding and self.parent_id != getattr(
+            self, "_loaded_parent_id", models.DEFERRED
+        )
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and renamed:
+            kwargs["update_fields"] = {*update_fields, "slug"}
+        if not (adding or reparented or renamed):
+            super().save(*args, **kwargs)
+            self._loaded_name = self.name
+            return
+
+        with transaction.atomic():
+            if reparented:
+                # Reading the persisted position, the one held in memory may be stale.
+                old_path, old_depth, descendant_count = (
+                    Category.objects.filter(pk=self.pk)
+                    .values_list("path", "depth", "descendant_count")
+                    .first()
+                ) or (self.path, self.depth, self.descendant_count)
+
+            if adding or reparented:
+                self.path, self.depth = self._get_tree_position()
+                self.rank = self._get_next_rank()
+                update_fields = kwargs.get("update_fields")
+                if update_fields is not None:
+                    kwargs["update_fields"] = {*update_fields, "path", "depth", "rank"}
+            super().save(*args, **kwargs)
+
+            if renamed:
+                CategorySlugHistory.record({old_slug: self})
+            if reparented:
+                self._move_descendants(old_path, old_depth)
+                self._update_ancestor_counts(old_path, -(1 + descendant_count))
+                self._update_ancestor_counts(self.path, 1 + descendant_count)
+            elif adding:
+                self._update_ancestor_counts(self.path, 1)
+
+        self._loaded_parent_id = self.parent_id
+        self._loaded_name = self.name
+
+    def move_to(self, parent):
+        """
+        Moves the category together with its whole subtree under `parent`, or to the top level if it is None.
+
+        Moved category and all of its descendants are rewritten with two set-based UPDATEs in a single
+        transaction, regardless of the size of the subtree. Positions of both categories are re-read
+        while their rows are locked, so the circular relationship check is done against committed data.
+
+        Returns:
+        - int: The number of categories that were moved, including the category itself.
+
+        Raises:
+        - ValueError: If the move would create a circular relationship or nest the deepest descendant
+        deeper than `CATEGORY_MAX_DEPTH`.
+        """
+
+        with transaction.atomic():
+            locked_ids = [self.pk] if parent is None else [self.pk, parent.pk]
+            positions = {
+                pk: (path, depth, descendant_count)
+                for pk, path, depth, descendant_count in Category.objects.select_for_update()
+                .filter(pk__in=locked_ids)
+                .values_list("pk", "path", "depth", "descendant_count")
+            }
+            old_path, old_depth, descendant_count = positions[self.pk]
+            if parent is not None:
+                parent.path, parent.depth, _ = positions[parent.pk]
+                if parent == self or parent.is_descendant_of(self):
+                    raise ValueError(
+                        "This change would create a circular relationship."
+                    )
+                self.path, self.depth = old_path, old_depth
+                check_depth(
+                    parent.depth
+                    + 1
+                    + (self.get_subtree_height() if descendant_count else 0)
+                )
+
+            self.parent = parent
+            self.path, self.depth = self._get_tree_position()
+            self.rank = self._get_next_rank()
+            Category.objects.filter(pk=self.pk).update(
+                parent=parent,
+                path=self.path,
+                depth=self.depth,
+                rank=self.rank,
+                updated_at=timezone.now(),
+            )
+            moved_count = 1 + self._move_descendants(old_path, old_depth)
+            if old_path != self.path:
+                self._update_ancestor_counts(old_path, -(1 + descendant_count))
+                self._update_ancestor_counts(self.path, 1 + descendant_count)
+
+        self._loaded_parent_id = self.parent_id
+        # Set-based updates do not send post_save signals, so cached data is invalidated here.
+        invalidate_categories()
+        return moved_count
+
+    def reorder(self, before=None, after=None):
+        """
+        Places the category right before or right after one of its siblings.
+
+        New rank is taken from the middle of the gap between the neighbouring siblings, so only
+        the row of the category itself is updated. Siblings are renumbered only once the gap
+        between them is used up.
+
+        Parameters:
+        - before (Category): The sibling the category should be placed before.
+        - after (Category): The sibling the category should be placed after.
+        """
+
+        with transaction.atomic():
+            siblings = (
+                Category.objects.select_for_update()
+                .filter(parent_id=self.parent_id)
+                .exclude(pk=self.pk)
+            )
+            rank = self._get_rank_between(siblings, before, after)
+            if rank is None:
+                self._renumber(siblings)
+                rank = self._get_rank_between(siblings, before, after)
+
+            self.rank = rank
+            Category.objects.filter(pk=self.pk).update(
+                rank=rank, updated_at=timezone.now()
+            )
+
+        # Set-based updates do not send post_save signals, so cached data is invalidated here.
+        invalidate_categories()
+
+    @staticmethod
+    def _get_rank_between(siblings, before=None, after=None):
+        """
+        Returns a rank between `after` (or `before`) and its neighbour, None if there is no free rank left.
+        """
+        if after is not None:
+            low = siblings.values_list("rank", flat=True).get(pk=after.pk)
+            high = (
+                siblings.filter(rank__gt=low)
+                .order_by("rank")
+                .values_list("rank", flat=True)
+                .first()
+            )
+            if high is None:
+                return low + RANK_GAP
+        else:
+            high = siblings.values_list("rank", flat=True).get(pk=before.pk)
+            low = (
+                siblings.filter(rank__lt=high)
+                .order_by("-rank")
+                .values_list("rank", flat=True)
+                .first()
+            )
+            if low is None:
+                return high - RANK_GAP
+
+        return (low + high) // 2 if high - low > 1 else None
+
+    @staticmethod
+    def _renumber(siblings):
+        """
+        Spreads ranks of the siblings evenly, `RANK_GAP` apart, keeping their order.
+        """
+        updated_at = timezone.now()
+        renumbered = [
+            Category(pk=pk, rank=(i + 1) * RANK_GAP, updated_at=updated_at)
+            for i, pk in enumerate(
+                siblings.order_by("rank", "pk").values_list("pk", flat=True)
+            )
+        ]
+        Category.objects.bulk_update(
+            renumbered, ["rank", "updated_at"], batch_size=1000
+        )
+
+    def delete(self, *args, **kwargs):
+        with transaction.atomic():
+            # Categories marked for deletion were already removed from the counts of their ancestors.
+            position = (
+                Category.objects.active()
+                .filter(pk=self.pk)
+                .values_list("path", "descendant_count")
+                .first()
+            )
+            pk = self.pk
+            result = super().delete(*args, **kwargs)
+            if position is not None:
+                path, descendant_count = position
+                self._update_ancestor_counts(path, -(1 + descendant_count))
+                # Descendants are deleted together with the category, so only the category is recorded.
+                CategoryTombstone.objects.create(category_id=pk)
+        return result
+
+    @staticmethod
+    def _update_ancestor_counts(path, descendants):
+        """
+        Adds `descendants` to the descendant counts of all categories in `path` with a single UPDATE.
+        The last category in the path, the parent, also gains or loses one child, depending on whether
+        the subtree is being attached to it (positive `descendants`) or detached from it (negative).
+        """
+        ancestor_ids = split_path(path)
+        if not ancestor_ids:
+            return
+
+        return Category.objects.filter(pk__in=ancestor_ids).update(
+            descendant_count=F("descendant_count") + descendants,
+            child_count=Case(
+                When(
+                    pk=ancestor_ids[-1],
+                    then=F("child_count") + (1 if descendants > 0 else -1),
+                ),
+                default=F("child_count"),
+                output_field=models.PositiveIntegerField(),
+            ),
+            updated_at=timezone.now(),
+        )
+
+    def _get_tree_position(self):
+        """
+        Computes the path and depth of the category from its parent.
+        """
+        if self.parent_id is None:
+            return "", 0
+        return self.parent.subtree_path, self.parent.depth + 1
+
+    def _get_next_rank(self):
+        """
+        Returns the rank placing the category after all of its siblings.
+        """
+        last_rank = (
+            Category.objects.filter(parent_id=self.parent_id)
+            .exclude(pk=self.pk)
+            .aggregate(Max("rank"))["rank__max"]
+        )
+        return (last_rank or 0) + RANK_GAP
+
+    def _move_descendants(self, old_path, old_depth):
+        """
+        Rewrites the path prefix and depth of every descendant with a single UPDATE
+        after the category was moved from `old_path` to its current path.
+        """
+        old_prefix = f"{old_path}{self.pk}{PATH_SEPARATOR}"
+        if old_prefix == self.subtree_path:
+            return 0
+
+        return Category.objects.filter(path__startswith=old_prefix).update(
+            path=Concat(
+                Value(self.subtree_path),
+                Substr("path", len(old_prefix) + 1),
+                output_field=models.CharField(),
+            ),
+            depth=F("depth") + (self.depth - old_depth),
+            updated_at=timezone.now(),
+        )
 
     def __str__(self):
         return self.name
+
+
+class CategoryDeletion(models.Model):
+    """
+    Model tracking the background deletion of a category together with its subtree.
+
+    Attributes:
+        category_id (int): The id of the deleted category, the top of the deleted subtree.
+        name (str): The name of the deleted category.
+        subtree_path (str): Path prefix shared by all descendants of the deleted category when the deletion
+        was scheduled.
+        status (str): The state of the deletion, one of 'pending', 'in_progress' or 'completed'.
+        total_count (int): The number of categories marked for deletion, including the category itself.
+        deleted_count (int): The number of categories deleted so far.
+        created_at (datetime): The time the deletion was requested.
+        completed_at (datetime): The time the last category of the subtree was deleted.
+    """
+
+    STATUS_CHOICES = [
+        ("pending", "Pending"),
+        ("in_progress", "In progress"),
+        ("completed", "Completed"),
+    ]
+
+    category_id = models.BigIntegerField()
+    name = models.CharField(max_length=128)
+    subtree_path = models.CharField(max_length=1024)
+    status = models.CharField(max_length=16, choices=STATUS_CHOICES, default="pending")
+    total_count = models.PositiveIntegerField(default=0)
+    deleted_count = models.PositiveIntegerField(default=0)
+    created_at = models.DateTimeField(auto_now_add=True)
+    completed_at = models.DateTimeField(blank=True, null=True)
+
+    def get_remaining_categories(self):
+        """
+        Returns the categories of the deleted subtree that were not deleted yet.
+
+        Ancestors of the deleted category may be moved after the deletion was scheduled, which rewrites the
+        paths of the whole subtree, so the current path of the deleted category is read again. Its subtree is
+        deleted from the bottom up, so once the category itself is gone, nothing of the subtree remains.
+        """
+        path = (
+            Category.objects.filter(pk=self.category_id)
+            .values_list("path", flat=True)
+            .first()
+        )
+        if path is None:
+            return Category.objects.none()
+        subtree_path = f"{path}{self.category_id}{PATH_SEPARATOR}"
+        return Category.objects.filter(
+            Q(pk=self.category_id) | Q(path__startswith=subtree_path),
+            is_pending_deletion=True,
+        )
+
+    def __str__(self):
+        return self.name
+
+
+class CategoryTombstone(models.Model):
+    """
+    Model recording a deleted category, so that clients synchronizing categories learn about the deletion.
+
+    Categories are always deleted together with their subtrees, so only the top category of a deleted
+    subtree is recorded.
+
+    Attributes:
+        category_id (int): The id of the deleted category.
+        deleted_at (datetime): The time the category was deleted.
+    """
+
+    category_id = models.BigIntegerField()
+    deleted_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [models.Index(fields=["deleted_at", "id"])]
+
+    def __str__(self):
+        return str(self.category_id)
+
+
+class CategorySlugHistory(models.Model):
+    """
+    Model keeping previous slugs of renamed categories, so that their old URLs can be redirected.
+
+    Attributes:
+        slug (str): The previous slug. Every slug is kept only for the last category that used it.
+        category (Category): The category that used the slug.
+        created_at (datetime): The time the category stopped using the slug.
+    """
+
+    slug = models.SlugField(unique=True)
+    category = models.ForeignKey(
+        Category, on_delete=models.CASCADE, related_name="old_slugs"
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        verbose_name_plural = "Category slug history"
+
+    @classmethod
+    def record(cls, old_slugs):
+        """
+        Records previous slugs of renamed categories, given as `{old slug: category}`, with two queries.
+
+        Slugs the categories use now are removed from the history, so a category renamed back to one of
+        its previous names is not redirected away from its own slug.
+        """
+        cls.objects.filter(
+            slug__in=[category.slug for category in old_slugs.values()]
+        ).delete()
+        cls.objects.bulk_create(
+            [cls(slug=slug, category=category) for slug, category in old_slugs.items()],
+            update_conflicts=True,
+            unique_fields=["slug"],
+            update_fields=["category", "created_at"],
+        )
+
+    def __str__(self):
+        return self.slug
+
+
+class CategoryImport(models.Model):
+    """
+    Model tracking the import of categories from a NDJSON or CSV file.
+
+    Attributes:
+        file (File): The uploaded file, imports started from the command read the file from its path instead.
+        source (str): The name of the imported file.
+        format (str): The format of the file, one of 'ndjson' or 'csv'.
+        status (str): The state of the import, one of 'pending', 'in_progress', 'completed' or 'failed'.
+        total_count (int): The number of rows in the file, known once the file was read for the first time.
+        processed_count (int): The number of rows written so far, in the order they are imported in.
+        created_count (int): The number of created categories.
+        updated_count (int): The number of existing categories that were updated.
+        rejected_count (int): The number of rejected rows, the reasons are stored in `CategoryImportReject`.
+        error (str): The error that stopped a failed import.
+        created_at (datetime): The time the import was requested.
+        completed_at (datetime): The time the last row of the file was imported.
+    """
+
+    FORMAT_CHOICES = [("ndjson", "NDJSON"), ("csv", "CSV")]
+    STATUS_CHOICES = [
+        ("pending", "Pending"),
+        ("in_progress", "In progress"),
+        ("completed", "Completed"),
+        ("failed", "Failed"),
+    ]
+
+    file = models.FileField(upload_to="category_imports/", blank=True)
+    source = models.CharField(max_length=255)
+    format = models.CharField(max_length=8, choices=FORMAT_CHOICES, default="ndjson")
+    status = models.CharField(max_length=16, choices=STATUS_CHOICES, default="pending")
+    total_count = models.PositiveIntegerField(blank=True, null=True)
+    processed_count = models.PositiveIntegerField(default=0)
+    created_count = models.PositiveIntegerField(default=0)
+    updated_count = models.PositiveIntegerField(default=0)
+    rejected_count = models.PositiveIntegerField(default=0)
+    error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    completed_at = models.DateTimeField(blank=True, null=True)
+
+    def open_file(self):
+        """
+        Opens the uploaded file for reading as text.
+        """
+        return io.TextIOWrapper(
+            self.file.storage.open(self.file.name, "rb"),
+            encoding="utf-8-sig",
+            newline="",
+        )
+
+    def __str__(self):
+        return self.source
+
+
+class CategoryImportReject(models.Model):
+    """
+    Model recording a row of an imported file that was not imported.
+
+    Attributes:
+        category_import (CategoryImport): The import the row belongs to.
+        line (int): The line of the row in the file, starting from 1.
+        name (str): The name of the category in the row, if it could be read.
+        errors (dict): Error messages keyed by the fields of the row.
+    """
+
+    category_import = models.ForeignKey(
+        CategoryImport, on_delete=models.CASCADE, related_name="rejects"
+    )
+    line = models.PositiveIntegerField()
+    name = models.CharField(max_length=255, blank=True)
+    errors = models.JSONField()
+
+    class Meta:
+        ordering = ["line"]
+
+    def __str__(self):
+        return f"{self.category_import} (line {self.line})"
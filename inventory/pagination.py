@@ -0,0 +1,144 @@
+from bisect import bisect_left, bisect_right
+from django.conf import settings
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import Cursor, CursorPagination
+
+
+def category_position(category):
+    """
+    Returns the key categories are ordered by, top level categories first and siblings by their rank.
+    """
+    return (category.parent_id or 0, category.rank, category.pk)
+
+
+class CategoryPagination(CursorPagination):
+    """
+    Base of the category paginators, pages link to the next and the previous page by opaque cursors.
+    """
+
+    page_size = settings.CATEGORY_PAGE_SIZE
+    page_size_query_param = "page_size"
+    max_page_size = settings.CATEGORY_MAX_PAGE_SIZE
+
+    def get_paginated_response_schema(self, schema):
+        # Links have example values, so that examples of listed items are shown as whole pages.
+        return {
+            "type": "object",
+            "properties": {
+                "next": {
+                    "type": "string",
+                    "format": "uri",
+                    "nullable": True,
+                    "example": "http://api.example.org/inventory/categories/?cursor=cD0wJTJDMjA5NzE1MiUyQzI%3D",
+                },
+                "previous": {
+                    "type": "string",
+                    "format": "uri",
+                    "nullable": True,
+                    "example": None,
+                },
+                "results": schema,
+            },
+        }
+
+
+class CategoryCursorPagination(CategoryPagination):
+    """
+    Keyset pagination over categories of the category snapshot, which are already ordered by
+    `category_position`.
+
+    Cursor holds the position of the last category of the page (or the first one when going back),
+    so the page is found with a binary search and deep pages are as cheap as the first one.
+    Categories added or removed between requests never make a page skip or repeat others.
+    """
+
+    def paginate_queryset(self, categories, request, view=None):
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        self.page_size = self.get_page_size(request)
+        self.cursor = self.decode_cursor(request)
+
+        position = None
+        if self.cursor is not None and self.cursor.position is not None:
+            try:
+                position = tuple(int(part) for part in self.cursor.position.split(","))
+            except ValueError:
+                raise NotFound(self.invalid_cursor_message)
+            if len(position) != 3:
+                raise NotFound(self.invalid_cursor_message)
+
+        if self.cursor is not None and self.cursor.reverse:
+            # Previous pages always start before a category, so reverse cursors need a position.
+            if position is None:
+                raise NotFound(self.invalid_cursor_message)
+            end = bisect_left(categories, position, key=category_position)
+            start = max(end - self.page_size, 0)
+        else:
+            start = 0
+            if position is not None:
+                start = bisect_right(categories, position, key=category_position)
+            end = start + self.page_size
+
+        self.page = list(categories[start:end])
+        self.has_previous = start > 0 and bool(self.page)
+        self.has_next = end < len(categories) and bool(self.page)
+        if self.has_next or self.has_previous:
+            self.display_page_controls = True
+        return self.page
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        return self._encode_position(self.page[-1], reverse=False)
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        return self._encode_position(self.page[0], reverse=True)
+
+    def _encode_position(self, category, reverse):
+        position = ",".join(map(str, category_position(category)))
+        return self.encode_cursor(Cursor(offset=0, reverse=reverse, position=position))
+
+
+class CategorySearchPagination(CategoryPagination):
+    """
+    Pagination of ranked search results, the cursor holds the offset of the page in the results.
+
+    Results are ranked by the database for every request, so pages are fetched with LIMIT and OFFSET
+    and one extra result tells whether there is a next page. Offsets are capped at `offset_cutoff`,
+    deeper pages are not linked.
+    """
+
+    def paginate_queryset(self, search, request, view=None):
+        """
+        Returns a page of results of `search`, a callable taking the offset and the number of results.
+        """
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        self.page_size = self.get_page_size(request)
+        self.cursor = self.decode_cursor(request)
+        self.offset = self.cursor.offset if self.cursor is not None else 0
+
+        results = search(self.offset, self.page_size + 1)
+        self.page = results[: self.page_size]
+        self.has_previous = self.offset > 0 and bool(self.page)
+        self.has_next = (
+            len(results) > self.page_size
+            and self.offset + self.page_size <= self.offset_cutoff
+        )
+        if self.has_next or self.has_previous:
+            self.display_page_controls = True
+        return self.page
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        offset = self.offset + self.page_size
+        return self.encode_cursor(Cursor(offset=offset, reverse=False, position=None))
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        offset = max(self.offset - self.page_size, 0)
+        return self.encode_cursor(Cursor(offset=offset, reverse=False, position=None))
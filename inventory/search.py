@@ -0,0 +1,142 @@
+import re
+from django.db import connection, connections, transaction
+from django.db.models import Q
+from .models import Category
+
+# Words of the search query, other characters are ignored, so queries never contain search operators.
+WORD = re.compile(r"\w+")
+
+# Document searched on PostgreSQL, names weigh more than descriptions. It has to match the expression
+# of the GIN index created by the 0011_category_search migration, otherwise the index is not used.
+PG_SEARCH_VECTOR = (
+    "setweight(to_tsvector('simple', coalesce(name, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce(description, '')), 'B')"
+)
+
+# Weights of the name and description columns of the FTS5 table used on SQLite.
+SQLITE_BM25_WEIGHTS = (10.0, 1.0)
+
+# Triggers keeping the FTS5 table used on SQLite in sync with every write to the categories table, by
+# name. They match the ones created by the 0011_category_search migration.
+SQLITE_SEARCH_TRIGGERS = {
+    "inventory_category_search_insert": (
+        "CREATE TRIGGER IF NOT EXISTS inventory_category_search_insert AFTER INSERT "
+        "ON inventory_category BEGIN "
+        "INSERT INTO inventory_category_search(rowid, name, description) "
+        "VALUES (new.id, new.name, new.description); END"
+    ),
+    "inventory_category_search_delete": (
+        "CREATE TRIGGER IF NOT EXISTS inventory_category_search_delete AFTER DELETE "
+        "ON inventory_category BEGIN "
+        "INSERT INTO inventory_category_search(inventory_category_search, rowid, name, description) "
+        "VALUES ('delete', old.id, old.name, old.description); END"
+    ),
+    "inventory_category_search_update": (
+        "CREATE TRIGGER IF NOT EXISTS inventory_category_search_update "
+        "AFTER UPDATE OF name, description ON inventory_category BEGIN "
+        "INSERT INTO inventory_category_search(inventory_category_search, rowid, name, description) "
+        "VALUES ('delete', old.id, old.name, old.description); "
+        "INSERT INTO inventory_category_search(rowid, name, description) "
+        "VALUES (new.id, new.name, new.description); END"
+    ),
+}
+
+
+def get_search_words(query):
+    """
+    Returns the lowercased words of a search query.
+    """
+    return WORD.findall(query.lower())
+
+
+def search_categories(query, offset=0, limit=100):
+    """
+    Returns ids of up to `limit` active categories matching the search query, best matches first.
+
+    Every word of the query has to match a word of the name or description of the category, the last
+    word also matches as a prefix, so results follow the query as it is typed. Matches are found and
+    ranked by the full-text index of the database:
+    - PostgreSQL: GIN index over the weighted `tsvector` of name and description, combined with the
+    trigram index of names, which also finds names with typos. Matches are ranked by `ts_rank` plus the
+    trigram similarity of the name.
+    - SQLite: FTS5 table of names and descriptions kept in sync by triggers, ranked by `bm25`.
+    Other databases fall back to case-insensitive containment of the whole query, ordered by id.
+
+    Parameters:
+    - query (str): The search query.
+    - offset (int): The number of best matches to skip.
+    - limit (int): The maximum number of returned ids.
+
+    Returns:
+    - list: Ids of the matching categories.
+    """
+
+    words = get_search_words(query)
+    if not words:
+        return []
+
+    table = connection.ops.quote_name(Category._meta.db_table)
+    if connection.vendor == "postgresql":
+        tsquery = " & ".join(words) + ":*"
+        sql = (
+            f"SELECT id FROM {table}, to_tsquery('simple', %s) query "
+            f"WHERE NOT is_pending_deletion AND (({PG_SEARCH_VECTOR}) @@ query OR name %% %s) "
+            f"ORDER BY ts_rank({PG_SEARCH_VECTOR}, query) + similarity(name, %s) DESC, id "
+            f"LIMIT %s OFFSET %s"
+        )
+        params = [tsquery, query, query, limit, offset]
+    elif connection.vendor == "sqlite":
+        match = " ".join(f'"{word}"' for word in words) + "*"
+        weights = ", ".join(map(str, SQLITE_BM25_WEIGHTS))
+        sql = (
+            f"SELECT c.id FROM inventory_category_search s JOIN {table} c ON c.id = s.rowid "
+            f"WHERE inventory_category_search MATCH %s AND NOT c.is_pending_deletion "
+            f"ORDER BY bm25(inventory_category_search, {weights}), c.id "
+            f"LIMIT %s OFFSET %s"
+        )
+        params = [match, limit, offset]
+    else:
+        return list(
+            Category.objects.active()
+            .filter(Q(name__icontains=query) | Q(description__icontains=query))
+            .order_by("id")
+            .values_list("id", flat=True)[offset : offset + limit]
+        )
+
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        return [pk for (pk,) in cursor.fetchall()]
+
+
+def create_search_triggers(using="default"):
+    """
+    Creates the missing triggers of the FTS5 table used on SQLite and rebuilds the table if any was missing.
+
+    SQLite drops the triggers whenever a migration rebuilds the categories table, and writes made without
+    them are missing from the table, so this runs after every migration. Nothing is done on other databases
+    or before the 0011_category_search migration was applied.
+
+    Parameters:
+    - using (str): The alias of the database.
+    """
+
+    connection = connections[using]
+    if connection.vendor != "sqlite":
+        return
+
+    with transaction.atomic(using=using), connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT name FROM sqlite_master WHERE name IN (%s, %s, %s, %s)",
+            ["inventory_category_search", *SQLITE_SEARCH_TRIGGERS],
+        )
+        existing = {name for (name,) in cursor.fetchall()}
+        if "inventory_category_search" not in existing:
+            return
+        missing = [name for name in SQLITE_SEARCH_TRIGGERS if name not in existing]
+        if not missing:
+            return
+        for name in missing:
+            cursor.execute(SQLITE_SEARCH_TRIGGERS[name])
+        cursor.execute(
+            "INSERT INTO inventory_category_search(inventory_category_search) VALUES ('rebuild')"
+        )
@@ -1,7 +1,412 @@
 import re
+from django.conf import settings
 from django.core.exceptions import ValidationError
+from django.db import IntegrityError, transaction
+from django.db.models import Q
+from django.db.models.functions import Lower
+from django.utils import timezone
+from django.utils.text import slugify
+from drf_spectacular.utils import extend_schema_field
 from rest_framework import serializers
-from .models import Category
+from .models import (
+    NAME_CONSTRAINT,
+    RESERVED_SLUGS,
+    Category,
+    CategoryDeletion,
+    CategoryImport,
+    CategoryImportReject,
+    CategorySlugHistory,
+    batched,
+    check_depth,
+)
+from .cache import invalidate_categories
+from .export import EXPORT_FORMATS
+from .search import get_search_words
+from .utils import decode_change_token, find_circular_moves
+
+
+# Characters that category names can not contain.
+SPECIAL_CHARACTERS = re.compile(r'[!@#$%^&*(),.?":{}|<>]')
+
+# States of the rows while walking up the parents referenced within a payload.
+UNVISITED, VISITING, VALID, CIRCULAR = range(4)
+
+
+def check_reserved_name(value):
+    """
+    Rejects category names whose slug is reserved by another route of the category API.
+    """
+    if slugify(value) in RESERVED_SLUGS:
+        raise serializers.ValidationError(
+            f'Category name "{value}" is reserved, please choose another one.'
+        )
+
+
+class CategoryListSerializer(serializers.ListSerializer):
+    """
+    List serializer creating or partially updating many categories at once.
+
+    Rows are first validated one by one without queries. Names and slugs of all rows are then checked
+    with a single query and parents of all rows with another one (per `CATEGORY_BULK_BATCH_SIZE` rows).
+
+    Created categories are inserted with `bulk_create`. A row can use a category created by another row
+    of the same payload as its parent by passing its name in `parent_name`, which also accepts names of
+    existing categories.
+
+    To update categories, the serializer is given the queryset of categories that can be updated. Every
+    row identifies its category by `id`, all categories are loaded with a single query and new parents of
+    all rows are checked for circular relationships together. Changed fields are written with `bulk_update`
+    and parent changes are applied as subtree moves, all in a single transaction.
+
+    Rows that would nest a category deeper than `CATEGORY_MAX_DEPTH` are rejected. Depths of new rows are
+    checked with the other rows, moves are checked while they are applied and reject the whole update.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Rows are matched to their categories by the list serializer, not by the child serializer.
+        self.child.instance = None
+
+    def to_internal_value(self, data):
+        rows = super().to_internal_value(data)
+        self.errors_by_row = [{} for _ in rows]
+        if self.instance is not None:
+            self._load_categories(rows)
+
+        # Rows keyed by their lowercased names and slugs, later duplicates are rejected.
+        rows_by_name = {}
+        rows_by_slug = {}
+        for i, row in enumerate(rows):
+            if "name" not in row:
+                continue
+            name, slug = row["name"].lower(), slugify(row["name"])
+            if name in rows_by_name:
+                self._add_error(i, "name", "category with this name already exists.")
+            elif slug in rows_by_slug:
+                self._add_error(i, "name", "category with this slug already exists.")
+            else:
+                rows_by_name[name] = rows_by_slug[slug] = i
+
+        self._check_existing_names(rows, rows_by_name, rows_by_slug)
+        parent_indexes = self._resolve_parents(rows, rows_by_name)
+        if self.instance is None:
+            self._check_circular_parents(parent_indexes)
+            self._check_depths(rows, parent_indexes)
+        else:
+            self._check_circular_moves(rows)
+
+        if any(self.errors_by_row):
+            raise serializers.ValidationError(self.errors_by_row)
+        return rows
+
+    def save(self, **kwargs):
+        """
+        Saves the categories, reporting the rows whose names were taken by a concurrent write after
+        they were checked, which is detected by the unique constraint on names.
+        """
+        try:
+            with transaction.atomic():
+                return super().save(**kwargs)
+        except IntegrityError as e:
+            if NAME_CONSTRAINT not in str(e):
+                raise
+            taken = dict(
+                Category.objects.annotate(lower_name=Lower("name"))
+                .filter(
+                    lower_name__in=[
+                        row["name"].lower()
+                        for row in self.validated_data
+                        if "name" in row
+                    ]
+                )
+                .values_list("lower_name", "pk")
+            )
+            errors = []
+            for row in self.validated_data:
+                pk = taken.get(row.get("name", "").lower())
+                if pk is not None and pk != row.get("id"):
+                    errors.append({"name": ["category with this name already exists."]})
+                else:
+                    errors.append({})
+            raise serializers.ValidationError(errors) from e
+
+    def create(self, validated_data):
+        categories = []
+        for row in validated_data:
+            fields = {key: value for key, value in row.items() if key != "parent_index"}
+            categories.append(Category(**fields))
+        for category, row in zip(categories, validated_data):
+            if "parent_index" in row:
+                category.parent = categories[row["parent_index"]]
+
+        return Category.objects.bulk_create_tree(
+            categories, batch_size=settings.CATEGORY_BULK_BATCH_SIZE
+        )
+
+    def update(self, instance, validated_data):
+        categories = [self.categories[row["id"]] for row in validated_data]
+        fields = set()
+        moves = []
+        old_slugs = {}
+        for category, row in zip(categories, validated_data):
+            for field, value in row.items():
+                if field == "parent":
+                    if getattr(value, "pk", None) != category.parent_id:
+                        moves.append((category, value))
+                elif field != "id":
+                    setattr(category, field, value)
+                    fields.add(field)
+            if "name" in row:
+                old_slug = category.slug
+                category.slug = slugify(category.name)
+                if category.slug != old_slug:
+                    old_slugs[old_slug] = category
+                fields.add("slug")
+
+        with transaction.atomic():
+            if fields:
+                updated_at = timezone.now()
+                for category in categories:
+                    category.updated_at = updated_at
+                Category.objects.bulk_update(
+                    categories,
+                    [*fields, "updated_at"],
+                    batch_size=settings.CATEGORY_BULK_BATCH_SIZE,
+                )
+            if old_slugs:
+                CategorySlugHistory.record(old_slugs)
+            # Moved categories are detached first, so that the moves can be applied in any order
+            # without forming a cycle in between.
+            for category, _ in moves:
+                if category.parent_id is not None:
+                    category.move_to(None)
+            for category, parent in moves:
+                try:
+                    category.move_to(parent)
+                except ValueError as e:
+                    # The whole update is rolled back, the error is reported on the row of the category.
+                    raise serializers.ValidationError(
+                        [
+                            {"parent": [str(e)]} if row["id"] == category.pk else {}
+                            for row in validated_data
+                        ]
+                    ) from e
+
+        invalidate_categories()
+        if moves:
+            # Moves change counts of other categories, so the updated categories are read again.
+            self.categories = self._get_categories(self.categories)
+            categories = [self.categories[row["id"]] for row in validated_data]
+        return categories
+
+    def _add_error(self, i, field, message):
+        self.errors_by_row[i].setdefault(field, []).append(message)
+
+    def _load_categories(self, rows):
+        """
+        Loads the updated categories of all rows, rejecting rows without an id or with an id used twice.
+        """
+        ids = set()
+        for i, row in enumerate(rows):
+            if row.get("id") is None:
+                self._add_error(i, "id", "This field is required.")
+            elif row["id"] in ids:
+                self._add_error(
+                    i, "id", "This category is already updated by another item."
+                )
+            else:
+                ids.add(row["id"])
+
+        self.categories = self._get_categories(ids)
+        for i, row in enumerate(rows):
+            if row.get("id") is not None and row["id"] not in self.categories:
+                self._add_error(
+                    i, "id", f'Invalid pk "{row["id"]}" - object does not exist.'
+                )
+
+    def _get_categories(self, ids):
+        """
+        Returns the categories that can be updated with the given ids, keyed by their ids.
+        """
+        categories = {}
+        for batch in batched(list(ids), settings.CATEGORY_BULK_BATCH_SIZE):
+            categories.update(self.instance.in_bulk(batch))
+        return categories
+
+    def _check_existing_names(self, rows, rows_by_name, rows_by_slug):
+        """
+        Rejects rows whose name (ignoring case) or slug is already used by another existing category.
+        """
+        batch_size = settings.CATEGORY_BULK_BATCH_SIZE
+        for names, slugs in zip(
+            batched(list(rows_by_name), batch_size),
+            batched(list(rows_by_slug), batch_size),
+        ):
+            existing = (
+                Category.objects.annotate(lower_name=Lower("name"))
+                .filter(Q(lower_name__in=names) | Q(slug__in=slugs))
+                .values_list("pk", "lower_name", "slug")
+            )
+            for pk, name, slug in existing:
+                i = rows_by_name.get(name)
+                if i is not None and rows[i].get("id") != pk:
+                    self._add_error(
+                        i, "name", "category with this name already exists."
+                    )
+                j = rows_by_slug.get(slug)
+                if j is not None and j != i and rows[j].get("id") != pk:
+                    self._add_error(
+                        j, "name", "category with this slug already exists."
+                    )
+
+    def _resolve_parents(self, rows, rows_by_name):
+        """
+        Replaces `parent` ids and `parent_name`s of the rows with the parent categories, loading all
+        existing parents at once. Rows of the payload used as parents are stored as `parent_index`.
+
+        Returns:
+        - dict: Indexes of the parent rows keyed by the indexes of their children.
+        """
+
+        parent_ids = set()
+        parent_names = set()
+        for i, row in enumerate(rows):
+            if "parent_name" in row and row.get("parent_id") is not None:
+                self._add_error(
+                    i, "parent_name", "Only one of parent and parent_name can be given."
+                )
+            elif "parent_name" in row:
+                if row["parent_name"].lower() not in rows_by_name:
+                    parent_names.add(row["parent_name"].lower())
+            elif row.get("parent_id") is not None:
+                if row["parent_id"] == row.get("id"):
+                    self._add_error(i, "parent", "A category cannot be its own parent.")
+                parent_ids.add(row["parent_id"])
+
+        parents_by_id = {}
+        parents_by_name = {}
+        parent_ids, parent_names = list(parent_ids), list(parent_names)
+        batch_size = settings.CATEGORY_BULK_BATCH_SIZE
+        for start in range(0, max(len(parent_ids), len(parent_names)), batch_size):
+            parents = (
+                Category.objects.active()
+                .annotate(lower_name=Lower("name"))
+                .filter(
+                    Q(pk__in=parent_ids[start : start + batch_size])
+                    | Q(lower_name__in=parent_names[start : start + batch_size])
+                )
+                .only("id", "name", "path", "depth")
+            )
+            for parent in parents:
+                parents_by_id[parent.pk] = parents_by_name[parent.lower_name] = parent
+
+        parent_indexes = {}
+        for i, row in enumerate(rows):
+            has_parent = "parent_id" in row
+            parent_id = row.pop("parent_id", None)
+            parent_name = row.pop("parent_name", None)
+            if parent_name is not None and parent_id is None:
+                key = parent_name.lower()
+                if key in rows_by_name:
+                    parent_indexes[i] = row["parent_index"] = rows_by_name[key]
+                elif key in parents_by_name:
+                    row["parent"] = parents_by_name[key]
+                else:
+                    self._add_error(
+                        i,
+                        "parent_name",
+                        f'Category with name "{parent_name}" does not exist.',
+                    )
+            elif parent_id is not None:
+                if parent_id in parents_by_id:
+                    row["parent"] = parents_by_id[parent_id]
+                else:
+                    self._add_error(
+                        i,
+                        "parent",
+                        f'Invalid pk "{parent_id}" - object does not exist.',
+                    )
+            elif has_parent:
+                row["parent"] = None
+        return parent_indexes
+
+    def _check_circular_parents(self, parent_indexes):
+        """
+        Walks up the parents referenced within the payload once and rejects rows that are part of a cycle.
+        """
+        states = bytearray(len(self.errors_by_row))
+        for start in parent_indexes:
+            walk = []
+            i = start
+            while i is not None and states[i] == UNVISITED:
+                states[i] = VISITING
+                walk.append(i)
+                i = parent_indexes.get(i)
+
+            circular = i is not None and states[i] in (VISITING, CIRCULAR)
+            if i is not None and states[i] == VISITING:
+                for j in walk[walk.index(i) :]:
+                    self._add_error(
+                        j,
+                        "parent_name",
+                        "This change would create a circular relationship.",
+                    )
+            for j in walk:
+                states[j] = CIRCULAR if circular else VALID
+
+    def _check_depths(self, rows, parent_indexes):
+        """
+        Rejects new rows that would be nested deeper than `CATEGORY_MAX_DEPTH`, computing the depth of every
+        row once from the depth of its parent row or of its existing parent.
+        """
+        depths = {}
+        for start in range(len(rows)):
+            walk = []
+            seen = set()
+            i = start
+            while i is not None and i not in depths and i not in seen:
+                walk.append(i)
+                seen.add(i)
+                i = parent_indexes.get(i)
+
+            if i is None:
+                # The walk ended with a row whose parent is an existing category or none.
+                top = walk.pop()
+                parent = rows[top].get("parent")
+                depth = depths[top] = parent.depth + 1 if parent is not None else 0
+            else:
+                # Rows of circular relationships and the rows below them have no depth.
+                depth = depths.get(i)
+            for j in reversed(walk):
+                depth = depths[j] = None if depth is None else depth + 1
+
+        for i, depth in depths.items():
+            if depth is None:
+                continue
+            try:
+                check_depth(depth)
+            except ValueError as e:
+                field = "parent_name" if "parent_index" in rows[i] else "parent"
+                self._add_error(i, field, str(e))
+
+    def _check_circular_moves(self, rows):
+        """
+        Rejects rows whose new parent would create a circular relationship once all rows are applied.
+        """
+        moves = {
+            row["id"]: getattr(row["parent"], "pk", None)
+            for row in rows
+            if "parent" in row and row.get("id") in self.categories
+        }
+        if not moves:
+            return
+
+        circular = find_circular_moves(moves)
+        for i, row in enumerate(rows):
+            if row.get("id") in circular:
+                self._add_error(
+                    i, "parent", "This change would create a circular relationship."
+                )
 
 
 class CategorySerializer(serializers.ModelSerializer):
@@ -10,12 +415,71 @@ class CategorySerializer(serializers.ModelSerializer):
 
     This serializer includes validation logic to ensure data integrity and prevent circular relationships
     within the category hierarchy.
+
+    Parameters:
+    - fields (list): Optional names of the fields to include, other fields are neither read nor serialized.
+    - expand (list): Optional names of the related fields to inline, only `parent` can be expanded. Parent
+    is read from `category.parent`, so it should be loaded together with the categories.
     """
 
     class Meta:
         model = Category
-        fields = ["id", "name", "slug", "description", "image", "parent"]
-        read_only_fields = ["slug"]
+        fields = [
+            "id",
+            "name",
+            "slug",
+            "description",
+            "image",
+            "parent",
+            "child_count",
+            "descendant_count",
+        ]
+        read_only_fields = ["slug", "child_count", "descendant_count"]
+        # Categories that are being deleted can not be used as parents.
+        extra_kwargs = {"parent": {"queryset": Category.objects.active()}}
+        list_serializer_class = CategoryListSerializer
+
+    def __init__(self, *args, fields=None, expand=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if expand and "parent" in expand:
+            self.fields["parent"] = SubCategorySerializer(read_only=True)
+        if fields is not None:
+            for field_name in set(self.fields) - set(fields):
+                self.fields.pop(field_name)
+
+    def get_fields(self):
+        fields = super().get_fields()
+        if isinstance(self.parent, CategoryListSerializer):
+            # Names and parents of all rows are checked at once by the list serializer.
+            fields["parent"] = serializers.IntegerField(
+                source="parent_id", required=False, allow_null=True
+            )
+            if self.parent.instance is None:
+                fields["parent_name"] = serializers.CharField(
+                    write_only=True, required=False, max_length=128
+                )
+            else:
+                # Categories updated together are identified by their ids.
+                fields["id"] = serializers.IntegerField()
+        return fields
+
+    def save(self, **kwargs):
+        """
+        Saves the category, rejecting names that are already used.
+
+        Names are not checked with a query before the write, the case-insensitive unique constraint on
+        names rejects duplicates instead, which also holds for concurrent requests. The write runs in a
+        savepoint, so a violation does not break the surrounding transaction.
+        """
+        try:
+            with transaction.atomic():
+                return super().save(**kwargs)
+        except IntegrityError as e:
+            if NAME_CONSTRAINT not in str(e):
+                raise
+            raise serializers.ValidationError(
+                {"name": ["category with this name already exists."]}
+            ) from e
 
     def validate_name(self, value):
         # Checking if the category instance is being updated(for a situation where
@@ -26,15 +490,16 @@ class CategorySerializer(serializers.ModelSerializer):
                 return value
 
         # Checking if the category name contains any special characters
-        if re.search(r'[!@#$%^&*(),.?":{}|<>]', value):
+        if SPECIAL_CHARACTERS.search(value):
             raise serializers.ValidationError(
                 "Category name cannot contain special characters."
             )
 
-        # Checking if a category with similar name already exists (case-insensitive)
-        similar_category = Category.objects.filter(name__iexact=value).first()
+        check_reserved_name(value)
 
-        if similar_category:
+        # Other names are checked by the unique constraint when the category is saved, only
+        # other spellings of the current name are rejected here, as the constraint allows them.
+        if self.instance and value.lower() == self.instance.name.lower():
             raise serializers.ValidationError("category with this name already exists.")
 
         # Capitalize the first letter of every word in the category name
@@ -52,9 +517,13 @@ class CategorySerializer(serializers.ModelSerializer):
 
         This method is responsible for validating the data provided for a category before it is saved.
         It performs the following checks:
-        - Checks if the category instance is being updated with its own name and parent.
-        In this scenario, circular relationships are not checked.
-        - Checks for circular relationships in the category hierarchy.
+        - Checks if the parent of an existing category is being changed. If it is not, circular
+        relationships are not checked.
+        - Checks for circular relationships in the category hierarchy. New parent is circular if it is
+        the category itself or one of its descendants, which is read from the materialized path of the
+        new parent, so no queries are made while walking up the tree.
+        - Checks that neither the category nor any of its descendants would be nested deeper than
+        `CATEGORY_MAX_DEPTH` under the new parent.
 
         Parameters:
         - data (dict): The data to be validated.
@@ -69,23 +538,31 @@ class CategorySerializer(serializers.ModelSerializer):
         """
 
         instance = self.instance
-        name = data.get("name", instance.name if instance else None)
-        parent = data.get("parent", instance.parent if instance else None)
+        parent = data.get("parent")
 
-        # Checking if the category instance is being updated with its own name and parent.
-        # In this scenario there is no need to check for circular relationships
-        if instance and name == instance.name and parent == instance.parent:
+        # Checking if the parent of the category instance is being changed.
+        # If it is not, there is no need to check for circular relationships or the depth.
+        if parent is None or (instance is not None and parent.pk == instance.parent_id):
             return data
 
         # Checking for circular relationships
-        if parent:
-            current_parent = parent
-            while current_parent is not None:
-                if current_parent == instance:
-                    raise serializers.ValidationError(
-                        "This change would create a circular relationship."
-                    )
-                current_parent = current_parent.parent
+        if instance is not None and (
+            parent == instance or parent.is_descendant_of(instance)
+        ):
+            raise serializers.ValidationError(
+                "This change would create a circular relationship."
+            )
+
+        # Checking that the deepest category of the moved subtree stays within the maximum depth.
+        height = (
+            instance.get_subtree_height()
+            if instance is not None and instance.descendant_count
+            else 0
+        )
+        try:
+            check_depth(parent.depth + 1 + height)
+        except ValueError as e:
+            raise serializers.ValidationError(str(e)) from e
 
         return data
 
@@ -94,3 +571,354 @@ class SubCategorySerializer(serializers.ModelSerializer):
     class Meta:
         model = Category
         fields = ["id", "name", "slug", "description", "image"]
+
+
+class SubCategoryWithCountsSerializer(SubCategorySerializer):
+    class Meta(SubCategorySerializer.Meta):
+        fields = SubCategorySerializer.Meta.fields + [
+            "child_count",
+            "descendant_count",
+        ]
+
+
+class CategoryTreeQuerySerializer(serializers.Serializer):
+    """
+    Serializer for validating query parameters of the category tree endpoint.
+    """
+
+    root = serializers.SlugField(required=False)
+    max_depth = serializers.IntegerField(required=False, min_value=0)
+
+
+class CategoryFieldsQuerySerializer(serializers.Serializer):
+    """
+    Serializer for validating query parameters selecting the fields of returned categories.
+    """
+
+    fields = serializers.CharField(required=False)
+    expand = serializers.CharField(required=False)
+
+    def _split(self, value, allowed):
+        names = [name.strip() for name in value.split(",") if name.strip()]
+        unknown = sorted(set(names) - set(allowed))
+        if unknown:
+            raise serializers.ValidationError(f"Unknown fields: {', '.join(unknown)}.")
+        return names
+
+    def validate_fields(self, value):
+        return self._split(value, CategorySerializer.Meta.fields)
+
+    def validate_expand(self, value):
+        return self._split(value, ["parent"])
+
+
+class CategoryBatchQuerySerializer(CategoryFieldsQuerySerializer):
+    """
+    Serializer for validating query parameters of the batch lookup of categories.
+
+    Exactly one of `slug__in` and `id__in` has to be provided as a comma separated list. Repeated keys
+    are returned once, in the order of their first occurrence.
+    """
+
+    slug__in = serializers.CharField(required=False)
+    id__in = serializers.CharField(required=False)
+
+    def _split_keys(self, value):
+        keys = list(
+            dict.fromkeys(key.strip() for key in value.split(",") if key.strip())
+        )
+        if len(keys) > settings.CATEGORY_BATCH_MAX_SIZE:
+            raise serializers.ValidationError(
+                f"Ensure there are no more than {settings.CATEGORY_BATCH_MAX_SIZE} keys."
+            )
+        return keys
+
+    def validate_slug__in(self, value):
+        return self._split_keys(value)
+
+    def validate_id__in(self, value):
+        try:
+            return list(dict.fromkeys(int(key) for key in self._split_keys(value)))
+        except ValueError:
+            raise serializers.ValidationError("A valid integer is required.")
+
+    def validate(self, data):
+        if ("slug__in" in data) == ("id__in" in data):
+            raise serializers.ValidationError(
+                "Provide exactly one of 'slug__in' and 'id__in' parameters."
+            )
+        return data
+
+
+class CategoryBatchResponseSerializer(serializers.Serializer):
+    """
+    Serializer describing the response of the batch lookup of categories.
+    """
+
+    results = CategorySerializer(many=True)
+    missing = serializers.ListField()
+
+
+class CategoryChangesQuerySerializer(serializers.Serializer):
+    """
+    Serializer for validating query parameters of the category change feed.
+    """
+
+    since = serializers.CharField(required=False)
+    page_size = serializers.IntegerField(
+        required=False, min_value=1, max_value=settings.CATEGORY_MAX_PAGE_SIZE
+    )
+
+    def validate_since(self, value):
+        try:
+            position = decode_change_token(value)
+        except ValueError:
+            raise serializers.ValidationError("Invalid token.")
+
+        # Tombstones older than the retention period are deleted, so such changes can not be followed.
+        if position[0] < timezone.now() - settings.CATEGORY_TOMBSTONE_RETENTION:
+            raise serializers.ValidationError(
+                "The token has expired, synchronize all categories again without it."
+            )
+        return position
+
+
+class CategoryChangesResponseSerializer(serializers.Serializer):
+    """
+    Serializer describing a page of the category change feed.
+    """
+
+    updated = CategorySerializer(many=True)
+    deleted = serializers.ListField(child=serializers.IntegerField())
+    next_since = serializers.CharField(allow_null=True)
+    has_more = serializers.BooleanField()
+
+
+class SubCategoryQuerySerializer(serializers.Serializer):
+    """
+    Serializer for validating query parameters of the subcategories list endpoint.
+    """
+
+    depth = serializers.IntegerField(required=False, min_value=1)
+
+
+class CategoryMoveSerializer(serializers.Serializer):
+    """
+    Serializer for validating the new parent of a category that is being moved with its subtree.
+
+    The category being moved has to be passed in the serializer context under the `category` key.
+    """
+
+    parent = serializers.PrimaryKeyRelatedField(
+        queryset=Category.objects.active(), allow_null=True
+    )
+
+    def validate_parent(self, value):
+        category = self.context["category"]
+        if value == category:
+            raise serializers.ValidationError("A category cannot be its own parent.")
+        if value is not None and value.is_descendant_of(category):
+            raise serializers.ValidationError(
+                "This change would create a circular relationship."
+            )
+        return value
+
+
+class CategoryReorderSerializer(serializers.Serializer):
+    """
+    Serializer for validating the new position of a category among its siblings.
+
+    Exactly one of `before` and `after` has to be provided. The category being reordered has to be passed
+    in the serializer context under the `category` key.
+    """
+
+    before = serializers.PrimaryKeyRelatedField(
+        queryset=Category.objects.active(), required=False
+    )
+    after = serializers.PrimaryKeyRelatedField(
+        queryset=Category.objects.active(), required=False
+    )
+
+    def validate(self, data):
+        if len(data) != 1:
+            raise serializers.ValidationError(
+                "Provide exactly one of 'before' and 'after' fields."
+            )
+
+        category = self.context["category"]
+        field, sibling = next(iter(data.items()))
+        if sibling == category:
+            raise serializers.ValidationError(
+                {field: ["A category cannot be placed next to itself."]}
+            )
+        if sibling.parent_id != category.parent_id:
+            raise serializers.ValidationError(
+                {field: ["Categories must have the same parent."]}
+            )
+        return data
+
+
+class CategoryDeleteQuerySerializer(serializers.Serializer):
+    """
+    Serializer for validating query parameters of the category delete endpoint.
+    """
+
+    background = serializers.BooleanField(required=False, default=False)
+
+
+class CategorySearchQuerySerializer(serializers.Serializer):
+    """
+    Serializer for validating the search query of the category list endpoint.
+    """
+
+    search = serializers.CharField(required=False, max_length=128)
+
+    def validate_search(self, value):
+        if not get_search_words(value):
+            raise serializers.ValidationError(
+                "Search query must contain at least one letter or digit."
+            )
+        return value
+
+
+class CategoryExportQuerySerializer(serializers.Serializer):
+    """
+    Serializer for validating query parameters of the category export endpoint.
+
+    The format is passed as `file_format`, as `format` is used by the API to select the renderer.
+    """
+
+    file_format = serializers.ChoiceField(
+        choices=list(EXPORT_FORMATS), required=False, default="ndjson"
+    )
+    gzip = serializers.BooleanField(required=False, default=False)
+    after = serializers.IntegerField(required=False, min_value=0)
+
+
+class CategoryBulkDeleteSerializer(serializers.Serializer):
+    """
+    Serializer for validating the categories deleted by the bulk delete endpoint.
+
+    Exactly one of `slugs` and `ids` has to be provided. Repeated keys are returned once, in the order of
+    their first occurrence.
+    """
+
+    slugs = serializers.ListField(
+        child=serializers.SlugField(),
+        required=False,
+        allow_empty=False,
+        max_length=settings.CATEGORY_BULK_BATCH_SIZE,
+    )
+    ids = serializers.ListField(
+        child=serializers.IntegerField(),
+        required=False,
+        allow_empty=False,
+        max_length=settings.CATEGORY_BULK_BATCH_SIZE,
+    )
+
+    def validate_slugs(self, value):
+        return list(dict.fromkeys(value))
+
+    def validate_ids(self, value):
+        return list(dict.fromkeys(value))
+
+    def validate(self, data):
+        if ("slugs" in data) == ("ids" in data):
+            raise serializers.ValidationError(
+                "Provide exactly one of 'slugs' and 'ids' fields."
+            )
+        return data
+
+
+class CategoryDeletionSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = CategoryDeletion
+        fields = [
+            "id",
+            "category_id",
+            "name",
+            "status",
+            "total_count",
+            "deleted_count",
+            "created_at",
+            "completed_at",
+        ]
+
+
+class CategoryImportRowSerializer(serializers.Serializer):
+    """
+    Serializer for validating a row of an imported file. Existing categories are looked up by the importer
+    for all rows of a chunk at once.
+    """
+
+    name = serializers.CharField(max_length=128)
+    description = serializers.CharField(
+        required=False, allow_blank=True, allow_null=True
+    )
+    parent_name = serializers.CharField(
+        required=False, allow_blank=True, allow_null=True, max_length=128
+    )
+
+    def validate_name(self, value):
+        if SPECIAL_CHARACTERS.search(value):
+            raise serializers.ValidationError(
+                "Category name cannot contain special characters."
+            )
+        check_reserved_name(value)
+        return value.title()
+
+
+class CategoryImportRejectSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = CategoryImportReject
+        fields = ["line", "name", "errors"]
+
+
+class CategoryImportSerializer(serializers.ModelSerializer):
+    """
+    Serializer for starting an import of categories from an uploaded file and following its progress.
+
+    The format is detected from the extension of the file when it is not provided. Only the first
+    `CATEGORY_IMPORT_MAX_SHOWN_REJECTS` rejected rows are returned.
+    """
+
+    rejects = serializers.SerializerMethodField()
+
+    class Meta:
+        model = CategoryImport
+        fields = [
+            "id",
+            "file",
+            "source",
+            "format",
+            "status",
+            "total_count",
+            "processed_count",
+            "created_count",
+            "updated_count",
+            "rejected_count",
+            "rejects",
+            "error",
+            "created_at",
+            "completed_at",
+        ]
+        read_only_fields = [
+            field for field in fields if field not in ("file", "format")
+        ]
+        extra_kwargs = {
+            "file": {"write_only": True, "required": True, "allow_empty_file": False},
+            "format": {"required": False},
+        }
+
+    @extend_schema_field(CategoryImportRejectSerializer(many=True))
+    def get_rejects(self, category_import):
+        rejects = category_import.rejects.all()[
+            : settings.CATEGORY_IMPORT_MAX_SHOWN_REJECTS
+        ]
+        return CategoryImportRejectSerializer(rejects, many=True).data
+
+    def validate(self, data):
+        if "format" not in data and data["file"].name.lower().endswith(".csv"):
+            data["format"] = "csv"
+        data["source"] = data["file"].name
+        return data
@@ -0,0 +1,18 @@
+from django.db.models.signals import post_migrate, post_save, post_delete
+from django.dispatch import receiver
+from .cache import invalidate_categories
+from .models import Category
+from .search import create_search_triggers
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+def invalidate_cached_categories(sender, **kwargs):
+    invalidate_categories()
+
+
+@receiver(post_migrate)
+def recreate_search_triggers(sender, using, **kwargs):
+    # Migrations rebuilding the categories table on SQLite drop the triggers of the search table.
+    if sender.name == "inventory":
+        create_search_triggers(using)
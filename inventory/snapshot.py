@@ -0,0 +1,79 @@
+import threading
+from types import MappingProxyType
+from django.db.models import F
+from .cache import get_categories_version
+from .models import Category
+
+
+class CategorySnapshot:
+    """
+    Read-only in-memory copy of all active categories, indexed by id, slug and parent.
+
+    Attributes:
+        version (str): The categories version the snapshot was built for.
+        categories (tuple): All categories, siblings grouped together and ordered by their rank,
+        top level categories first.
+        by_id (Mapping): Categories keyed by their id.
+        by_slug (Mapping): Categories keyed by their slug.
+        children (Mapping): Ordered tuples of direct subcategories keyed by the parent id, top level
+        categories are stored under `None`.
+
+    Categories in the snapshot are shared between requests and must never be modified or saved.
+    """
+
+    def __init__(self, version, categories):
+        self.version = version
+        self.categories = tuple(categories)
+        self.by_id = MappingProxyType({c.pk: c for c in self.categories})
+        self.by_slug = MappingProxyType({c.slug: c for c in self.categories})
+
+        children = {}
+        parent_field = Category._meta.get_field("parent")
+        for category in self.categories:
+            children.setdefault(category.parent_id, []).append(category)
+            # Linking the category to its parent in the snapshot, so parents are serialized without queries.
+            parent_field.set_cached_value(category, self.by_id.get(category.parent_id))
+        self.children = MappingProxyType(
+            {parent_id: tuple(items) for parent_id, items in children.items()}
+        )
+
+    @classmethod
+    def build(cls, version):
+        """
+        Loads all active categories with a single query.
+        """
+        categories = Category.objects.active().order_by(
+            F("parent").asc(nulls_first=True), "rank", "id"
+        )
+        return cls(version, categories)
+
+    def get_children(self, category):
+        """
+        Returns direct subcategories of the category ordered by their rank.
+        """
+        return self.children.get(category.pk, ())
+
+
+_snapshot = None
+_snapshot_lock = threading.Lock()
+
+
+def get_category_snapshot():
+    """
+    Returns the category snapshot of the current worker, rebuilding it if categories changed.
+
+    Every call checks the categories version in the cache, which is changed on every write to the
+    categories table, so the snapshot is rebuilt lazily by the first request that notices the change.
+    The version is read before the categories are loaded, so a write that happens while the snapshot
+    is being built only makes the next request rebuild it again.
+    """
+
+    global _snapshot
+    version = get_categories_version()
+    snapshot = _snapshot
+    if snapshot is None or snapshot.version != version:
+        with _snapshot_lock:
+            snapshot = _snapshot
+            if snapshot is None or snapshot.version != version:
+                snapshot = _snapshot = CategorySnapshot.build(version)
+    return snapshot
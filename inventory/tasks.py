@@ -0,0 +1,69 @@
+from celery import shared_task
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+from .cache import deferred_invalidation
+from .imports import CategoryImporter
+from .models import Category, CategoryDeletion, CategoryImport, CategoryTombstone
+
+
+@shared_task
+def delete_category_subtree(deletion_id):
+    """
+    Deletes a category subtree marked for deletion from the bottom up in bounded batches.
+
+    Deepest categories are deleted first, so every batch is a small DELETE in its own transaction
+    that never has to cascade into the rest of the subtree, and cached categories are invalidated once per
+    batch rather than once per deleted category. Progress is stored on the
+    `CategoryDeletion` after every batch and the task can be run again to resume an interrupted deletion.
+    """
+
+    deletion = CategoryDeletion.objects.get(pk=deletion_id)
+    if deletion.status == "completed":
+        return
+
+    CategoryDeletion.objects.filter(pk=deletion_id).update(status="in_progress")
+
+    while True:
+        # The subtree is looked up again for every batch, as it may have been moved in the meantime.
+        batch = list(
+            deletion.get_remaining_categories()
+            .order_by("-depth")
+            .values_list("pk", flat=True)[: settings.CATEGORY_DELETE_BATCH_SIZE]
+        )
+        if not batch:
+            break
+
+        with transaction.atomic(), deferred_invalidation():
+            _, deleted_per_model = Category.objects.filter(pk__in=batch).delete()
+            CategoryDeletion.objects.filter(pk=deletion_id).update(
+                deleted_count=F("deleted_count")
+                + deleted_per_model.get(Category._meta.label, 0)
+            )
+
+    CategoryDeletion.objects.filter(pk=deletion_id).update(
+        status="completed", completed_at=timezone.now()
+    )
+
+
+@shared_task
+def delete_expired_category_tombstones():
+    expiry = timezone.now() - settings.CATEGORY_TOMBSTONE_RETENTION
+    CategoryTombstone.objects.filter(deleted_at__lt=expiry).delete()
+
+
+@shared_task
+def import_categories(import_id):
+    """
+    Imports categories from an uploaded file in chunked transactions.
+
+    Progress is stored on the `CategoryImport` after every chunk and the task can be run again to
+    resume an interrupted import.
+    """
+
+    category_import = CategoryImport.objects.get(pk=import_id)
+    if category_import.status == "completed":
+        return
+
+    CategoryImporter(category_import, category_import.open_file).run()
@@ -0,0 +1,12 @@
+from django.test import TestCase
+from inventory.models import Category
+
+
+class CategoryTreeTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        # Creating a tree like this: (root --> child --> grandchild) and (other root)
+        cls.root = Category.objects.create(name="Root")
+        cls.child = Category.objects.create(name="Child", parent=cls.root)
+        cls.grandchild = Category.objects.create(name="Grandchild", parent=cls.child)
+        cls.other_root = Category.objects.create(name="Other Root")
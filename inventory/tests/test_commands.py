@@ -0,0 +1,286 @@
+import csv
+import gzip
+import json
+import os
+import tempfile
+from io import StringIO
+from unittest.mock import patch
+from django.core.management import call_command, CommandError
+from django.test import TestCase
+from inventory.imports import CategoryImporter
+from inventory.management.commands.check_category_tree import (
+    Command as CheckCategoryTreeCommand,
+)
+from inventory.models import Category, CategoryImport, CategorySlugHistory
+from inventory.tests.base import CategoryTreeTestCase
+
+
+class RecomputeCategoryCountsCommandTestClass(CategoryTreeTestCase):
+    def test_drifted_counts_are_recomputed(self):
+        Category.objects.update(child_count=5, descendant_count=5)
+        out = StringIO()
+
+        call_command("recompute_category_counts", batch_size=2, stdout=out)
+
+        self.assertIn("Updated counts of 4 categories.", out.getvalue())
+        counts = dict(
+            Category.objects.values_list("name", "descendant_count").order_by()
+        )
+        self.assertEqual(
+            counts, {"Root": 2, "Child": 1, "Grandchild": 0, "Other Root": 0}
+        )
+        self.root.refresh_from_db()
+        self.assertEqual(self.root.child_count, 1)
+
+    def test_correct_counts_are_not_updated(self):
+        out = StringIO()
+        call_command("recompute_category_counts", stdout=out)
+        self.assertIn("Updated counts of 0 categories.", out.getvalue())
+
+
+class CheckCategoryTreeCommandTestClass(CategoryTreeTestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        super().setUpTestData()
+        # Adding (other root --> other child) to the tree.
+        cls.other_child = Category.objects.create(
+            name="Other Child", parent=cls.other_root
+        )
+
+    def test_consistent_tree(self):
+        out = StringIO()
+        call_command("check_category_tree", stdout=out)
+        self.assertIn("Category tree is consistent.", out.getvalue())
+
+    def test_problems_are_reported(self):
+        # Making a cycle (root --> child --> root), a wrong path and wrong slugs.
+        Category.objects.filter(pk=self.root.pk).update(parent=self.child)
+        Category.objects.filter(pk=self.other_child.pk).update(path="", depth=0)
+        Category.objects.filter(pk=self.other_root.pk).update(slug="other")
+        Category.objects.filter(pk=self.grandchild.pk).update(slug="wrong-slug")
+        out = StringIO()
+
+        with self.assertRaisesMessage(CommandError, "Found 4 problems"):
+            call_command("check_category_tree", batch_size=2, stdout=out)
+
+        output = out.getvalue()
+        self.assertIn("Found 1 cycles of categories.", output)
+        self.assertIn("Found 1 categories with wrong paths.", output)
+        self.assertIn("Found 2 categories with slugs not matching names.", output)
+        self.other_child.refresh_from_db()
+        self.assertEqual(self.other_child.path, "")
+
+    def test_problems_are_repaired(self):
+        Category.objects.filter(pk=self.root.pk).update(parent=self.child)
+        Category.objects.filter(pk=self.other_child.pk).update(parent_id=999_999_999)
+        Category.objects.filter(pk=self.other_root.pk).update(name="Other Parent")
+        Category.objects.filter(pk=self.grandchild.pk).update(slug="wrong-slug")
+        out = StringIO()
+
+        call_command("check_category_tree", repair=True, batch_size=2, stdout=out)
+
+        self.assertIn("Found 1 categories with dangling parents.", out.getvalue())
+        self.root.refresh_from_db()
+        self.child.refresh_from_db()
+        self.grandchild.refresh_from_db()
+        self.other_root.refresh_from_db()
+        self.other_child.refresh_from_db()
+        self.assertIsNone(self.root.parent)
+        self.assertIsNone(self.other_child.parent)
+        self.assertEqual(self.grandchild.path, f"{self.root.id}/{self.child.id}/")
+        self.assertEqual(self.grandchild.slug, "grandchild")
+        self.assertEqual(self.other_root.slug, "other-parent")
+        self.assertEqual(self.root.descendant_count, 2)
+
+        out = StringIO()
+        call_command("check_category_tree", stdout=out)
+        self.assertIn("Category tree is consistent.", out.getvalue())
+
+    def test_taken_slugs_are_looked_up_once_per_batch(self):
+        # "Root!" is slugified to the slug of root, so the id is appended to it.
+        Category.objects.filter(pk=self.other_root.pk).update(name="Root!")
+        Category.objects.filter(pk=self.child.pk).update(slug="wrong-child")
+        Category.objects.filter(pk=self.grandchild.pk).update(slug="wrong-grandchild")
+        command = CheckCategoryTreeCommand()
+        command.batch_size = 3
+
+        with self.assertNumQueries(7):
+            # Savepoint, the batch, the taken slugs, the update, two queries of the slug history
+            # and releasing the savepoint, no matter how many slugs are repaired.
+            command._repair_slugs(
+                [self.other_root.pk, self.child.pk, self.grandchild.pk]
+            )
+
+        self.assertEqual(
+            list(
+                Category.objects.filter(
+                    pk__in=[self.child.pk, self.grandchild.pk, self.other_root.pk]
+                )
+                .order_by("pk")
+                .values_list("slug", flat=True)
+            ),
+            ["child", "grandchild", f"root-{self.other_root.pk}"],
+        )
+
+    def test_repaired_slugs_with_ids_are_consistent(self):
+        # "Foo-Bar" is slugified to the slug of "Foo Bar", so the id is appended to it.
+        foo_bar = Category.objects.create(name="Foo Bar")
+        other_foo_bar = Category.objects.create(name="Other Foo Bar")
+        Category.objects.filter(pk=other_foo_bar.pk).update(name="Foo-Bar")
+
+        call_command("check_category_tree", repair=True, stdout=StringIO())
+        other_foo_bar.refresh_from_db()
+        out = StringIO()
+        call_command("check_category_tree", stdout=out)
+
+        self.assertEqual(other_foo_bar.slug, f"foo-bar-{other_foo_bar.pk}")
+        self.assertIn("Category tree is consistent.", out.getvalue())
+        self.assertEqual(
+            list(other_foo_bar.old_slugs.values_list("slug", flat=True)),
+            ["other-foo-bar"],
+        )
+
+    def test_unchanged_slugs_are_not_recorded(self):
+        command = CheckCategoryTreeCommand()
+        command.batch_size = 10
+
+        command._repair_slugs([self.root.pk, self.child.pk])
+
+        self.assertFalse(CategorySlugHistory.objects.exists())
+
+
+class ExportCategoriesCommandTestClass(TestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.root = Category.objects.create(name="Root")
+        cls.child = Category.objects.create(name="Child", parent=cls.root)
+        cls.other_root = Category.objects.create(name="Other Root")
+
+    def test_categories_are_exported_to_stdout(self):
+        out = StringIO()
+
+        call_command("export_categories", chunk_size=2, stdout=out)
+
+        rows = [json.loads(line) for line in out.getvalue().splitlines()]
+        self.assertEqual([row["name"] for row in rows], ["Root", "Child", "Other Root"])
+
+    def test_interrupted_export_is_resumed(self):
+        with tempfile.TemporaryDirectory() as directory:
+            output = os.path.join(directory, "categories.csv.gz")
+            call_command(
+                "export_categories",
+                format="csv",
+                gzip=True,
+                output=output,
+                stdout=StringIO(),
+            )
+            Category.objects.create(name="New Root")
+            call_command(
+                "export_categories",
+                format="csv",
+                gzip=True,
+                output=output,
+                after=self.other_root.id,
+                stdout=StringIO(),
+            )
+
+            with gzip.open(output, "rt") as file:
+                rows = list(csv.reader(file))
+        self.assertEqual(
+            [row[1] for row in rows],
+            ["name", "Root", "Child", "Other Root", "New Root"],
+        )
+
+    def test_compressed_export_requires_output(self):
+        with self.assertRaises(CommandError):
+            call_command("export_categories", gzip=True, stdout=StringIO())
+
+
+class ImportCategoriesCommandTestClass(TestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.root = Category.objects.create(name="Root")
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "categories.ndjson")
+
+    def write_rows(self, *lines):
+        with open(self.path, "w", encoding="utf-8") as file:
+            file.write("\n".join(lines) + "\n")
+
+    def test_categories_are_imported(self):
+        self.write_rows(
+            '{"name": "Grandchild", "parent_name": "Child"}',
+            '{"name": "Child", "parent_name": "Root"}',
+            '{"name": "child", "description": "Duplicate"}',
+            "not json",
+            '{"name": "Loop A", "parent_name": "Loop B"}',
+            '{"name": "Loop B", "parent_name": "Loop A"}',
+            '{"name": "Below Loop", "parent_name": "Loop A"}',
+        )
+        out = StringIO()
+
+        call_command("import_categories", self.path, batch_size=2, stdout=out)
+
+        self.assertIn("2 created, 0 updated, 5 rejected", out.getvalue())
+        category_import = CategoryImport.objects.get()
+        self.assertEqual(category_import.status, "completed")
+        self.assertEqual(
+            [reject.line for reject in category_import.rejects.all()], [3, 4, 5, 6, 7]
+        )
+        self.assertEqual(
+            category_import.rejects.get(line=4).errors,
+            {"non_field_errors": ["Invalid JSON."]},
+        )
+
+        grandchild = Category.objects.get(name="Grandchild")
+        child = Category.objects.get(name="Child")
+        self.root.refresh_from_db()
+        self.assertEqual(grandchild.path, f"{self.root.id}/{child.id}/")
+        self.assertEqual(self.root.descendant_count, 2)
+
+    def test_reserved_names_are_rejected(self):
+        self.write_rows('{"name": "Export"}', '{"name": "Exports"}')
+
+        call_command("import_categories", self.path, stdout=StringIO())
+
+        category_import = CategoryImport.objects.get()
+        self.assertEqual([reject.line for reject in category_import.rejects.all()], [1])
+        self.assertTrue(Category.objects.filter(name="Exports").exists())
+
+    def test_interrupted_import_is_resumed(self):
+        self.write_rows(
+            '{"name": "First", "parent_name": "Root"}',
+            '{"name": "Second", "parent_name": "First"}',
+            '{"name": "Third", "parent_name": "Second"}',
+        )
+        import_chunk = CategoryImporter._import_chunk
+        calls = []
+
+        def crash_on_second_chunk(importer, chunk):
+            calls.append(chunk)
+            if len(calls) == 2:
+                raise RuntimeError("Connection lost")
+            import_chunk(importer, chunk)
+
+        with patch.object(CategoryImporter, "_import_chunk", crash_on_second_chunk):
+            with self.assertRaisesMessage(CommandError, "--resume"):
+                call_command("import_categories", self.path, stdout=StringIO())
+
+        category_import = CategoryImport.objects.get()
+        self.assertEqual(category_import.status, "failed")
+        self.assertEqual(category_import.processed_count, 1)
+
+        call_command("import_categories", resume=category_import.id, stdout=StringIO())
+
+        category_import.refresh_from_db()
+        self.assertEqual(category_import.status, "completed")
+        self.assertEqual(category_import.processed_count, 3)
+        self.assertEqual(category_import.created_count, 3)
+        self.assertEqual(Category.objects.get(name="Third").depth, 3)
+
+    def test_import_requires_file(self):
+        with self.assertRaises(CommandError):
+            call_command("import_categories", stdout=StringIO())
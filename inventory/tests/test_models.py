@@ -1,6 +1,13 @@
 import os
-from django.test import TestCase
-from inventory.models import Category
+from django.db import IntegrityError, connection
+from django.test import TestCase, override_settings
+from inventory.models import (
+    RANK_GAP,
+    Category,
+    CategorySlugHistory,
+    encode_copy_csv,
+)
+from inventory.tests.base import CategoryTreeTestCase
 
 
 class CategoryModelTestClass(TestCase):
@@ -38,3 +45,296 @@ class CategoryModelTestClass(TestCase):
     def test_category_slug_generation(self):
         self.assertEqual(self.parent_category.slug, "parent-category")
         self.assertEqual(self.subcategory.slug, "subcategory")
+
+    def test_category_names_are_unique_ignoring_case(self):
+        with self.assertRaises(IntegrityError):
+            Category.objects.create(name="parent category")
+
+
+class CategoryTreePathTestClass(CategoryTreeTestCase):
+    def test_path_and_depth_generation(self):
+        self.assertEqual(self.root.path, "")
+        self.assertEqual(self.root.depth, 0)
+        self.assertEqual(self.child.path, f"{self.root.id}/")
+        self.assertEqual(self.child.depth, 1)
+        self.assertEqual(self.grandchild.path, f"{self.root.id}/{self.child.id}/")
+        self.assertEqual(self.grandchild.depth, 2)
+
+    def test_get_descendants_uses_single_query(self):
+        with self.assertNumQueries(1):
+            descendants = list(self.root.get_descendants())
+
+        self.assertCountEqual(descendants, [self.child, self.grandchild])
+        self.assertEqual(list(self.grandchild.get_descendants()), [])
+
+    def test_get_ancestors_uses_single_query(self):
+        with self.assertNumQueries(1):
+            ancestors = list(self.grandchild.get_ancestors())
+
+        self.assertEqual(ancestors, [self.root, self.child])
+        self.assertEqual(list(self.root.get_ancestors()), [])
+
+    def test_reparenting_updates_descendants(self):
+        child = Category.objects.get(pk=self.child.pk)
+        child.parent = self.other_root
+        child.save()
+
+        grandchild = Category.objects.get(pk=self.grandchild.pk)
+        self.assertEqual(child.path, f"{self.other_root.id}/")
+        self.assertEqual(grandchild.path, f"{self.other_root.id}/{child.id}/")
+        self.assertEqual(grandchild.depth, 2)
+        self.assertCountEqual(
+            self.other_root.get_descendants(), [self.child, self.grandchild]
+        )
+        self.assertEqual(list(self.root.get_descendants()), [])
+
+    def test_moving_category_to_root(self):
+        child = Category.objects.get(pk=self.child.pk)
+        child.parent = None
+        child.save(update_fields=["parent"])
+
+        child.refresh_from_db()
+        grandchild = Category.objects.get(pk=self.grandchild.pk)
+        self.assertEqual(child.path, "")
+        self.assertEqual(child.depth, 0)
+        self.assertEqual(grandchild.path, f"{child.id}/")
+        self.assertEqual(grandchild.depth, 1)
+
+    def test_saving_without_reparenting_keeps_path(self):
+        grandchild = Category.objects.get(pk=self.grandchild.pk)
+        grandchild.description = "Changed description"
+
+        # Only the UPDATE itself, no extra queries for the tree position.
+        with self.assertNumQueries(1):
+            grandchild.save()
+        self.assertEqual(grandchild.path, f"{self.root.id}/{self.child.id}/")
+
+    def test_get_subtree_height(self):
+        self.assertEqual(self.root.get_subtree_height(), 2)
+        self.assertEqual(self.child.get_subtree_height(), 1)
+        self.assertEqual(self.grandchild.get_subtree_height(), 0)
+
+    @override_settings(CATEGORY_MAX_DEPTH=2)
+    def test_max_depth_is_enforced(self):
+        # Moving root under other root would put grandchild at the depth of 3.
+        with self.assertRaisesMessage(ValueError, "more than 2 levels deep"):
+            self.root.move_to(self.other_root)
+        with self.assertRaisesMessage(ValueError, "more than 2 levels deep"):
+            Category.objects.bulk_create_tree(
+                [Category(name="Too Deep", parent=self.grandchild)]
+            )
+
+        self.grandchild.refresh_from_db()
+        self.assertEqual(self.grandchild.depth, 2)
+        self.assertFalse(Category.objects.filter(name="Too Deep").exists())
+        self.assertEqual(self.child.move_to(self.other_root), 2)
+
+
+class CategoryCountsTestClass(CategoryTreeTestCase):
+    def assertCounts(self, category, child_count, descendant_count):
+        category.refresh_from_db()
+        self.assertEqual(
+            (category.child_count, category.descendant_count),
+            (child_count, descendant_count),
+        )
+
+    def test_counts_on_create(self):
+        self.assertCounts(self.root, 1, 2)
+        self.assertCounts(self.child, 1, 1)
+        self.assertCounts(self.grandchild, 0, 0)
+
+        Category.objects.create(name="Second Child", parent=self.root)
+        self.assertCounts(self.root, 2, 3)
+        self.assertCounts(self.child, 1, 1)
+
+    def test_counts_on_reparent(self):
+        child = Category.objects.get(pk=self.child.pk)
+        child.parent = self.other_root
+        child.save()
+
+        self.assertCounts(self.root, 0, 0)
+        self.assertCounts(self.other_root, 1, 2)
+        self.assertCounts(self.child, 1, 1)
+
+    def test_counts_on_move(self):
+        self.grandchild.move_to(self.other_root)
+
+        self.assertCounts(self.root, 1, 1)
+        self.assertCounts(self.child, 0, 0)
+        self.assertCounts(self.other_root, 1, 1)
+
+    def test_counts_on_delete(self):
+        Category.objects.get(pk=self.grandchild.pk).delete()
+        self.assertCounts(self.root, 1, 1)
+        self.assertCounts(self.child, 0, 0)
+
+        Category.objects.get(pk=self.child.pk).delete()
+        self.assertCounts(self.root, 0, 0)
+
+    def test_counts_on_scheduled_deletion(self):
+        self.child.schedule_deletion()
+        self.assertCounts(self.root, 0, 0)
+
+        # Deleting marked category does not change the counts again.
+        Category.objects.get(pk=self.grandchild.pk).delete()
+        self.assertCounts(self.root, 0, 0)
+
+    def test_counts_on_delete_subtrees(self):
+        deleted_count = Category.objects.delete_subtrees(
+            [Category.objects.get(pk=self.child.pk), self.other_root]
+        )
+
+        self.assertEqual(deleted_count, 3)
+        self.assertEqual(list(Category.objects.all()), [self.root])
+        self.assertCounts(self.root, 0, 0)
+
+    def test_counts_on_bulk_create_tree(self):
+        parent = Category(name="Bulk Parent", parent=self.child)
+        leaf = Category(name="Bulk Leaf", parent=parent)
+        Category.objects.bulk_create_tree([leaf, parent, Category(name="Bulk Root")])
+
+        self.assertCounts(self.root, 1, 4)
+        self.assertCounts(self.child, 2, 3)
+        self.assertCounts(parent, 1, 1)
+        self.assertEqual(leaf.path, f"{self.root.pk}/{self.child.pk}/{parent.pk}/")
+        self.assertEqual((leaf.depth, leaf.slug), (3, "bulk-leaf"))
+
+
+class CategoryRankTestClass(TestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.root = Category.objects.create(name="Root")
+        cls.first = Category.objects.create(name="First", parent=cls.root)
+        cls.second = Category.objects.create(name="Second", parent=cls.root)
+        cls.third = Category.objects.create(name="Third", parent=cls.root)
+
+    def get_children(self):
+        return list(self.root.subcategories.order_by("rank", "id"))
+
+    def test_new_categories_are_appended(self):
+        self.assertEqual(self.get_children(), [self.first, self.second, self.third])
+        self.assertEqual(
+            [self.first.rank, self.second.rank, self.third.rank],
+            [RANK_GAP, 2 * RANK_GAP, 3 * RANK_GAP],
+        )
+
+    def test_moved_category_is_appended(self):
+        other_root = Category.objects.create(name="Other Root")
+        child = Category.objects.create(name="Child", parent=other_root)
+        child.move_to(self.root)
+
+        self.assertEqual(
+            self.get_children(), [self.first, self.second, self.third, child]
+        )
+
+    def test_reorder_updates_only_reordered_category(self):
+        self.third.reorder(after=self.first)
+
+        self.assertEqual(self.get_children(), [self.first, self.third, self.second])
+        self.second.refresh_from_db()
+        self.assertEqual(self.second.rank, 2 * RANK_GAP)
+
+        self.second.reorder(before=self.first)
+        self.assertEqual(self.get_children(), [self.second, self.first, self.third])
+
+    def test_reorder_renumbers_siblings_when_gap_is_used_up(self):
+        Category.objects.filter(pk=self.second.pk).update(rank=RANK_GAP + 1)
+
+        self.third.reorder(after=self.first)
+
+        self.assertEqual(self.get_children(), [self.first, self.third, self.second])
+        self.first.refresh_from_db()
+        self.second.refresh_from_db()
+        self.assertEqual(self.first.rank, RANK_GAP)
+        self.assertEqual(self.second.rank, 2 * RANK_GAP)
+
+    def test_set_based_updates_change_updated_at(self):
+        self.first.refresh_from_db()
+        updated_at = self.first.updated_at
+
+        # Adding a subcategory changes the counts of the category with a set-based update.
+        Category.objects.create(name="Nested", parent=self.first)
+        self.first.refresh_from_db()
+        self.assertGreater(self.first.updated_at, updated_at)
+
+
+class CategorySlugHistoryTestClass(TestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.category = Category.objects.create(name="Phones")
+
+    def test_renaming_records_old_slug(self):
+        self.category.name = "Mobile Phones"
+        self.category.save()
+
+        self.assertEqual(self.category.slug, "mobile-phones")
+        self.assertEqual(
+            list(self.category.old_slugs.values_list("slug", flat=True)), ["phones"]
+        )
+
+    def test_saving_without_renaming_keeps_slug(self):
+        Category.objects.filter(pk=self.category.pk).update(slug="custom-slug")
+        category = Category.objects.get(pk=self.category.pk)
+        category.description = "Updated description"
+
+        # Slug is not regenerated, so only the category itself is written.
+        with self.assertNumQueries(1):
+            category.save()
+
+        category.refresh_from_db()
+        self.assertEqual(category.slug, "custom-slug")
+        self.assertFalse(CategorySlugHistory.objects.exists())
+
+    def test_renaming_back_removes_current_slug_from_history(self):
+        self.category.name = "Mobile Phones"
+        self.category.save()
+        self.category.name = "Phones"
+        self.category.save()
+
+        self.assertEqual(self.category.slug, "phones")
+        self.assertEqual(
+            list(self.category.old_slugs.values_list("slug", flat=True)),
+            ["mobile-phones"],
+        )
+
+    def test_old_slug_is_kept_for_last_category(self):
+        self.category.name = "Mobile Phones"
+        self.category.save()
+        other = Category.objects.create(name="Phones")
+        other.name = "Smartphones"
+        other.save()
+
+        self.assertEqual(CategorySlugHistory.objects.get(slug="phones").category, other)
+
+
+class EncodeCopyCsvTestClass(TestCase):
+    def test_nulls_are_unquoted_and_strings_quoted(self):
+        rows = [
+            ["Root", None, "", 0, False],
+            ['Say "hi"', "Line\nbreak", "1/2/", 2, True],
+        ]
+
+        self.assertEqual(
+            encode_copy_csv(rows),
+            '"Root",,"",0,f\n' '"Say ""hi""","Line\nbreak","1/2/",2,t\n',
+        )
+
+    def test_category_rows_keep_nulls(self):
+        category = Category(name="Root", slug="root")
+        fields = [
+            Category._meta.get_field(name)
+            for name in ["name", "description", "image", "parent", "depth"]
+        ]
+
+        encoded = encode_copy_csv(
+            [
+                [
+                    field.get_db_prep_save(field.pre_save(category, True), connection)
+                    for field in fields
+                ]
+            ]
+        )
+
+        # Description and parent are NULL, so a top level category has no quoted empty parent id.
+        # An empty image is stored as an empty string, as when the category is saved.
+        self.assertEqual(encoded, '"Root",,"",,0\n')
@@ -0,0 +1,46 @@
+from django.core.cache import cache
+from django.test import TestCase
+from inventory.models import Category
+from inventory.snapshot import get_category_snapshot
+
+
+class CategorySnapshotTestClass(TestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        # Creating a tree like this: (root --> first, second) and (other root)
+        cls.root = Category.objects.create(name="Root")
+        cls.first = Category.objects.create(name="First", parent=cls.root)
+        cls.second = Category.objects.create(name="Second", parent=cls.root)
+        cls.other_root = Category.objects.create(name="Other Root")
+
+    def setUp(self):
+        cache.clear()
+
+    def test_snapshot_indexes(self):
+        snapshot = get_category_snapshot()
+
+        self.assertEqual(
+            snapshot.categories, (self.root, self.other_root, self.first, self.second)
+        )
+        self.assertEqual(snapshot.by_id[self.first.pk], self.first)
+        self.assertEqual(snapshot.by_slug["second"], self.second)
+        self.assertEqual(snapshot.get_children(self.root), (self.first, self.second))
+        self.assertEqual(snapshot.get_children(self.first), ())
+        self.assertEqual(snapshot.children[None], (self.root, self.other_root))
+
+    def test_snapshot_is_reused_until_categories_change(self):
+        snapshot = get_category_snapshot()
+        with self.assertNumQueries(0):
+            self.assertIs(get_category_snapshot(), snapshot)
+
+        self.second.reorder(before=self.first)
+        rebuilt = get_category_snapshot()
+        self.assertIsNot(rebuilt, snapshot)
+        self.assertEqual(rebuilt.get_children(self.root), (self.second, self.first))
+
+    def test_snapshot_excludes_categories_pending_deletion(self):
+        self.root.schedule_deletion()
+        snapshot = get_category_snapshot()
+
+        self.assertEqual(snapshot.categories, (self.other_root,))
+        self.assertNotIn("first", snapshot.by_slug)
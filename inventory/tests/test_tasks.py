@@ -0,0 +1,82 @@
+from datetime import timedelta
+from unittest.mock import patch
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from inventory.models import Category, CategoryTombstone
+from inventory.tasks import delete_category_subtree, delete_expired_category_tombstones
+
+
+@override_settings(CATEGORY_DELETE_BATCH_SIZE=2)
+class DeleteCategorySubtreeTaskTestClass(TestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        # Creating a chain like this: (root --> level 1 --> level 2 --> level 3)
+        cls.root = Category.objects.create(name="Root")
+        parent = cls.root
+        for i in range(1, 4):
+            parent = Category.objects.create(name=f"Level {i}", parent=parent)
+        cls.other_root = Category.objects.create(name="Other Root")
+
+    def test_subtree_is_deleted_in_batches(self):
+        deletion = self.root.schedule_deletion()
+
+        with self.assertNumQueries(22):
+            # Two batches of two categories, each with 7 queries in its own transaction, including
+            # the deletion of their old slugs, and the path of the root read before each of them.
+            # Deepest categories are deleted first, so deleting a batch never cascades further.
+            delete_category_subtree(deletion.id)
+
+        deletion.refresh_from_db()
+        self.assertEqual(deletion.status, "completed")
+        self.assertEqual(deletion.deleted_count, 4)
+        self.assertEqual(list(Category.objects.all()), [self.other_root])
+
+    def test_categories_are_invalidated_once_per_batch(self):
+        deletion = self.root.schedule_deletion()
+
+        with patch("inventory.cache._bump_categories_version") as bump_version:
+            with self.captureOnCommitCallbacks(execute=True):
+                delete_category_subtree(deletion.id)
+
+        # Immediately and after the commit for each of the two batches.
+        self.assertEqual(bump_version.call_count, 4)
+
+    @override_settings(CATEGORY_DELETE_BATCH_SIZE=1)
+    def test_subtree_moved_after_scheduling_is_deleted_in_batches(self):
+        deletion = self.root.schedule_deletion()
+        self.other_root.refresh_from_db()
+        Category.objects.get(pk=self.root.pk).move_to(self.other_root)
+
+        self.assertEqual(deletion.get_remaining_categories().count(), 4)
+        with self.assertNumQueries(40):
+            # Four batches of a single category, none of them cascades to the rest of the subtree.
+            delete_category_subtree(deletion.id)
+
+        deletion.refresh_from_db()
+        self.assertEqual(deletion.deleted_count, 4)
+        self.assertEqual(list(Category.objects.all()), [self.other_root])
+
+    def test_interrupted_deletion_is_resumed(self):
+        deletion = self.root.schedule_deletion()
+        Category.objects.filter(name="Level 3").delete()
+
+        delete_category_subtree(deletion.id)
+
+        deletion.refresh_from_db()
+        self.assertEqual(deletion.status, "completed")
+        self.assertEqual(deletion.deleted_count, 3)
+        self.assertFalse(deletion.get_remaining_categories().exists())
+
+
+class DeleteExpiredCategoryTombstonesTaskTestClass(TestCase):
+    @override_settings(CATEGORY_TOMBSTONE_RETENTION=timedelta(days=30))
+    def test_expired_tombstones_are_deleted(self):
+        expired = CategoryTombstone.objects.create(category_id=1)
+        CategoryTombstone.objects.filter(pk=expired.pk).update(
+            deleted_at=timezone.now() - timedelta(days=31)
+        )
+        recent = CategoryTombstone.objects.create(category_id=2)
+
+        delete_expired_category_tombstones()
+
+        self.assertEqual(list(CategoryTombstone.objects.all()), [recent])
@@ -0,0 +1,129 @@
+from datetime import datetime, timedelta, timezone
+from django.test import TestCase, override_settings
+from inventory.models import Category
+from inventory.utils import (
+    decode_change_token,
+    encode_change_token,
+    find_circular_moves,
+    get_category_changes,
+)
+
+
+class FindCircularMovesTestClass(TestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        # Creating a tree like this: (a --> b --> c) and (d --> e)
+        cls.a = Category.objects.create(name="A")
+        cls.b = Category.objects.create(name="B", parent=cls.a)
+        cls.c = Category.objects.create(name="C", parent=cls.b)
+        cls.d = Category.objects.create(name="D")
+        cls.e = Category.objects.create(name="E", parent=cls.d)
+
+    def test_valid_moves(self):
+        with self.assertNumQueries(1):
+            circular = find_circular_moves(
+                {self.b.id: self.e.id, self.d.id: None, self.c.id: self.a.id}
+            )
+        self.assertEqual(circular, set())
+
+    def test_move_under_own_descendant(self):
+        circular = find_circular_moves({self.a.id: self.c.id})
+        self.assertEqual(circular, {self.a.id})
+
+    def test_move_under_itself(self):
+        circular = find_circular_moves({self.b.id: self.b.id})
+        self.assertEqual(circular, {self.b.id})
+
+    def test_moves_creating_cycle_together(self):
+        # Each move is valid on its own, but together they make (a --> e --> d --> c --> a)
+        circular = find_circular_moves({self.a.id: self.e.id, self.d.id: self.c.id})
+        self.assertEqual(circular, {self.a.id, self.d.id})
+
+    def test_moves_fixing_each_other(self):
+        # Moving c away from b first makes it valid to put b under c.
+        circular = find_circular_moves({self.c.id: None, self.b.id: self.c.id})
+        self.assertEqual(circular, set())
+
+
+@override_settings(CATEGORY_CHANGES_SAFETY_WINDOW=timedelta(0))
+class CategoryChangesTestClass(TestCase):
+    @classmethod
+    def setUpTestData(cls) -> None:
+        # Creating a tree like this: (a --> b) and (c)
+        cls.a = Category.objects.create(name="A")
+        cls.b = Category.objects.create(name="B", parent=cls.a)
+        cls.c = Category.objects.create(name="C")
+
+    def test_all_changes_in_pages(self):
+        # Creating b has changed the counts of a, so a is changed after b.
+        updated, deleted, position, has_more = get_category_changes(limit=2)
+        self.assertEqual(updated, [self.b, self.a])
+        self.assertEqual(deleted, [])
+        self.assertTrue(has_more)
+
+        updated, deleted, position, has_more = get_category_changes(position, limit=2)
+        self.assertEqual(updated, [self.c])
+        self.assertFalse(has_more)
+
+        # Nothing changed since the last change, the position still moves forward.
+        updated, deleted, next_position, has_more = get_category_changes(position)
+        self.assertEqual((updated, deleted, has_more), ([], [], False))
+        self.assertGreater(next_position, position)
+
+    def test_changes_since_position(self):
+        _, _, position, _ = get_category_changes()
+        self.c.description = "Changed description"
+        self.c.save()
+        Category.objects.get(pk=self.a.pk).delete()
+
+        updated, deleted, _, _ = get_category_changes(position)
+
+        self.assertEqual(updated, [self.c])
+        self.assertEqual(deleted, [self.a.id])
+
+    def test_scheduled_deletion_is_reported(self):
+        _, _, position, _ = get_category_changes()
+        self.a.schedule_deletion()
+
+        updated, deleted, _, _ = get_category_changes(position)
+
+        self.assertEqual(updated, [])
+        self.assertCountEqual(deleted, [self.a.id, self.b.id, self.a.id])
+
+    @override_settings(CATEGORY_CHANGES_SAFETY_WINDOW=timedelta(minutes=1))
+    def test_position_is_held_back_by_safety_window(self):
+        # All changes are recent, so they are returned without moving the position past them.
+        updated, _, position, has_more = get_category_changes(limit=2)
+        self.assertEqual(updated, [self.b, self.a])
+        self.assertFalse(has_more)
+        self.assertLess(position[0], self.b.updated_at)
+
+        # A change of a transaction committed late is not skipped.
+        late = Category.objects.create(name="Late")
+        Category.objects.filter(pk=late.pk).update(
+            updated_at=self.b.updated_at - timedelta(seconds=1)
+        )
+        updated, _, next_position, _ = get_category_changes(position)
+        self.assertEqual(updated[0].pk, late.pk)
+        self.assertCountEqual(updated, [late, self.a, self.b, self.c])
+        self.assertGreaterEqual(next_position, position)
+
+    @override_settings(CATEGORY_CHANGES_SAFETY_WINDOW=timedelta(minutes=1))
+    def test_position_follows_horizon_without_changes(self):
+        # The position of a client polling categories that did not change for a day keeps moving forward.
+        now = datetime.now(timezone.utc)
+        Category.objects.update(updated_at=now - timedelta(days=1))
+        since = (now - timedelta(hours=12), 0, 0)
+
+        updated, deleted, position, has_more = get_category_changes(since)
+
+        self.assertEqual((updated, deleted, has_more), ([], [], False))
+        self.assertGreaterEqual(position[0], now - timedelta(minutes=1))
+
+    def test_change_token(self):
+        position = (datetime(2024, 1, 2, 3, 4, 5, 678901, timezone.utc), 1, 42)
+        self.assertEqual(decode_change_token(encode_change_token(position)), position)
+
+        for token in ["invalid", "MS4yLjM=", "YQ=="]:
+            with self.assertRaises(ValueError):
+                decode_change_token(token)
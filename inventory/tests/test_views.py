@@ -1,9 +1,35 @@
+import csv
+import gzip
+import json
+import os
+import re
+import shutil
+import tempfile
+from datetime import timedelta
 from django.contrib.auth import get_user_model
+from unittest import skipUnless
+from unittest.mock import patch
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management.sql import emit_post_migrate_signal
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
+from django.utils import timezone
 from rest_framework import status
 from rest_framework.test import APITestCase, APIClient
 from rest_framework.authtoken.models import Token
-from inventory.models import Category
+from inventory.models import (
+    RESERVED_SLUGS,
+    Category,
+    CategoryDeletion,
+    CategoryImport,
+    CategoryTombstone,
+)
+from inventory.search import SQLITE_SEARCH_TRIGGERS
+from inventory.urls import router
+from inventory.utils import encode_change_token
 
 
 User = get_user_model()
@@ -25,6 +51,17 @@ class BaseCategoryTestCase(APITestCase):
         )
 
 
+class BaseCategoryTreeTestCase(BaseCategoryTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+
+        # Creating a tree like this: (Test Category --> Child --> Grandchild) and (Other Category)
+        cls.child = Category.objects.create(name="Child", parent=cls.category)
+        cls.grandchild = Category.objects.create(name="Grandchild", parent=cls.child)
+        cls.other_category = Category.objects.create(name="Other Category")
+
+
 class CategoryListTests(APITestCase):
     @classmethod
     def setUpTestData(cls) -> None:
@@ -47,6 +84,7 @@ class CategoryListTests(APITestCase):
             )
 
     def setUp(self) -> None:
+        cache.clear()
         self.category_list_url = reverse("category-list")
         self.client = APIClient()
         self.client.credentials(HTTP_AUTHORIZATION=f"Token {self.token.key}")
@@ -54,14 +92,93 @@ class CategoryListTests(APITestCase):
     def test_list_categories(self):
         response = self.client.get(self.category_list_url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 10)
+        self.assertEqual(len(response.data["results"]), 10)
+
+    def test_list_categories_without_queries(self):
+        self.client.credentials()
+        self.client.get(self.category_list_url)
+
+        # Once the snapshot is built, categories are served from memory.
+        with self.assertNumQueries(0):
+            response = self.client.get(self.category_list_url)
+        self.assertEqual(len(response.data["results"]), 10)
+
+        Category.objects.create(name="Category 11")
+        response = self.client.get(self.category_list_url)
+        self.assertEqual(len(response.data["results"]), 11)
+
+    def test_list_categories_in_pages(self):
+        names = []
+        url = self.category_list_url
+        params = {"page_size": 3}
+        while url is not None:
+            response = self.client.get(url, params)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertLessEqual(len(response.data["results"]), 3)
+            names.extend(category["name"] for category in response.data["results"])
+            url, params = response.data["next"], None
+
+        self.assertEqual(names, [f"Category {i}" for i in range(1, 11)])
+
+        # Going back from the last page returns the previous three categories.
+        response = self.client.get(response.data["previous"])
+        self.assertEqual(
+            [category["name"] for category in response.data["results"]],
+            ["Category 7", "Category 8", "Category 9"],
+        )
+        self.assertIsNotNone(response.data["next"])
+
+    def test_pages_are_stable_when_categories_change(self):
+        response = self.client.get(self.category_list_url, {"page_size": 5})
+        Category.objects.get(name="Category 1").delete()
+        Category.objects.create(name="Category 11")
+
+        response = self.client.get(response.data["next"])
+        self.assertEqual(
+            [category["name"] for category in response.data["results"]],
+            ["Category 6", "Category 7", "Category 8", "Category 9", "Category 10"],
+        )
+
+    def test_list_categories_is_cached_until_categories_change(self):
+        self.client.credentials()
+        self.client.get(self.category_list_url, {"page_size": 5})
+
+        # Cached response is returned without building the snapshot or serializing categories.
+        with patch("inventory.views.get_category_snapshot") as get_snapshot:
+            response = self.client.get(self.category_list_url, {"page_size": 5})
+        get_snapshot.assert_not_called()
+        self.assertEqual(len(response.data["results"]), 5)
+
+        Category.objects.get(name="Category 1").delete()
+        response = self.client.get(self.category_list_url, {"page_size": 5})
+        self.assertEqual(response.data["results"][0]["name"], "Category 2")
+
+    def test_list_categories_with_fields(self):
+        response = self.client.get(self.category_list_url, {"fields": "id, name"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [set(category) for category in response.data["results"]],
+            [{"id", "name"}] * 10,
+        )
+
+    @patch("inventory.pagination.CategoryCursorPagination.max_page_size", 4)
+    def test_list_categories_with_page_size_above_maximum(self):
+        response = self.client.get(self.category_list_url, {"page_size": 100})
+        self.assertEqual(len(response.data["results"]), 4)
+
+    def test_list_categories_with_invalid_cursor(self):
+        # Malformed, with a malformed position and reverse without a position.
+        for cursor in ["invalid", "cD1h", "cj0x"]:
+            response = self.client.get(self.category_list_url, {"cursor": cursor})
+            self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
 
     def test_list_categories_with_unauthenticated_user(self):
         self.client.credentials()
         response = self.client.get(self.category_list_url)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 10)
+        self.assertEqual(len(response.data["results"]), 10)
 
     def test_list_categories_without_permissions(self):
         # Setting is_staff field to false, thus removing necessary permissions
@@ -71,7 +188,7 @@ class CategoryListTests(APITestCase):
 
         response = self.client.get(self.category_list_url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 10)
+        self.assertEqual(len(response.data["results"]), 10)
 
 
 class SubCategoryListTests(BaseCategoryTestCase):
@@ -87,6 +204,7 @@ class SubCategoryListTests(BaseCategoryTestCase):
             )
 
     def setUp(self):
+        cache.clear()
         self.subcategories_list_url = reverse(
             "category-subcategories-list", kwargs={"slug": self.category.slug}
         )
@@ -97,14 +215,14 @@ class SubCategoryListTests(BaseCategoryTestCase):
         response = self.client.get(self.subcategories_list_url)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 10)
+        self.assertEqual(len(response.data["results"]), 10)
 
     def test_list_subcategories_with_unauthenticated_user(self):
         self.client.credentials()
         response = self.client.get(self.subcategories_list_url)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 10)
+        self.assertEqual(len(response.data["results"]), 10)
 
     def test_list_subcategories_without_permissions(self):
         self.user.is_staff = False
@@ -112,7 +230,21 @@ class SubCategoryListTests(BaseCategoryTestCase):
 
         response = self.client.get(self.subcategories_list_url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(len(response.data), 10)
+        self.assertEqual(len(response.data["results"]), 10)
+
+    def test_list_subcategories_in_pages(self):
+        response = self.client.get(self.subcategories_list_url, {"page_size": 4})
+        self.assertEqual(
+            [category["name"] for category in response.data["results"]],
+            [f"Subcategory {i}" for i in range(1, 5)],
+        )
+
+        response = self.client.get(response.data["next"])
+        self.assertEqual(
+            [category["name"] for category in response.data["results"]],
+            [f"Subcategory {i}" for i in range(5, 9)],
+        )
+        self.assertIsNotNone(response.data["previous"])
 
     def test_no_subcategories(self):
         Category.objects.create(name="Category with no subcategories")
@@ -121,7 +253,7 @@ class SubCategoryListTests(BaseCategoryTestCase):
         response = self.client.get(url)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data, [])
+        self.assertEqual(response.data["results"], [])
 
     def test_category_not_found(self):
         url = reverse(
@@ -131,9 +263,286 @@ class SubCategoryListTests(BaseCategoryTestCase):
 
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
 
+    def test_subcategory_counts(self):
+        subcategory = Category.objects.get(name="Subcategory 1")
+        child = Category.objects.create(name="Child", parent=subcategory)
+        Category.objects.create(name="Grandchild", parent=child)
+
+        response = self.client.get(self.subcategories_list_url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        counts = {
+            category["name"]: (category["child_count"], category["descendant_count"])
+            for category in response.data["results"]
+        }
+        self.assertEqual(counts["Subcategory 1"], (1, 2))
+        self.assertEqual(counts["Subcategory 2"], (0, 0))
+
+    def test_list_subcategories_with_depth(self):
+        subcategory = Category.objects.get(name="Subcategory 1")
+        child = Category.objects.create(name="Child", parent=subcategory)
+        Category.objects.create(name="Grandchild", parent=child)
+
+        self.client.credentials()
+        with self.assertNumQueries(2):
+            response = self.client.get(self.subcategories_list_url, {"depth": 2})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 10)
+        subcategory_data = next(
+            category
+            for category in response.data
+            if category["name"] == "Subcategory 1"
+        )
+        child_data = subcategory_data["subcategories"][0]
+        self.assertEqual(child_data["name"], "Child")
+        self.assertEqual(child_data["child_count"], 1)
+        self.assertEqual(child_data["descendant_count"], 1)
+        # Grandchild is below the requested depth.
+        self.assertEqual(child_data["subcategories"], [])
+
+    def test_list_subcategories_with_invalid_depth(self):
+        response = self.client.get(self.subcategories_list_url, {"depth": 0})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class CategoryTreeTests(BaseCategoryTreeTestCase):
+    def setUp(self):
+        cache.clear()
+        self.tree_url = reverse("category-tree")
+        self.client = APIClient()
+
+    def test_category_tree(self):
+        response = self.client.get(self.tree_url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [category["name"] for category in response.data],
+            ["Test Category", "Other Category"],
+        )
+        test_category = response.data[0]
+        self.assertEqual(test_category["subcategories"][0]["name"], "Child")
+        self.assertEqual(
+            test_category["subcategories"][0]["subcategories"][0]["name"],
+            "Grandchild",
+        )
+        self.assertEqual(response.data[1]["subcategories"], [])
+
+    def test_category_tree_follows_rank(self):
+        self.other_category.reorder(before=self.category)
+        response = self.client.get(self.tree_url)
+
+        self.assertEqual(
+            [category["name"] for category in response.data],
+            ["Other Category", "Test Category"],
+        )
+
+    def test_category_tree_with_root(self):
+        response = self.client.get(self.tree_url, {"root": self.child.slug})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 1)
+        self.assertEqual(response.data[0]["name"], "Child")
+        self.assertEqual(response.data[0]["subcategories"][0]["name"], "Grandchild")
+
+    def test_category_tree_with_max_depth(self):
+        response = self.client.get(self.tree_url, {"max_depth": 1})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        child = response.data[0]["subcategories"][0]
+        self.assertEqual(child["name"], "Child")
+        self.assertEqual(child["subcategories"], [])
+
+        response = self.client.get(
+            self.tree_url, {"root": self.category.slug, "max_depth": 0}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data[0]["subcategories"], [])
+
+    def test_category_tree_with_invalid_parameters(self):
+        response = self.client.get(self.tree_url, {"max_depth": -1})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        response = self.client.get(self.tree_url, {"root": "non-existent-slug"})
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_category_tree_is_cached_until_categories_change(self):
+        with self.assertNumQueries(1):
+            self.client.get(self.tree_url)
+        with self.assertNumQueries(0):
+            response = self.client.get(self.tree_url)
+        self.assertEqual(len(response.data), 2)
+
+        Category.objects.create(name="New Category")
+        response = self.client.get(self.tree_url)
+        self.assertEqual(len(response.data), 3)
+
+
+class CategoryAncestorsTests(BaseCategoryTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+
+        # Creating a chain like this: (Test Category --> Level 1 --> ... --> Level 5)
+        parent = cls.category
+        for i in range(1, 6):
+            parent = Category.objects.create(name=f"Level {i}", parent=parent)
+        cls.leaf = parent
+
+    def setUp(self):
+        self.client = APIClient()
+
+    def test_list_ancestors(self):
+        url = reverse("category-ancestors-list", kwargs={"slug": self.leaf.slug})
+        with self.assertNumQueries(2):
+            response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [category["name"] for category in response.data],
+            ["Test Category", "Level 1", "Level 2", "Level 3", "Level 4", "Level 5"],
+        )
+        self.assertNotIn("parent", response.data[0])
+
+    def test_list_ancestors_of_top_level_category(self):
+        url = reverse("category-ancestors-list", kwargs={"slug": self.category.slug})
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 1)
+        self.assertEqual(response.data[0]["name"], "Test Category")
+
+    def test_category_not_found(self):
+        url = reverse("category-ancestors-list", kwargs={"slug": "non-existent-slug"})
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+class CategoryBatchTests(BaseCategoryTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.child = Category.objects.create(name="Child", parent=cls.category)
+        cls.other_category = Category.objects.create(name="Other Category")
+
+    def setUp(self):
+        cache.clear()
+        self.batch_url = reverse("category-batch")
+        self.client = APIClient()
+
+    def test_batch_by_slugs(self):
+        response = self.client.get(
+            self.batch_url,
+            {"slug__in": "other-category,missing,test-category,other-category"},
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [category["name"] for category in response.data["results"]],
+            ["Other Category", "Test Category"],
+        )
+        self.assertEqual(response.data["missing"], ["missing"])
+
+    def test_batch_by_ids(self):
+        self.client.get(self.batch_url, {"id__in": self.child.id})
+
+        # Categories are taken from the snapshot, so no queries are needed.
+        with self.assertNumQueries(0):
+            response = self.client.get(
+                self.batch_url,
+                {
+                    "id__in": f"{self.child.id},999999999,{self.category.id}",
+                    "fields": "id,parent",
+                    "expand": "parent",
+                },
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [category["id"] for category in response.data["results"]],
+            [self.child.id, self.category.id],
+        )
+        self.assertEqual(response.data["results"][0]["parent"]["id"], self.category.id)
+        self.assertEqual(response.data["missing"], [999999999])
+
+    def test_batch_excludes_categories_pending_deletion(self):
+        self.other_category.schedule_deletion()
+        response = self.client.get(self.batch_url, {"id__in": self.other_category.id})
+
+        self.assertEqual(response.data["results"], [])
+        self.assertEqual(response.data["missing"], [self.other_category.id])
+
+    @override_settings(CATEGORY_BATCH_MAX_SIZE=2)
+    def test_batch_with_invalid_parameters(self):
+        for params in [
+            {},
+            {"slug__in": "test-category", "id__in": "1"},
+            {"id__in": "1,abc"},
+            {"slug__in": "a,b,c"},
+            {"slug__in": "test-category", "fields": "password"},
+        ]:
+            response = self.client.get(self.batch_url, params)
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+@override_settings(CATEGORY_CHANGES_SAFETY_WINDOW=timedelta(0))
+class CategoryChangesTests(BaseCategoryTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.other_category = Category.objects.create(name="Other Category")
+
+    def setUp(self):
+        cache.clear()
+        self.changes_url = reverse("category-changes")
+        self.client = APIClient()
+
+    def test_synchronizing_changes(self):
+        response = self.client.get(self.changes_url, {"page_size": 1})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            [category["name"] for category in response.data["updated"]],
+            ["Test Category"],
+        )
+        self.assertTrue(response.data["has_more"])
+
+        response = self.client.get(
+            self.changes_url, {"since": response.data["next_since"]}
+        )
+        self.assertEqual(
+            [category["name"] for category in response.data["updated"]],
+            ["Other Category"],
+        )
+        self.assertFalse(response.data["has_more"])
+        since = response.data["next_since"]
+
+        Category.objects.create(name="New Category")
+        Category.objects.get(pk=self.category.pk).delete()
+        response = self.client.get(self.changes_url, {"since": since})
+
+        self.assertEqual(
+            [category["name"] for category in response.data["updated"]],
+            ["New Category"],
+        )
+        self.assertEqual(response.data["deleted"], [self.category.id])
+
+    def test_changes_with_invalid_parameters(self):
+        expired_token = encode_change_token(
+            (timezone.now() - timedelta(days=31), 0, self.category.id)
+        )
+        for params in [
+            {"since": "invalid"},
+            {"since": expired_token},
+            {"page_size": 0},
+        ]:
+            response = self.client.get(self.changes_url, params)
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
 
 class CategoryRetrieveTests(BaseCategoryTestCase):
     def setUp(self):
+        cache.clear()
         self.category_retrieve_url = reverse(
             "category-detail", kwargs={"slug": self.category.slug}
         )
@@ -149,6 +558,82 @@ class CategoryRetrieveTests(BaseCategoryTestCase):
         self.assertEqual(response.data["description"], "Description for Test Category")
         self.assertEqual(response.data["parent"], None)
 
+    def test_retrieve_category_with_fields(self):
+        response = self.client.get(
+            self.category_retrieve_url, {"fields": "id,name,slug"}
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.data,
+            {"id": self.category.id, "name": "Test Category", "slug": "test-category"},
+        )
+
+    def test_retrieve_category_with_expanded_parent(self):
+        child = Category.objects.create(name="Child", parent=self.category)
+        url = reverse("category-detail", kwargs={"slug": child.slug})
+        self.client.credentials()
+        self.client.get(url)
+
+        # Parent is taken from the snapshot, so no queries are needed.
+        with self.assertNumQueries(0):
+            response = self.client.get(url, {"expand": "parent", "fields": "id,parent"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["id"], child.id)
+        self.assertEqual(response.data["parent"]["id"], self.category.id)
+        self.assertEqual(response.data["parent"]["name"], "Test Category")
+
+    def test_retrieve_category_is_cached_until_category_changes(self):
+        self.client.get(self.category_retrieve_url)
+        self.category.description = "Changed description"
+        self.category.save()
+
+        response = self.client.get(self.category_retrieve_url)
+        self.assertEqual(response.data["description"], "Changed description")
+
+    def test_retrieve_renamed_category_with_old_slug(self):
+        self.category.name = "Renamed Category"
+        self.category.save()
+
+        response = self.client.get(self.category_retrieve_url, {"fields": "id,slug"})
+
+        self.assertEqual(response.status_code, status.HTTP_301_MOVED_PERMANENTLY)
+        self.assertEqual(
+            response["Location"],
+            reverse("category-detail", kwargs={"slug": "renamed-category"})
+            + "?fields=id%2Cslug",
+        )
+        response = self.client.get(response["Location"])
+        self.assertEqual(
+            response.data, {"id": self.category.id, "slug": "renamed-category"}
+        )
+
+    def test_retrieve_deleted_category_with_old_slug(self):
+        self.category.name = "Renamed Category"
+        self.category.save()
+        self.category.schedule_deletion()
+
+        response = self.client.get(self.category_retrieve_url)
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_retrieve_category_with_invalid_fields(self):
+        for params in [{"fields": "id,password"}, {"expand": "subcategories"}]:
+            response = self.client.get(self.category_retrieve_url, params)
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_retrieve_updated_category(self):
+        self.client.get(self.category_retrieve_url)
+        self.category.description = "Changed description"
+        self.category.save()
+
+        response = self.client.get(self.category_retrieve_url)
+        self.assertEqual(response.data["description"], "Changed description")
+
+        self.category.schedule_deletion()
+        response = self.client.get(self.category_retrieve_url)
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
     def test_list_categories_with_unauthenticated_user(self):
         self.client.credentials()
         response = self.client.get(self.category_retrieve_url)
@@ -169,6 +654,71 @@ class CategoryRetrieveTests(BaseCategoryTestCase):
         self.assertEqual(response.data["slug"], "test-category")
 
 
+class CategoryConditionalGetTests(BaseCategoryTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.child = Category.objects.create(name="Child", parent=cls.category)
+        cls.other_category = Category.objects.create(name="Other Category")
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+
+    def test_not_modified_collections(self):
+        for url in [
+            reverse("category-list"),
+            reverse("category-tree"),
+            reverse("category-subcategories-list", kwargs={"slug": self.category.slug}),
+        ]:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            etag = response["ETag"]
+
+            # Nothing is read from the database nor serialized for unchanged categories.
+            with self.assertNumQueries(0):
+                response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+            self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+            response = self.client.get(
+                url, HTTP_IF_MODIFIED_SINCE=response["Last-Modified"]
+            )
+            self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_collection_is_modified_after_change(self):
+        url = reverse("category-list")
+        etag = self.client.get(url)["ETag"]
+
+        Category.objects.create(name="New Category")
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_different_representations_have_different_etags(self):
+        url = reverse("category-list")
+        etag = self.client.get(url)["ETag"]
+
+        response = self.client.get(url, {"fields": "id"}, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_not_modified_category(self):
+        url = reverse("category-detail", kwargs={"slug": self.child.slug})
+        etag = self.client.get(url)["ETag"]
+
+        # Changes of unrelated categories do not change the ETag of the category.
+        self.other_category.description = "Changed description"
+        self.other_category.save()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+        # Changes of the parent do, as it can be expanded in the response.
+        self.category.description = "Changed description"
+        self.category.save()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+
 class CategoryCreateTests(APITestCase):
     @classmethod
     def setUpTestData(cls) -> None:
@@ -363,6 +913,26 @@ class CategoryCreateTests(APITestCase):
         # Checking that only one category is created in db.
         self.assertEqual(Category.objects.count(), 1)
 
+    def test_create_category_taken_by_concurrent_request(self):
+        Category.objects.create(name="Test Category")
+
+        # Simulating a concurrent request creating the category after the names were checked.
+        with patch(
+            "inventory.serializers.CategoryListSerializer._check_existing_names"
+        ):
+            response = self.client.post(
+                self.category_create_url,
+                [{"name": "New Category"}, {"name": "TEST category"}],
+                format="json",
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            response.data,
+            [{}, {"name": ["category with this name already exists."]}],
+        )
+        self.assertEqual(Category.objects.count(), 1)
+
     def test_create_subcategory_with_duplicate_name(self):
         # First creating parent category
         response_for_creating_parent_category = self.client.post(
@@ -509,63 +1079,228 @@ class CategoryCreateTests(APITestCase):
         self.assertEqual(Category.objects.count(), 1)
         self.assertEqual(Category.objects.last().name, "Pet Food")
 
+    def test_create_categories_with_parents_from_payload(self):
+        electronics = Category.objects.create(name="Electronics")
+        data = [
+            {"name": "Gaming Laptops", "parent_name": "laptops"},
+            {"name": "Laptops", "parent_name": "Computers"},
+            {"name": "Computers", "parent": electronics.id},
+            {"name": "Phones", "parent_name": "Electronics"},
+        ]
 
-class CategoryUpdateTests(BaseCategoryTestCase):
-    def setUp(self) -> None:
-        self.category_update_url = reverse(
-            "category-detail", kwargs={"slug": self.category.slug}
+        response = self.client.post(self.category_create_url, data, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(
+            [c["name"] for c in response.data],
+            ["Gaming Laptops", "Laptops", "Computers", "Phones"],
+        )
+        gaming_laptops = Category.objects.get(name="Gaming Laptops")
+        laptops = Category.objects.get(name="Laptops")
+        computers = Category.objects.get(name="Computers")
+        phones = Category.objects.get(name="Phones")
+        self.assertEqual(response.data[0]["parent"], laptops.id)
+        self.assertEqual(gaming_laptops.slug, "gaming-laptops")
+        self.assertEqual(
+            gaming_laptops.path, f"{electronics.id}/{computers.id}/{laptops.id}/"
         )
-        self.client = APIClient()
-        self.client.credentials(HTTP_AUTHORIZATION=f"Token {self.token.key}")
-        self.updated_data = {
-            "name": "Updated Category Name",
-            "description": "Updated Description",
-        }
+        self.assertEqual(gaming_laptops.depth, 3)
+        self.assertEqual((computers.child_count, computers.descendant_count), (1, 2))
+        self.assertLess(computers.rank, phones.rank)
 
-    def test_update_with_authenticated_admin_user(self):
-        response = self.client.put(
-            self.category_update_url, self.updated_data, format="json"
+        electronics.refresh_from_db()
+        self.assertEqual(
+            (electronics.child_count, electronics.descendant_count), (2, 4)
         )
 
-        self.assertEqual(response.status_code, status.HTTP_200_OK)
-        self.assertEqual(response.data["name"], self.updated_data["name"])
-        self.assertEqual(response.data["description"], self.updated_data["description"])
+    def test_create_categories_with_duplicate_names_in_payload(self):
+        data = [{"name": "Pet Food"}, {"name": "PET FOOD"}, {"name": "Pet-Food"}]
 
-    def test_update_with_unauthenticated_user(self):
-        self.client.credentials()
-        response = self.client.put(
-            self.category_update_url, self.updated_data, format="json"
-        )
+        response = self.client.post(self.category_create_url, data, format="json")
 
-        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data[0], {})
         self.assertEqual(
-            str(response.data["detail"]),
-            "Authentication credentials were not provided.",
-        )
-        self.category.refresh_from_db()
-        self.assertNotEqual(self.category.name, self.updated_data["name"])
-        self.assertNotEqual(self.category.description, self.updated_data["description"])
-
-    def test_update_without_permissions(self):
-        self.user.is_staff = False
-        self.user.save()
-        response = self.client.put(
-            self.category_update_url, self.updated_data, format="json"
+            response.data[1]["name"], ["category with this name already exists."]
         )
-
-        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
         self.assertEqual(
-            str(response.data["detail"]),
-            "You do not have permission to perform this action.",
+            response.data[2]["name"], ["category with this slug already exists."]
         )
-        self.category.refresh_from_db()
-        self.assertNotEqual(self.category.name, self.updated_data["name"])
-        self.assertNotEqual(self.category.description, self.updated_data["description"])
+        self.assertEqual(Category.objects.count(), 0)
 
-    def test_update_with_existing_category(self):
-        """
-        This test will make sure that if we try to update category with a name of another
-        category we get 400 status code and the category is not changed.
+    def test_create_categories_with_circular_parent_names(self):
+        data = [
+            {"name": "Food", "parent_name": "Pet Food"},
+            {"name": "Pet Food", "parent_name": "Food"},
+            {"name": "Toys", "parent_name": "Toys"},
+            {"name": "Dog Food", "parent_name": "Pet Food"},
+        ]
+
+        response = self.client.post(self.category_create_url, data, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        for i in range(3):
+            self.assertEqual(
+                response.data[i]["parent_name"],
+                ["This change would create a circular relationship."],
+            )
+        self.assertEqual(response.data[3], {})
+        self.assertEqual(Category.objects.count(), 0)
+
+    @override_settings(CATEGORY_MAX_DEPTH=2)
+    def test_create_categories_deeper_than_max_depth(self):
+        root = Category.objects.create(name="Root")
+        data = [
+            {"name": "Child", "parent": root.id},
+            {"name": "Grandchild", "parent_name": "Child"},
+            {"name": "Great Grandchild", "parent_name": "Grandchild"},
+        ]
+
+        response = self.client.post(self.category_create_url, data, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data[:2], [{}, {}])
+        self.assertEqual(
+            response.data[2]["parent_name"],
+            ["Categories can not be nested more than 2 levels deep."],
+        )
+        self.assertEqual(Category.objects.count(), 1)
+
+        response = self.client.post(
+            self.category_create_url,
+            {
+                "name": "Great Grandchild",
+                "parent": Category.objects.get(name="Root").id,
+            },
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+
+    def test_create_categories_with_reserved_names(self):
+        data = [{"name": "Tree"}, {"name": "bulk"}, {"name": "Bulk Items"}]
+
+        response = self.client.post(self.category_create_url, data, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            response.data[0]["name"],
+            ['Category name "Tree" is reserved, please choose another one.'],
+        )
+        self.assertIn("name", response.data[1])
+        self.assertEqual(response.data[2], {})
+        self.assertEqual(Category.objects.count(), 0)
+
+    def test_reserved_slugs_match_routes(self):
+        # Every route next to the detail route has to be reserved, or it would shadow a category.
+        prefixes = set()
+        for url in router.urls:
+            match = re.match(r"\^categories/(\w+)", str(url.pattern))
+            if match:
+                prefixes.add(match.group(1))
+        self.assertEqual(prefixes, RESERVED_SLUGS)
+
+    def test_create_category_with_unknown_parent_name(self):
+        self.single_category_data["parent_name"] = "Unknown"
+
+        response = self.client.post(
+            self.category_create_url, self.single_category_data, format="json"
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            response.data[0]["parent_name"],
+            ['Category with name "Unknown" does not exist.'],
+        )
+
+    def test_create_categories_query_count_does_not_depend_on_size(self):
+        parent = Category.objects.create(name="Pets")
+
+        def create(names):
+            data = [{"name": name, "parent": parent.id} for name in names]
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.post(
+                    self.category_create_url, data, format="json"
+                )
+            self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+            return len(queries)
+
+        self.assertEqual(
+            create([f"Small {i}" for i in range(2)]),
+            create([f"Large {i}" for i in range(50)]),
+        )
+        parent.refresh_from_db()
+        self.assertEqual(parent.child_count, 52)
+
+    @override_settings(CATEGORY_BULK_BATCH_SIZE=2)
+    def test_create_categories_in_batches(self):
+        data = [{"name": f"Category {i}"} for i in range(5)]
+        data.append({"name": "Subcategory", "parent_name": "Category 4"})
+
+        response = self.client.post(self.category_create_url, data, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(Category.objects.count(), 6)
+        self.assertEqual(
+            Category.objects.get(name="Subcategory").parent.name, "Category 4"
+        )
+
+
+class CategoryUpdateTests(BaseCategoryTestCase):
+    def setUp(self) -> None:
+        self.category_update_url = reverse(
+            "category-detail", kwargs={"slug": self.category.slug}
+        )
+        self.client = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION=f"Token {self.token.key}")
+        self.updated_data = {
+            "name": "Updated Category Name",
+            "description": "Updated Description",
+        }
+
+    def test_update_with_authenticated_admin_user(self):
+        response = self.client.put(
+            self.category_update_url, self.updated_data, format="json"
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["name"], self.updated_data["name"])
+        self.assertEqual(response.data["description"], self.updated_data["description"])
+
+    def test_update_with_unauthenticated_user(self):
+        self.client.credentials()
+        response = self.client.put(
+            self.category_update_url, self.updated_data, format="json"
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertEqual(
+            str(response.data["detail"]),
+            "Authentication credentials were not provided.",
+        )
+        self.category.refresh_from_db()
+        self.assertNotEqual(self.category.name, self.updated_data["name"])
+        self.assertNotEqual(self.category.description, self.updated_data["description"])
+
+    def test_update_without_permissions(self):
+        self.user.is_staff = False
+        self.user.save()
+        response = self.client.put(
+            self.category_update_url, self.updated_data, format="json"
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertEqual(
+            str(response.data["detail"]),
+            "You do not have permission to perform this action.",
+        )
+        self.category.refresh_from_db()
+        self.assertNotEqual(self.category.name, self.updated_data["name"])
+        self.assertNotEqual(self.category.description, self.updated_data["description"])
+
+    def test_update_with_existing_category(self):
+        """
+        This test will make sure that if we try to update category with a name of another
+        category we get 400 status code and the category is not changed.
         """
 
         # Creating another category.
@@ -586,6 +1321,25 @@ class CategoryUpdateTests(BaseCategoryTestCase):
         self.assertIsNotNone(Category.objects.get(name="Test Category"))
         self.assertEqual(Category.objects.all().count(), 2)
 
+    def test_update_with_existing_category_in_other_case(self):
+        Category.objects.create(name="Existing Category")
+
+        # Duplicates are rejected by the unique constraint, without checking the name with a query first.
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.put(
+                self.category_update_url, {"name": "EXISTING category"}, format="json"
+            )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            response.data["name"], ["category with this name already exists."]
+        )
+        self.assertFalse(
+            any("LIKE" in query["sql"].upper() for query in queries.captured_queries)
+        )
+        self.category.refresh_from_db()
+        self.assertEqual(self.category.name, "Test Category")
+
     def test_update_names_are_case_insensitive(self):
         data = {"name": "test category"}  # Lowercase variation
         response = self.client.put(self.category_update_url, data, format="json")
@@ -780,6 +1534,32 @@ class CategoryUpdateTests(BaseCategoryTestCase):
         self.assertNotEqual(second_category.parent, third_category)
         self.assertEqual(second_category.parent, self.category)
 
+    def test_circular_relationship_check_does_not_depend_on_depth(self):
+        def create_chain(prefix, length):
+            parent = self.category
+            for i in range(length):
+                parent = Category.objects.create(name=f"{prefix} {i}", parent=parent)
+            return parent
+
+        shallow_leaf = create_chain("Shallow", 2)
+        deep_leaf = create_chain("Deep", 20)
+
+        query_counts = []
+        for leaf in [shallow_leaf, deep_leaf]:
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.put(
+                    self.category_update_url,
+                    {"name": self.category.name, "parent": leaf.id},
+                    format="json",
+                )
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+            self.assertIn(
+                "This change would create a circular relationship.", str(response.data)
+            )
+            query_counts.append(len(queries))
+
+        self.assertEqual(query_counts[0], query_counts[1])
+
 
 class CategoryPartialUpdateTests(BaseCategoryTestCase):
     def setUp(self) -> None:
@@ -1050,6 +1830,317 @@ class CategoryPartialUpdateTests(BaseCategoryTestCase):
         self.assertNotEqual(second_category.parent, third_category)
         self.assertEqual(second_category.parent, self.category)
 
+    @override_settings(CATEGORY_MAX_DEPTH=2)
+    def test_update_deeper_than_max_depth(self):
+        # (self.category --> child) moved under (other --> other child) would put child at the depth of 3.
+        Category.objects.create(name="Child", parent=self.category)
+        other = Category.objects.create(name="Other")
+        other_child = Category.objects.create(name="Other Child", parent=other)
+
+        response = self.client.patch(
+            self.category_partial_update_url,
+            {"parent": other_child.id},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn(
+            "Categories can not be nested more than 2 levels deep.", str(response.data)
+        )
+        self.category.refresh_from_db()
+        self.assertIsNone(self.category.parent)
+
+        response = self.client.patch(
+            self.category_partial_update_url, {"parent": other.id}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+
+class CategoryBulkPartialUpdateTests(BaseCategoryTreeTestCase):
+    def setUp(self):
+        self.category_bulk_url = reverse("category-bulk")
+        self.client = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION=f"Token {self.token.key}")
+
+    def test_bulk_partial_update_categories(self):
+        data = [
+            {"id": self.other_category.id, "name": "renamed category"},
+            {"id": self.child.id, "description": "Updated description"},
+        ]
+
+        response = self.client.patch(self.category_bulk_url, data, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data[0]["slug"], "renamed-category")
+        self.other_category.refresh_from_db()
+        self.child.refresh_from_db()
+        self.assertEqual(self.other_category.name, "Renamed Category")
+        self.assertEqual(self.child.description, "Updated description")
+        self.assertEqual(self.child.name, "Child")
+
+        # Old slug of the renamed category is redirected to the new one.
+        response = self.client.get(
+            reverse("category-detail", kwargs={"slug": "other-category"})
+        )
+        self.assertEqual(response.status_code, status.HTTP_301_MOVED_PERMANENTLY)
+        self.assertEqual(
+            response["Location"],
+            reverse("category-detail", kwargs={"slug": "renamed-category"}),
+        )
+
+    def test_bulk_partial_update_applies_moves_together(self):
+        # Swapping the child and its parent, which is valid only when both moves are applied.
+        data = [
+            {"id": self.category.id, "parent": self.child.id},
+            {"id": self.child.id, "parent": None},
+        ]
+
+        response = self.client.patch(self.category_bulk_url, data, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data[0]["parent"], self.child.id)
+        self.assertEqual(response.data[1]["descendant_count"], 2)
+        self.grandchild.refresh_from_db()
+        self.category.refresh_from_db()
+        self.assertEqual(self.grandchild.parent, self.child)
+        self.assertEqual(self.category.path, f"{self.child.id}/")
+
+    def test_bulk_partial_update_with_circular_moves(self):
+        data = [
+            {"id": self.other_category.id, "parent": self.grandchild.id},
+            {"id": self.category.id, "parent": self.other_category.id},
+        ]
+
+        response = self.client.patch(self.category_bulk_url, data, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        for item in response.data:
+            self.assertEqual(
+                item["parent"], ["This change would create a circular relationship."]
+            )
+        self.category.refresh_from_db()
+        self.assertIsNone(self.category.parent)
+
+    @override_settings(CATEGORY_MAX_DEPTH=2)
+    def test_bulk_partial_update_deeper_than_max_depth(self):
+        data = [
+            {"id": self.other_category.id, "description": "Updated description"},
+            {"id": self.category.id, "parent": self.other_category.id},
+        ]
+
+        response = self.client.patch(self.category_bulk_url, data, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data[0], {})
+        self.assertEqual(
+            response.data[1]["parent"],
+            ["Categories can not be nested more than 2 levels deep."],
+        )
+        # The whole update is rolled back.
+        self.category.refresh_from_db()
+        self.other_category.refresh_from_db()
+        self.assertIsNone(self.category.parent)
+        self.assertNotEqual(self.other_category.description, "Updated description")
+
+    def test_bulk_partial_update_reports_errors_per_item(self):
+        data = [
+            {"id": self.child.id, "description": "Valid"},
+            {"id": self.other_category.id, "name": "Grandchild"},
+            {"id": 99999, "description": "Missing"},
+            {"description": "Without id"},
+            {"id": self.category.id, "parent": self.category.id},
+        ]
+
+        response = self.client.patch(self.category_bulk_url, data, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(response.data[0], {})
+        self.assertEqual(
+            response.data[1]["name"], ["category with this name already exists."]
+        )
+        self.assertEqual(
+            response.data[2]["id"], ['Invalid pk "99999" - object does not exist.']
+        )
+        self.assertEqual(response.data[3]["id"], ["This field is required."])
+        self.assertIn(
+            "A category cannot be its own parent.", response.data[4]["parent"]
+        )
+        self.child.refresh_from_db()
+        self.assertNotEqual(self.child.description, "Valid")
+
+    def test_bulk_partial_update_query_count_does_not_depend_on_size(self):
+        categories = Category.objects.bulk_create_tree(
+            [Category(name=f"Bulk {i}") for i in range(50)]
+        )
+
+        def update(categories):
+            data = [{"id": c.id, "description": "Updated"} for c in categories]
+            with CaptureQueriesContext(connection) as queries:
+                response = self.client.patch(
+                    self.category_bulk_url, data, format="json"
+                )
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            return len(queries)
+
+        self.assertEqual(update(categories[:2]), update(categories))
+
+    def test_bulk_partial_update_without_permissions(self):
+        self.user.is_staff = False
+        self.user.save()
+
+        response = self.client.patch(
+            self.category_bulk_url,
+            [{"id": self.category.id, "description": "Updated"}],
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+
+class CategoryMoveTests(BaseCategoryTreeTestCase):
+    def setUp(self):
+        self.category_move_url = reverse(
+            "category-move", kwargs={"slug": self.category.slug}
+        )
+        self.client = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION=f"Token {self.token.key}")
+
+    def test_move_category_with_subtree(self):
+        response = self.client.post(
+            self.category_move_url, {"parent": self.other_category.id}, format="json"
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["moved_count"], 3)
+        self.category.refresh_from_db()
+        self.grandchild.refresh_from_db()
+        self.assertEqual(self.category.parent, self.other_category)
+        self.assertEqual(self.category.depth, 1)
+        self.assertEqual(self.grandchild.depth, 3)
+        self.assertEqual(
+            list(self.grandchild.get_ancestors()),
+            [self.other_category, self.category, self.child],
+        )
+
+    def test_move_category_to_top_level(self):
+        url = reverse("category-move", kwargs={"slug": self.child.slug})
+        response = self.client.post(url, {"parent": None}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["moved_count"], 2)
+        self.grandchild.refresh_from_db()
+        self.assertEqual(list(self.grandchild.get_ancestors()), [self.child])
+
+    def test_move_with_circular_relationship(self):
+        for parent in [self.category, self.grandchild]:
+            response = self.client.post(
+                self.category_move_url, {"parent": parent.id}, format="json"
+            )
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        self.category.refresh_from_db()
+        self.assertIsNone(self.category.parent)
+        self.assertEqual(self.category.depth, 0)
+
+    @override_settings(CATEGORY_MAX_DEPTH=2)
+    def test_move_deeper_than_max_depth(self):
+        response = self.client.post(
+            self.category_move_url, {"parent": self.other_category.id}, format="json"
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            response.data["parent"],
+            ["Categories can not be nested more than 2 levels deep."],
+        )
+        self.grandchild.refresh_from_db()
+        self.assertEqual(self.grandchild.depth, 2)
+
+    def test_move_with_invalid_parent(self):
+        response = self.client.post(
+            self.category_move_url, {"parent": 999_999_999}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        response = self.client.post(self.category_move_url, {}, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_move_without_permissions(self):
+        self.user.is_staff = False
+        self.user.save()
+
+        response = self.client.post(
+            self.category_move_url, {"parent": self.other_category.id}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.category.refresh_from_db()
+        self.assertIsNone(self.category.parent)
+
+
+class CategoryReorderTests(BaseCategoryTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+
+        # Creating three subcategories: (Test Category --> First, Second, Third)
+        cls.first = Category.objects.create(name="First", parent=cls.category)
+        cls.second = Category.objects.create(name="Second", parent=cls.category)
+        cls.third = Category.objects.create(name="Third", parent=cls.category)
+
+    def setUp(self):
+        self.category_reorder_url = reverse(
+            "category-reorder", kwargs={"slug": self.third.slug}
+        )
+        self.subcategories_url = reverse(
+            "category-subcategories-list", kwargs={"slug": self.category.slug}
+        )
+        self.client = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION=f"Token {self.token.key}")
+
+    def get_subcategory_names(self):
+        response = self.client.get(self.subcategories_url)
+        return [category["name"] for category in response.data["results"]]
+
+    def test_reorder_category_before_sibling(self):
+        response = self.client.post(
+            self.category_reorder_url, {"before": self.first.id}, format="json"
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertEqual(self.get_subcategory_names(), ["Third", "First", "Second"])
+
+    def test_reorder_category_after_sibling(self):
+        response = self.client.post(
+            self.category_reorder_url, {"after": self.first.id}, format="json"
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
+        self.assertEqual(self.get_subcategory_names(), ["First", "Third", "Second"])
+
+    def test_reorder_with_invalid_data(self):
+        other_category = Category.objects.create(name="Other Category")
+        for data in [
+            {},
+            {"before": self.first.id, "after": self.second.id},
+            {"before": self.third.id},
+            {"after": other_category.id},
+            {"after": 999_999_999},
+        ]:
+            response = self.client.post(self.category_reorder_url, data, format="json")
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+        self.assertEqual(self.get_subcategory_names(), ["First", "Second", "Third"])
+
+    def test_reorder_without_permissions(self):
+        self.user.is_staff = False
+        self.user.save()
+
+        response = self.client.post(
+            self.category_reorder_url, {"before": self.first.id}, format="json"
+        )
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertEqual(self.get_subcategory_names(), ["First", "Second", "Third"])
+
 
 class CategoryDeleteTests(BaseCategoryTestCase):
     def setUp(self) -> None:
@@ -1086,3 +2177,496 @@ class CategoryDeleteTests(BaseCategoryTestCase):
         )
         response = self.client.delete(self.category_delete_url)
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+@override_settings(
+    CELERY_TASK_ALWAYS_EAGER=True,
+    CATEGORY_BACKGROUND_DELETE_THRESHOLD=3,
+    CATEGORY_DELETE_BATCH_SIZE=2,
+)
+class CategoryBackgroundDeleteTests(BaseCategoryTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+
+        # Creating 5 descendants, which is more than the background delete threshold.
+        parent = cls.category
+        for i in range(1, 4):
+            parent = Category.objects.create(name=f"Level {i}", parent=parent)
+            Category.objects.create(name=f"Sibling {i}", parent=parent)
+        cls.other_category = Category.objects.create(name="Other Category")
+
+    def setUp(self):
+        self.category_delete_url = reverse(
+            "category-detail", kwargs={"slug": self.category.slug}
+        )
+        self.client = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION=f"Token {self.token.key}")
+
+    def test_large_subtree_is_deleted_in_background(self):
+        response = self.client.delete(self.category_delete_url)
+
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        self.assertEqual(response.data["total_count"], 7)
+        self.assertEqual(list(Category.objects.all()), [self.other_category])
+
+        deletion_url = reverse(
+            "category-deletion-detail", kwargs={"deletion_id": response.data["id"]}
+        )
+        response = self.client.get(deletion_url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["status"], "completed")
+        self.assertEqual(response.data["deleted_count"], 7)
+        self.assertIsNotNone(response.data["completed_at"])
+
+    def test_small_subtree_is_deleted_in_background_when_requested(self):
+        url = reverse("category-detail", kwargs={"slug": "level-3"})
+        response = self.client.delete(url, QUERY_STRING="background=true")
+
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        self.assertEqual(response.data["total_count"], 2)
+        self.assertFalse(Category.objects.filter(name__in=["Level 3", "Sibling 3"]))
+
+    def test_marked_categories_are_hidden(self):
+        with patch("inventory.views.delete_category_subtree.delay") as delay:
+            response = self.client.delete(self.category_delete_url)
+        delay.assert_called_once_with(response.data["id"])
+
+        # Categories are only marked for deletion until the background task runs.
+        self.assertEqual(Category.objects.filter(is_pending_deletion=True).count(), 7)
+        response = self.client.get(reverse("category-list"))
+        self.assertEqual(
+            [category["name"] for category in response.data["results"]],
+            ["Other Category"],
+        )
+        response = self.client.get(self.category_delete_url)
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+        # Marked categories can not be used as parents.
+        response = self.client.post(
+            reverse("category-list"),
+            {"name": "New Category", "parent": self.category.id},
+            format="json",
+        )
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_deletion_without_permissions(self):
+        response = self.client.delete(self.category_delete_url)
+        deletion_url = reverse(
+            "category-deletion-detail", kwargs={"deletion_id": response.data["id"]}
+        )
+        self.user.is_staff = False
+        self.user.save()
+
+        response = self.client.get(deletion_url)
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_deletion_not_found(self):
+        url = reverse("category-deletion-detail", kwargs={"deletion_id": 999_999})
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+@override_settings(
+    CELERY_TASK_ALWAYS_EAGER=True,
+    CATEGORY_BACKGROUND_DELETE_THRESHOLD=4,
+)
+class CategoryBulkDeleteTests(BaseCategoryTreeTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+
+        # Adding (Other Category --> Other Child) to the tree.
+        cls.other_child = Category.objects.create(
+            name="Other Child", parent=cls.other_category
+        )
+
+    def setUp(self):
+        self.category_bulk_url = reverse("category-bulk")
+        self.client = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION=f"Token {self.token.key}")
+
+    def test_bulk_delete_categories_by_slugs(self):
+        data = {"slugs": ["grandchild", "other-child", "missing", "child"]}
+
+        response = self.client.delete(self.category_bulk_url, data, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            response.data["results"],
+            [
+                {"slug": "grandchild", "status": "deleted"},
+                {"slug": "other-child", "status": "deleted"},
+                {"slug": "missing", "status": "not_found"},
+                {"slug": "child", "status": "deleted"},
+            ],
+        )
+        self.assertEqual(
+            set(Category.objects.all()), {self.category, self.other_category}
+        )
+        self.category.refresh_from_db()
+        self.other_category.refresh_from_db()
+        self.assertEqual(
+            (self.category.child_count, self.category.descendant_count), (0, 0)
+        )
+        self.assertEqual(
+            (self.other_category.child_count, self.other_category.descendant_count),
+            (0, 0),
+        )
+        # Only the tops of the deleted subtrees are recorded.
+        self.assertEqual(
+            set(CategoryTombstone.objects.values_list("category_id", flat=True)),
+            {self.child.id, self.other_child.id},
+        )
+
+    def test_bulk_delete_removes_image_files(self):
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root)
+        with override_settings(MEDIA_ROOT=media_root):
+            self.grandchild.image = SimpleUploadedFile("grandchild.png", b"image")
+            self.grandchild.save()
+            image_path = self.grandchild.image.path
+            self.assertTrue(os.path.exists(image_path))
+
+            with self.captureOnCommitCallbacks(execute=True):
+                response = self.client.delete(
+                    self.category_bulk_url, {"slugs": ["child"]}, format="json"
+                )
+
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            self.assertFalse(os.path.exists(image_path))
+
+    def test_bulk_delete_categories_by_ids(self):
+        data = {"ids": [self.category.id, self.other_child.id]}
+
+        # Token, lookup, savepoint, images, old slugs, delete, counts, tombstones and savepoint release.
+        with self.assertNumQueries(9):
+            response = self.client.delete(self.category_bulk_url, data, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(list(Category.objects.all()), [self.other_category])
+
+    @override_settings(CATEGORY_BACKGROUND_DELETE_THRESHOLD=1000)
+    def test_bulk_delete_many_subtrees(self):
+        # Every subtree adds a term to the query, hundreds of them do not fit into a single query on SQLite.
+        leaves = Category.objects.bulk_create_tree(
+            [Category(name=f"Leaf {i}", parent=self.other_category) for i in range(600)]
+        )
+
+        response = self.client.delete(
+            self.category_bulk_url,
+            {"ids": [leaf.id for leaf in leaves]},
+            format="json",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(Category.objects.filter(parent=self.other_category).count(), 1)
+        self.other_category.refresh_from_db()
+        self.assertEqual(self.other_category.descendant_count, 1)
+
+    def test_bulk_delete_categories_in_background(self):
+        data = {"ids": [self.category.id, self.child.id, self.other_category.id]}
+
+        response = self.client.delete(
+            self.category_bulk_url, data, format="json", QUERY_STRING="background=true"
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        results = response.data["results"]
+        self.assertEqual([r["status"] for r in results], ["scheduled"] * 3)
+        # The child is deleted by the deletion of its parent.
+        self.assertEqual(results[0]["deletion_id"], results[1]["deletion_id"])
+        self.assertEqual(CategoryDeletion.objects.count(), 2)
+        self.assertFalse(Category.objects.exists())
+
+    def test_large_sets_are_deleted_in_background(self):
+        data = {"ids": [self.category.id, self.other_category.id]}
+
+        response = self.client.delete(self.category_bulk_url, data, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        self.assertFalse(Category.objects.exists())
+
+    def test_bulk_delete_without_keys(self):
+        response = self.client.delete(self.category_bulk_url, {}, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(Category.objects.count(), 5)
+
+    def test_bulk_delete_without_permissions(self):
+        self.user.is_staff = False
+        self.user.save()
+
+        response = self.client.delete(
+            self.category_bulk_url, {"slugs": ["child"]}, format="json"
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertEqual(Category.objects.count(), 5)
+
+
+class CategoryExportTests(BaseCategoryTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.child = Category.objects.create(name="Child", parent=cls.category)
+        cls.other_category = Category.objects.create(name="Other Category")
+
+    def setUp(self):
+        self.category_export_url = reverse("category-export")
+        self.client = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION=f"Token {self.token.key}")
+
+    def test_export_categories_as_ndjson(self):
+        response = self.client.get(self.category_export_url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        rows = [
+            json.loads(line)
+            for line in b"".join(response.streaming_content).decode().splitlines()
+        ]
+        self.assertEqual(
+            [row["id"] for row in rows],
+            [self.category.id, self.child.id, self.other_category.id],
+        )
+        self.assertEqual(rows[1]["parent"], self.category.id)
+        self.assertEqual(rows[0]["child_count"], 1)
+
+    def test_export_categories_as_csv(self):
+        response = self.client.get(self.category_export_url, {"file_format": "csv"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Type"], "text/csv")
+        rows = list(
+            csv.reader(b"".join(response.streaming_content).decode().splitlines())
+        )
+        self.assertEqual(rows[0][:3], ["id", "name", "slug"])
+        self.assertEqual(rows[2][:2], [str(self.child.id), "Child"])
+        self.assertEqual(len(rows), 4)
+
+    def test_export_resumes_after_last_seen_id(self):
+        response = self.client.get(
+            self.category_export_url, {"file_format": "csv", "after": self.child.id}
+        )
+
+        # The header is left out, so the rows can be appended to the interrupted export.
+        rows = list(
+            csv.reader(b"".join(response.streaming_content).decode().splitlines())
+        )
+        self.assertEqual(
+            rows,
+            [
+                [
+                    str(self.other_category.id),
+                    "Other Category",
+                    "other-category",
+                    "",
+                    "",
+                    "",
+                    "0",
+                    "0",
+                ]
+            ],
+        )
+
+    def test_export_compressed_with_gzip(self):
+        response = self.client.get(self.category_export_url, {"gzip": "true"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn("categories.ndjson.gz", response["Content-Disposition"])
+        content = gzip.decompress(b"".join(response.streaming_content))
+        self.assertEqual(len(content.decode().splitlines()), 3)
+
+    def test_export_with_invalid_format(self):
+        response = self.client.get(self.category_export_url, {"file_format": "xml"})
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_export_without_permissions(self):
+        self.user.is_staff = False
+        self.user.save()
+
+        response = self.client.get(self.category_export_url)
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+
+@override_settings(CELERY_TASK_ALWAYS_EAGER=True, CATEGORY_BULK_BATCH_SIZE=2)
+class CategoryImportTests(BaseCategoryTestCase):
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media_root)
+        media_settings = override_settings(MEDIA_ROOT=self.media_root)
+        media_settings.enable()
+        self.addCleanup(media_settings.disable)
+
+        self.import_url = reverse("category-import-list")
+        self.client = APIClient()
+        self.client.credentials(HTTP_AUTHORIZATION=f"Token {self.token.key}")
+
+    def upload(self, name, content):
+        return self.client.post(
+            self.import_url,
+            {"file": SimpleUploadedFile(name, content.encode())},
+            format="multipart",
+        )
+
+    def test_categories_are_imported(self):
+        response = self.upload(
+            "categories.csv",
+            "name,description,parent_name\n"
+            "laptops,Portable computers,Computers\n"
+            "Computers,All computers,\n"
+            "test category,New description,\n"
+            "Bad & Name,,\n"
+            "Tablets,,Missing Category\n",
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        self.assertEqual(response.data["format"], "csv")
+        self.assertEqual(response.data["source"], "categories.csv")
+
+        response = self.client.get(
+            reverse("category-import-detail", kwargs={"import_id": response.data["id"]})
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["status"], "completed")
+        self.assertEqual(response.data["total_count"], 5)
+        self.assertEqual(response.data["processed_count"], 5)
+        self.assertEqual(response.data["created_count"], 2)
+        self.assertEqual(response.data["updated_count"], 1)
+        self.assertEqual(response.data["rejected_count"], 2)
+        self.assertEqual(
+            [(reject["line"], reject["name"]) for reject in response.data["rejects"]],
+            [(5, "Bad & Name"), (6, "Tablets")],
+        )
+
+        computers = Category.objects.get(name="Computers")
+        laptops = Category.objects.get(name="Laptops")
+        self.assertEqual(laptops.parent, computers)
+        self.assertEqual(laptops.path, f"{computers.id}/")
+        self.assertEqual(computers.child_count, 1)
+        self.category.refresh_from_db()
+        self.assertEqual(self.category.description, "New description")
+
+    def test_existing_categories_are_moved(self):
+        child = Category.objects.create(name="Child", parent=self.category)
+
+        self.upload(
+            "categories.ndjson",
+            '{"name": "Child", "parent_name": ""}\n'
+            '{"name": "Test Category", "parent_name": "Child"}\n',
+        )
+
+        child.refresh_from_db()
+        self.category.refresh_from_db()
+        self.assertIsNone(child.parent)
+        self.assertEqual(self.category.parent, child)
+        self.assertEqual(child.descendant_count, 1)
+
+    def test_import_without_file(self):
+        response = self.client.post(self.import_url, {}, format="multipart")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertFalse(CategoryImport.objects.exists())
+
+    def test_import_without_permissions(self):
+        self.user.is_staff = False
+        self.user.save()
+
+        response = self.upload("categories.csv", "name\nComputers\n")
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_import_not_found(self):
+        url = reverse("category-import-detail", kwargs={"import_id": 999_999})
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+class CategorySearchTests(BaseCategoryTestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+
+        cls.computers = Category.objects.create(
+            name="Gaming Computers", description="Desktop computers for gaming"
+        )
+        cls.laptops = Category.objects.create(
+            name="Laptops", description="Portable computers", parent=cls.computers
+        )
+        cls.laptop_bags = Category.objects.create(
+            name="Laptop Bags", parent=cls.laptops
+        )
+        Category.objects.create(name="Phones", description="Mobile phones")
+
+    def setUp(self):
+        cache.clear()
+        self.category_list_url = reverse("category-list")
+
+    def search(self, query, **params):
+        response = self.client.get(
+            self.category_list_url, {"search": query, "fields": "name", **params}
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return [category["name"] for category in response.data["results"]]
+
+    def test_search_categories(self):
+        self.assertEqual(self.search("laptop bags"), ["Laptop Bags"])
+
+    def test_search_matches_prefix_of_last_word(self):
+        self.assertCountEqual(self.search("lapt"), ["Laptops", "Laptop Bags"])
+
+    def test_search_ranks_names_above_descriptions(self):
+        self.assertEqual(self.search("computers"), ["Gaming Computers", "Laptops"])
+
+    def test_search_follows_changes(self):
+        self.laptops.refresh_from_db()
+        self.laptops.name = "Notebooks"
+        self.laptops.save()
+        Category.objects.filter(pk=self.computers.pk).update(description="Towers")
+        self.laptop_bags.schedule_deletion()
+
+        self.assertEqual(self.search("notebook"), ["Notebooks"])
+        self.assertEqual(self.search("laptop"), [])
+        self.assertEqual(self.search("computers"), ["Gaming Computers", "Notebooks"])
+
+    @skipUnless(connection.vendor == "sqlite", "Triggers are only used on SQLite.")
+    def test_search_triggers_are_recreated_after_migrations(self):
+        # Dropping the triggers like SQLite does when a migration rebuilds the categories table.
+        with connection.cursor() as cursor:
+            for name in SQLITE_SEARCH_TRIGGERS:
+                cursor.execute(f"DROP TRIGGER {name}")
+        Category.objects.filter(pk=self.laptops.pk).update(name="Notebooks")
+
+        emit_post_migrate_signal(verbosity=0, interactive=False, db="default")
+        Category.objects.filter(pk=self.computers.pk).update(
+            name="Towers", description="Desktop towers"
+        )
+
+        self.assertEqual(self.search("notebook"), ["Notebooks"])
+        self.assertEqual(self.search("gaming"), [])
+
+    def test_search_is_paginated(self):
+        response = self.client.get(
+            self.category_list_url, {"search": "computers", "page_size": 1}
+        )
+        self.assertEqual(
+            [category["name"] for category in response.data["results"]],
+            ["Gaming Computers"],
+        )
+        self.assertIsNone(response.data["previous"])
+
+        response = self.client.get(response.data["next"])
+        self.assertEqual(
+            [category["name"] for category in response.data["results"]], ["Laptops"]
+        )
+        self.assertIsNone(response.data["next"])
+        self.assertIsNotNone(response.data["previous"])
+
+    def test_search_without_words(self):
+        response = self.client.get(self.category_list_url, {"search": "&&"})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            response.data["search"],
+            ["Search query must contain at least one letter or digit."],
+        )
@@ -0,0 +1,174 @@
+import heapq
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from datetime import datetime, timedelta, timezone
+from itertools import islice
+from django.conf import settings
+from django.db.models import Q
+from .models import Category, CategoryTombstone, split_path
+
+# Kinds of changes in the change feed, updates go before deletions made at the same time.
+UPDATED, DELETED = 0, 1
+
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def find_circular_moves(moves):
+    """
+    Find moves that would create circular relationships if applied together.
+
+    Original parents of every involved category and of all their ancestors are read from the
+    materialized paths loaded with a single query, the requested moves are then applied on top
+    of them in memory and every moved category is followed up to the root.
+
+    Parameters:
+    - moves (dict): Mapping of category id to the id of its new parent (or None for root).
+
+    Returns:
+    - set: Ids of the categories whose move would create a circular relationship.
+    """
+
+    involved_ids = set(moves) | {pk for pk in moves.values() if pk is not None}
+    parents = {}
+    for pk, path in Category.objects.filter(pk__in=involved_ids).values_list(
+        "pk", "path"
+    ):
+        chain = [None, *split_path(path), pk]
+        parents.update(zip(chain[1:], chain[:-1]))
+    parents.update(moves)
+
+    circular = set()
+    for pk in moves:
+        visited = set()
+        current = parents.get(pk)
+        while current is not None and current not in visited:
+            if current == pk:
+                circular.add(pk)
+                break
+            visited.add(current)
+            current = parents.get(current)
+
+    return circular
+
+
+def build_category_tree(categories, serialized_categories):
+    """
+    Assemble the nested category tree from flat lists of categories in O(n).
+
+    Every serialized category gets a `subcategories` list with its serialized children. Categories
+    whose parent is not in the given list are returned as the top level of the tree.
+
+    Parameters:
+    - categories (list): Category instances, used for reading the ids and parents.
+    - serialized_categories (list): Serialized representations of `categories`, in the same order.
+
+    Returns:
+    - list: Serialized top level categories with their subcategories nested in them.
+    """
+
+    nodes = {}
+    for category, node in zip(categories, serialized_categories):
+        nodes[category.pk] = {**node, "subcategories": []}
+
+    tree = []
+    for category in categories:
+        parent = nodes.get(category.parent_id)
+        siblings = parent["subcategories"] if parent is not None else tree
+        siblings.append(nodes[category.pk])
+
+    return tree
+
+
+def encode_change_token(position):
+    """
+    Encodes the position of a change in the change feed, `(changed_at, kind, id)`, into an opaque token.
+    """
+    changed_at, kind, pk = position
+    microseconds = (changed_at - EPOCH) // timedelta(microseconds=1)
+    return urlsafe_b64encode(f"{microseconds}.{kind}.{pk}".encode()).decode()
+
+
+def decode_change_token(token):
+    """
+    Decodes the position of a change from the token made by `encode_change_token`.
+
+    Raises:
+    - ValueError: If the token is not valid.
+    """
+    try:
+        microseconds, kind, pk = map(int, urlsafe_b64decode(token).decode().split("."))
+    except (TypeError, UnicodeDecodeError) as e:
+        raise ValueError(token) from e
+    if kind not in (UPDATED, DELETED):
+        raise ValueError(token)
+    return EPOCH + timedelta(microseconds=microseconds), kind, pk
+
+
+def get_category_changes(since=None, limit=100):
+    """
+    Returns up to `limit` oldest changes of categories made after the `since` position.
+
+    Changes are read in the order of their time from the categories ordered by `updated_at` and from
+    the tombstones of deleted categories ordered by `deleted_at`, using at most `limit + 1` rows of each.
+    Categories marked for deletion are reported as deleted.
+
+    Times of changes are set when the rows are written, not when their transactions commit, so a change
+    may become visible after newer ones were already read. The returned position is therefore never later
+    than `CATEGORY_CHANGES_SAFETY_WINDOW` before now: changes made within the window are returned again by
+    the next request together with any late ones, and `has_more` is false until they leave the window.
+    Once all changes before the window are read, the position is moved up to the start of the window.
+
+    Parameters:
+    - since (tuple): Position of the last change the client has seen, as decoded by `decode_change_token`.
+    - limit (int): The maximum number of changes returned.
+
+    Returns:
+    - tuple: Updated categories, ids of deleted categories, position to continue from and whether there
+    are more changes after it.
+    """
+
+    categories = Category.objects.order_by("updated_at", "pk")
+    tombstones = CategoryTombstone.objects.order_by("deleted_at", "pk")
+    if since is not None:
+        changed_at, kind, pk = since
+        if kind == UPDATED:
+            categories = categories.filter(
+                Q(updated_at__gt=changed_at) | Q(updated_at=changed_at, pk__gt=pk)
+            )
+            tombstones = tombstones.filter(deleted_at__gte=changed_at)
+        else:
+            categories = categories.filter(updated_at__gt=changed_at)
+            tombstones = tombstones.filter(
+                Q(deleted_at__gt=changed_at) | Q(deleted_at=changed_at, pk__gt=pk)
+            )
+
+    changes = heapq.merge(
+        ((c.updated_at, UPDATED, c.pk, c) for c in categories[: limit + 1]),
+        ((t.deleted_at, DELETED, t.pk, t) for t in tombstones[: limit + 1]),
+        key=lambda change: change[:3],
+    )
+    changes = list(islice(changes, limit + 1))
+    has_more = len(changes) > limit
+    changes = changes[:limit]
+
+    updated = []
+    deleted = []
+    for _, kind, _, item in changes:
+        if kind == DELETED:
+            deleted.append(item.category_id)
+        elif item.is_pending_deletion:
+            deleted.append(item.pk)
+        else:
+            updated.append(item)
+
+    position = changes[-1][:3] if changes else since
+    horizon = (
+        datetime.now(timezone.utc) - settings.CATEGORY_CHANGES_SAFETY_WINDOW,
+        UPDATED,
+        0,
+    )
+    if (changes and position > horizon) or not has_more:
+        # Nothing older than the horizon is left to read, so the position moves up to it, which also
+        # keeps the tokens of clients polling categories that do not change from expiring.
+        position = max(since, horizon) if since is not None else horizon
+        has_more = False
+    return updated, deleted, position, has_more
@@ -3,23 +3,86 @@ from rest_framework.viewsets import ModelViewSet
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework import status
+from rest_framework.exceptions import ValidationError
+from rest_framework.parsers import MultiPartParser
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import F, Q
+from django.http import Http404, HttpResponsePermanentRedirect, StreamingHttpResponse
+from django.shortcuts import get_object_or_404
+from django.urls import reverse
+from django.utils.decorators import method_decorator
+from django.views.decorators.http import condition
+from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import extend_schema
 from openapi.category_examples import (
     list_category_examples,
     list_subcategories_examples,
+    category_tree_examples,
+    category_ancestors_examples,
+    category_batch_examples,
+    category_changes_examples,
+    category_export_examples,
     retrieve_category_examples,
     create_category_examples,
     update_category_examples,
     partial_update_category_examples,
+    bulk_partial_update_category_examples,
+    move_category_examples,
+    reorder_category_examples,
     delete_category_examples,
+    bulk_delete_category_examples,
+    category_deletion_examples,
+    category_import_examples,
+    category_import_detail_examples,
 )
-from .serializers import CategorySerializer, SubCategorySerializer
-from .models import Category
+from .serializers import (
+    CategorySerializer,
+    CategoryFieldsQuerySerializer,
+    CategoryBatchQuerySerializer,
+    CategoryBatchResponseSerializer,
+    CategoryChangesQuerySerializer,
+    CategoryChangesResponseSerializer,
+    CategoryExportQuerySerializer,
+    CategorySearchQuerySerializer,
+    SubCategorySerializer,
+    SubCategoryWithCountsSerializer,
+    CategoryTreeQuerySerializer,
+    SubCategoryQuerySerializer,
+    CategoryMoveSerializer,
+    CategoryReorderSerializer,
+    CategoryDeleteQuerySerializer,
+    CategoryBulkDeleteSerializer,
+    CategoryDeletionSerializer,
+    CategoryImportSerializer,
+)
+from .models import Category, CategoryDeletion, CategoryImport, CategorySlugHistory
+from .tasks import delete_category_subtree, import_categories
+from .cache import (
+    cache_category_response,
+    category_cache_key,
+    CATEGORY_CACHE_TIMEOUT,
+)
+from .snapshot import get_category_snapshot
+from .pagination import CategoryCursorPagination, CategorySearchPagination
+from .conditional import (
+    categories_etag,
+    categories_last_modified,
+    category_etag,
+    category_last_modified,
+)
+from .export import EXPORT_FORMATS, gzip_stream, iter_category_export
+from .search import search_categories
+from .utils import build_category_tree, encode_change_token, get_category_changes
 
 
 class CategoryViewSet(ModelViewSet):
-    queryset = Category.objects.all()
+    # Siblings are grouped together and ordered by their rank, top level categories come first.
+    queryset = Category.objects.active().order_by(
+        F("parent").asc(nulls_first=True), "rank", "id"
+    )
     serializer_class = CategorySerializer
+    pagination_class = CategoryCursorPagination
     lookup_field = "slug"
 
     def get_serializer_class(self):
@@ -28,7 +91,8 @@ class CategoryViewSet(ModelViewSet):
 
         Returns the serializer class based on the action being performed.
 
-        If the action is 'list_subcategories', returns the 'SubCategorySerializer'. Otherwise, returns the 'CategorySerializer'.
+        If the action is 'list_subcategories', returns the 'SubCategoryWithCountsSerializer', if it is 'tree' or 'ancestors',
+        returns the 'SubCategorySerializer'. Otherwise, returns the 'CategorySerializer'.
 
         The difference between 'SubCategorySerializer' and 'CategorySerializer' is that the former will
         return subcategories of category in response.
@@ -37,17 +101,25 @@ class CategoryViewSet(ModelViewSet):
             Class: The serializer class to be used for the view.
         """
 
-        return (
-            SubCategorySerializer
-            if self.action == "list_subcategories"
-            else CategorySerializer
-        )
+        if self.action == "list_subcategories":
+            return SubCategoryWithCountsSerializer
+        if self.action in ["tree", "ancestors"]:
+            return SubCategorySerializer
+        return CategorySerializer
+
+    def get_fields_query(self):
+        """
+        Returns the validated `fields` and `expand` query parameters as serializer keyword arguments.
+        """
+        query_serializer = CategoryFieldsQuerySerializer(data=self.request.query_params)
+        query_serializer.is_valid(raise_exception=True)
+        return query_serializer.validated_data
 
     def get_permissions(self):
         """
         Returns the list of permissions for the view.
 
-        For the 'list', 'list_subcategories' and 'retrieve' actions, permissions are set to allow any user
+        For the 'list', 'list_subcategories', 'tree', 'ancestors', 'batch', 'changes' and 'retrieve' actions, permissions are set to allow any user
         to access the endpoint without authentication or specific permissions. For
         other actions, such as 'create', 'update', 'delete', only the users with is_staff
         set to True are allowed access.
@@ -55,19 +127,71 @@ class CategoryViewSet(ModelViewSet):
         Returns:
         - List of permission classes based on the action being performed.
         """
-        if self.action in ["list", "retrieve", "list_subcategories"]:
+        if self.action in [
+            "list",
+            "retrieve",
+            "list_subcategories",
+            "tree",
+            "ancestors",
+            "batch",
+            "changes",
+        ]:
             permission_classes = [AllowAny]
         else:
             permission_classes = [IsAdminUser]
         return [permission() for permission in permission_classes]
 
+    def get_snapshot_object(self, snapshot):
+        """
+        Returns the category identified by the slug in the URL from the category snapshot.
+
+        Raises:
+        - Http404: If there is no active category with the slug.
+        """
+        try:
+            return snapshot.by_slug[self.kwargs[self.lookup_field]]
+        except KeyError:
+            raise Http404
+
+    def redirect_old_slug(self, request):
+        """
+        Returns a permanent redirect to the current URL of a category that used the slug in the URL
+        before it was renamed, looked up with a single query of the slug history.
+
+        Raises:
+        - Http404: If no active category used the slug.
+        """
+        slug = (
+            CategorySlugHistory.objects.filter(
+                slug=self.kwargs[self.lookup_field],
+                category__is_pending_deletion=False,
+            )
+            .values_list("category__slug", flat=True)
+            .first()
+        )
+        if slug is None:
+            raise Http404
+        url = reverse("category-detail", kwargs={self.lookup_field: slug})
+        query_string = request.META.get("QUERY_STRING")
+        return HttpResponsePermanentRedirect(
+            f"{url}?{query_string}" if query_string else url
+        )
+
     @extend_schema(
+        parameters=[CategorySearchQuerySerializer, CategoryFieldsQuerySerializer],
         responses={
             200: CategorySerializer(many=True),
+            400: CategorySerializer(many=True),
             401: CategorySerializer(many=True),
         },
         examples=list_category_examples(),
     )
+    @method_decorator(
+        condition(
+            etag_func=categories_etag, last_modified_func=categories_last_modified
+        )
+    )
+    @cache_category_response
     def list(self, request, *args, **kwargs):
         """
         ## List all categories.
@@ -77,28 +201,72 @@ class CategoryViewSet(ModelViewSet):
         **permissions** to **create**, **update**, or **delete** categories. However, they will only
         have **read-only** access to this endpoint. **Also requests made with invalid token will receive
         401 status code**.
+        Categories are returned in pages, top level categories first and subcategories ordered by their rank.
+        When searching, only matching categories are returned, best matches first.
+
+        ### Query Parameters:
+        - `search` (optional): Words that have to appear in the name or description of the categories, the last
+        word also matches the beginning of longer words.
+        - `cursor` (optional): The opaque cursor taken from the `next` or `previous` link of the previous page.
+        - `page_size` (optional): The number of categories on a page, capped at the configured maximum.
+        - `fields` (optional): Comma separated names of the fields to return, e.g. `id,name,slug`.
+        - `expand` (optional): `parent` returns the whole parent category instead of its id.
 
         ### Responses:
-        - 200: Successfully retrieved the list of categories. Returns a list of category objects.
+        - 200: Successfully retrieved a page of categories. Returns the list of category objects in `results`
+        together with `next` and `previous` page links.
+        - 304: Not modified. The `If-None-Match` or `If-Modified-Since` header matches the current `ETag` or
+        `Last-Modified` of the response.
+        - 400: Bad request. The query parameters are invalid.
         - 401: Unauthorized. Authentication credentials were invalid.
         - *For more information about responses please check response examples in swagger.*
         """
-        return super().list(request, *args, **kwargs)
+        search_serializer = CategorySearchQuerySerializer(data=request.query_params)
+        search_serializer.is_valid(raise_exception=True)
+        query = search_serializer.validated_data.get("search")
+
+        # Categories are served from the in-memory snapshot of this worker, without any queries.
+        snapshot = get_category_snapshot()
+        if query is not None:
+            # Only the ids of the matching categories are read from the full-text index.
+            paginator = CategorySearchPagination()
+            ids = paginator.paginate_queryset(
+                lambda offset, limit: search_categories(query, offset, limit),
+                request,
+                view=self,
+            )
+            page = [snapshot.by_id[pk] for pk in ids if pk in snapshot.by_id]
+            serializer = self.get_serializer(page, many=True, **self.get_fields_query())
+            return paginator.get_paginated_response(serializer.data)
+
+        page = self.paginate_queryset(snapshot.categories)
+        serializer = self.get_serializer(page, many=True, **self.get_fields_query())
+        return self.get_paginated_response(serializer.data)
 
     @extend_schema(
+        parameters=[SubCategoryQuerySerializer],
         responses={
-            200: SubCategorySerializer,
-            401: SubCategorySerializer,
-            404: SubCategorySerializer,
+            200: SubCategoryWithCountsSerializer,
+            400: SubCategoryWithCountsSerializer,
+            401: SubCategoryWithCountsSerializer,
+            404: SubCategoryWithCountsSerializer,
         },
         examples=list_subcategories_examples(),
     )
     @action(detail=True, methods=["GET"], url_name="subcategories-list")
+    @method_decorator(
+        condition(
+            etag_func=categories_etag, last_modified_func=categories_last_modified
+        )
+    )
+    @cache_category_response
     def list_subcategories(self, request, *args, **kwargs):
         """
         ## List the subcategories of a category.
 
         This endpoint allows users to list the subcategories of an existing category identified by its slug.
+        Every subcategory contains the number of its direct subcategories (`child_count`) and the number of all
+        categories below it (`descendant_count`).
         This endpoint can be accessed by **unauthenticated** users or users who do not have
         **permissions** to **create**, **update**, or **delete** categories. **Requests made with invalid token
         will receive 401 status code**.
@@ -106,25 +274,354 @@ class CategoryViewSet(ModelViewSet):
         ### Path Parameters:
         - `slug`: The unique slug of the category whose subcategories are to be listed.
 
+        ### Query Parameters:
+        - `depth` (optional): The number of subcategory levels to return. If it is provided, every subcategory
+        contains the list of its own subcategories up to the requested level, all of them are loaded with a
+        single query. If it is not provided, only direct subcategories are returned in pages.
+        - `cursor` (optional): The opaque cursor taken from the `next` or `previous` link of the previous page,
+        used only without `depth`.
+        - `page_size` (optional): The number of subcategories on a page, used only without `depth`.
+
+        ### Responses:
+        - 200: Successfully listed the subcategories of the category. Returns a page of subcategory objects
+        in `results`, or a list of subcategory trees if `depth` is provided.
+        - 304: Not modified. The `If-None-Match` or `If-Modified-Since` header matches the current `ETag` or
+        `Last-Modified` of the response.
+        - 400: Bad request. The query parameters are invalid.
+        - 401: Unauthorized. Trying to make a request with invalid token.
+        - 404: Not found. The requested category does not exist.
+        - *For more information about responses please check response examples in swagger.*
+        """
+
+        query_serializer = SubCategoryQuerySerializer(data=request.query_params)
+        query_serializer.is_valid(raise_exception=True)
+        depth = query_serializer.validated_data.get("depth")
+
+        if depth is None:
+            snapshot = get_category_snapshot()
+            category = self.get_snapshot_object(snapshot)
+            page = self.paginate_queryset(snapshot.get_children(category))
+            serializer = SubCategoryWithCountsSerializer(page, many=True)
+            return self.get_paginated_response(serializer.data)
+
+        category = self.get_object()
+
+        descendants = list(
+            category.get_descendants()
+            .active()
+            .filter(depth__lte=category.depth + depth)
+            .order_by("rank", "id")
+        )
+        serializer = SubCategoryWithCountsSerializer(descendants, many=True)
+        return Response(build_category_tree(descendants, serializer.data))
+
+    @extend_schema(
+        parameters=[CategoryTreeQuerySerializer],
+        responses={
+            200: SubCategorySerializer(many=True),
+            400: SubCategorySerializer,
+            401: SubCategorySerializer,
+            404: SubCategorySerializer,
+        },
+        examples=category_tree_examples(),
+    )
+    @action(detail=False, methods=["GET"], url_name="tree", pagination_class=None)
+    @method_decorator(
+        condition(
+            etag_func=categories_etag, last_modified_func=categories_last_modified
+        )
+    )
+    def tree(self, request, *args, **kwargs):
+        """
+        ## Retrieve the category hierarchy as a tree.
+
+        This endpoint allows users to retrieve the whole category hierarchy, or a part of it, in a single request.
+        Every category contains the list of its own subcategories. Categories are loaded with a single query
+        and the tree is cached until any category is created, updated or deleted.
+        This endpoint can be accessed by **unauthenticated** users or users who do not have
+        **permissions** to **create**, **update**, or **delete** categories. **Requests made with invalid token
+        will receive 401 status code**.
+
+        ### Query Parameters:
+        - `root` (optional): The slug of the category whose subtree should be returned. If it is not provided,
+        all top level categories are returned.
+        - `max_depth` (optional): The number of subcategory levels to include below the top level categories,
+        `0` returns only the top level categories.
+
+        ### Responses:
+        - 200: Successfully retrieved the category tree. Returns a list of categories with nested subcategories.
+        - 304: Not modified. The `If-None-Match` or `If-Modified-Since` header matches the current `ETag` or
+        `Last-Modified` of the response.
+        - 400: Bad request. The query parameters are invalid.
+        - 401: Unauthorized. Trying to make a request with invalid token.
+        - 404: Not found. The requested root category does not exist.
+        - *For more information about responses please check response examples in swagger.*
+        """
+
+        query_serializer = CategoryTreeQuerySerializer(data=request.query_params)
+        query_serializer.is_valid(raise_exception=True)
+        root_slug = query_serializer.validated_data.get("root")
+        max_depth = query_serializer.validated_data.get("max_depth")
+
+        cache_key = category_cache_key("tree", root_slug, max_depth)
+        tree = cache.get(cache_key)
+        if tree is None:
+            categories = self.get_queryset().order_by("rank", "id")
+            top_depth = 0
+            if root_slug is not None:
+                root = get_object_or_404(self.get_queryset(), slug=root_slug)
+                categories = categories.filter(
+                    Q(pk=root.pk) | Q(path__startswith=root.subtree_path)
+                )
+                top_depth = root.depth
+            if max_depth is not None:
+                categories = categories.filter(depth__lte=top_depth + max_depth)
+
+            categories = list(categories)
+            serializer = SubCategorySerializer(categories, many=True)
+            tree = build_category_tree(categories, serializer.data)
+            cache.set(cache_key, tree, CATEGORY_CACHE_TIMEOUT)
+
+        return Response(tree)
+
+    @extend_schema(
+        parameters=[CategoryBatchQuerySerializer],
+        responses={
+            200: CategoryBatchResponseSerializer,
+            400: CategorySerializer,
+            401: CategorySerializer,
+        },
+        examples=category_batch_examples(),
+    )
+    @action(detail=False, methods=["GET"], url_name="batch", pagination_class=None)
+    @method_decorator(
+        condition(
+            etag_func=categories_etag, last_modified_func=categories_last_modified
+        )
+    )
+    @cache_category_response
+    def batch(self, request, *args, **kwargs):
+        """
+        ## Retrieve multiple categories at once.
+
+        This endpoint allows users to retrieve several categories identified by their slugs or ids in a single
+        request. Categories are returned in the order of the requested keys and keys of categories that do
+        not exist are listed in `missing` instead of failing the whole request.
+        This endpoint can be accessed by **unauthenticated** users or users who do not have
+        **permissions** to **create**, **update**, or **delete** categories. **Requests made with invalid token
+        will receive 401 status code**.
+
+        ### Query Parameters:
+        - `slug__in`: Comma separated slugs of the categories, e.g. `phones,laptops`.
+        - `id__in`: Comma separated ids of the categories, e.g. `1,5,3`.
+        - Exactly one of `slug__in` and `id__in` has to be provided.
+        - `fields` (optional): Comma separated names of the fields to return, e.g. `id,name,slug`.
+        - `expand` (optional): `parent` returns the whole parent category instead of its id.
+
         ### Responses:
-        - 200: Successfully listed the subcategories of the category. Returns a list of subcategory objects.
+        - 200: Successfully retrieved the categories. Returns the list of category objects in `results` and
+        the keys that were not found in `missing`.
+        - 304: Not modified. The `If-None-Match` or `If-Modified-Since` header matches the current `ETag` or
+        `Last-Modified` of the response.
+        - 400: Bad request. The query parameters are invalid.
+        - 401: Unauthorized. Trying to make a request with invalid token.
+        - *For more information about responses please check response examples in swagger.*
+        """
+
+        query_serializer = CategoryBatchQuerySerializer(data=request.query_params)
+        query_serializer.is_valid(raise_exception=True)
+        query = query_serializer.validated_data
+
+        # Categories are looked up in the snapshot of this worker instead of the database.
+        snapshot = get_category_snapshot()
+        if "slug__in" in query:
+            keys, index = query.pop("slug__in"), snapshot.by_slug
+        else:
+            keys, index = query.pop("id__in"), snapshot.by_id
+
+        categories = [index[key] for key in keys if key in index]
+        serializer = self.get_serializer(categories, many=True, **query)
+        return Response(
+            {
+                "results": serializer.data,
+                "missing": [key for key in keys if key not in index],
+            }
+        )
+
+    @extend_schema(
+        parameters=[CategoryChangesQuerySerializer],
+        responses={
+            200: CategoryChangesResponseSerializer,
+            400: CategorySerializer,
+            401: CategorySerializer,
+        },
+        examples=category_changes_examples(),
+    )
+    @action(detail=False, methods=["GET"], url_name="changes", pagination_class=None)
+    @method_decorator(
+        condition(
+            etag_func=categories_etag, last_modified_func=categories_last_modified
+        )
+    )
+    @cache_category_response
+    def changes(self, request, *args, **kwargs):
+        """
+        ## List changes of categories for synchronization.
+
+        This endpoint allows clients keeping a local copy of categories to download only the categories that were
+        created, updated or deleted since their last synchronization. Changes are returned from the oldest one
+        in pages, every response contains the token to be sent as `since` in the next request. Deleting a category
+        deletes all of its subcategories as well, so they are not always listed among deleted categories.
+        Changes made shortly before the request are returned again by the next request, as changes of
+        transactions committed later may be older than them, so clients must be ready to receive a change twice.
+        This endpoint can be accessed by **unauthenticated** users or users who do not have
+        **permissions** to **create**, **update**, or **delete** categories. **Requests made with invalid token
+        will receive 401 status code**.
+
+        ### Query Parameters:
+        - `since` (optional): The `next_since` token of the previous response. If it is not provided, all
+        categories are returned from the beginning. Tokens expire once records of deleted categories are removed.
+        - `page_size` (optional): The maximum number of changes in the response, capped at the configured maximum.
+
+        ### Responses:
+        - 200: Successfully listed the changes. Returns created and updated categories in `updated`, ids of
+        deleted categories in `deleted`, the token of the next request in `next_since` and whether there are
+        more changes to download in `has_more`.
+        - 304: Not modified. The `If-None-Match` or `If-Modified-Since` header matches the current `ETag` or
+        `Last-Modified` of the response.
+        - 400: Bad request. The query parameters are invalid or the token has expired.
+        - 401: Unauthorized. Trying to make a request with invalid token.
+        - *For more information about responses please check response examples in swagger.*
+        """
+
+        query_serializer = CategoryChangesQuerySerializer(data=request.query_params)
+        query_serializer.is_valid(raise_exception=True)
+        updated, deleted, position, has_more = get_category_changes(
+            query_serializer.validated_data.get("since"),
+            query_serializer.validated_data.get(
+                "page_size", settings.CATEGORY_PAGE_SIZE
+            ),
+        )
+
+        serializer = self.get_serializer(updated, many=True)
+        return Response(
+            {
+                "updated": serializer.data,
+                "deleted": deleted,
+                "next_since": encode_change_token(position) if position else None,
+                "has_more": has_more,
+            }
+        )
+
+    @extend_schema(
+        parameters=[CategoryExportQuerySerializer],
+        responses={
+            200: OpenApiTypes.BINARY,
+            400: CategoryExportQuerySerializer,
+            401: CategoryExportQuerySerializer,
+            403: CategoryExportQuerySerializer,
+        },
+        examples=category_export_examples(),
+    )
+    @action(detail=False, methods=["GET"], url_name="export")
+    def export(self, request, *args, **kwargs):
+        """
+        ## Export all categories.
+
+        This endpoint allows users to download the whole category catalog as a file. Categories are read from the
+        database in chunks and streamed to the client while they are being read, so the export does not have to fit
+        into the memory of the server.
+
+        ### Query Parameters:
+        - `file_format` (optional): `ndjson` (default) returns one JSON object per line, `csv` returns comma
+        separated values with a header line.
+        - `gzip` (optional): Set to `true` to compress the file with gzip.
+        - `after` (optional): Id of the last category received by an interrupted export. Only categories with
+        greater ids are exported and the CSV header is left out, so the file can be appended to the one received
+        before. Categories are always exported ordered by their id.
+
+        ### Responses:
+        - 200: The categories are streamed as an attachment.
+        - 400: Bad request. The query parameters are invalid.
+        - 401: Unauthorized. Authentication credentials were not provided or are invalid.
+        - 403: Forbidden. The user does not have permission to export categories.
+        - *For more information about responses please check response examples in swagger.*
+        """
+
+        query_serializer = CategoryExportQuerySerializer(data=request.query_params)
+        query_serializer.is_valid(raise_exception=True)
+        export_format = query_serializer.validated_data["file_format"]
+
+        chunks = iter_category_export(
+            export_format,
+            after=query_serializer.validated_data.get("after"),
+            chunk_size=settings.CATEGORY_EXPORT_CHUNK_SIZE,
+        )
+        filename = f"categories.{export_format}"
+        if query_serializer.validated_data["gzip"]:
+            response = StreamingHttpResponse(
+                gzip_stream(chunks), content_type="application/gzip"
+            )
+            filename += ".gz"
+        else:
+            response = StreamingHttpResponse(
+                chunks, content_type=EXPORT_FORMATS[export_format]
+            )
+        response["Content-Disposition"] = f'attachment; filename="{filename}"'
+        return response
+
+    @extend_schema(
+        responses={
+            200: SubCategorySerializer(many=True),
+            401: SubCategorySerializer,
+            404: SubCategorySerializer,
+        },
+        examples=category_ancestors_examples(),
+    )
+    @action(
+        detail=True, methods=["GET"], url_name="ancestors-list", pagination_class=None
+    )
+    def ancestors(self, request, *args, **kwargs):
+        """
+        ## List the ancestors of a category.
+
+        This endpoint allows users to retrieve the breadcrumb trail of an existing category identified by its slug.
+        Returned list is ordered from the top level category down to the requested category, which is the last
+        item of the list. Ancestors are read with a single query regardless of how deep the category is.
+        This endpoint can be accessed by **unauthenticated** users or users who do not have
+        **permissions** to **create**, **update**, or **delete** categories. **Requests made with invalid token
+        will receive 401 status code**.
+
+        ### Path Parameters:
+        - `slug`: The unique slug of the category whose ancestors are to be listed.
+
+        ### Responses:
+        - 200: Successfully listed the ancestors of the category. Returns a list of category objects.
         - 401: Unauthorized. Trying to make a request with invalid token.
         - 404: Not found. The requested category does not exist.
         - *For more information about responses please check response examples in swagger.*
         """
 
-        subcategories = self.get_object().subcategories
-        serializer = SubCategorySerializer(subcategories, many=True)
+        category = self.get_object()
+        breadcrumbs = [*category.get_ancestors(), category]
+        serializer = SubCategorySerializer(breadcrumbs, many=True)
         return Response(serializer.data)
 
     @extend_schema(
+        parameters=[CategoryFieldsQuerySerializer],
         responses={
             200: CategorySerializer,
+            301: None,
+            400: CategorySerializer,
             401: CategorySerializer,
             404: CategorySerializer,
         },
         examples=retrieve_category_examples(),
     )
+    @method_decorator(
+        condition(etag_func=category_etag, last_modified_func=category_last_modified)
+    )
+    @cache_category_response
     def retrieve(self, request, *args, **kwargs):
         """
         ## Retrieve a category.
@@ -137,13 +634,26 @@ class CategoryViewSet(ModelViewSet):
         ### Path Parameters:
         - `slug`: The unique slug of the category to be retrieved.
 
+        ### Query Parameters:
+        - `fields` (optional): Comma separated names of the fields to return, e.g. `id,name,slug`.
+        - `expand` (optional): `parent` returns the whole parent category instead of its id.
+
         ### Responses:
         - 200: The category was successfully retrieved. Returns the details of the category.
+        - 301: Moved permanently. The category was renamed, the `Location` header holds its current URL.
+        - 304: Not modified. The `If-None-Match` or `If-Modified-Since` header matches the current `ETag` or
+        `Last-Modified` of the response.
+        - 400: Bad request. The query parameters are invalid.
         - 401: Unauthorized. Trying to make a request with invalid token.
         - 404: Not found. The requested category does not exist.
         - *For more information about responses please check response examples in swagger.*
         """
-        return super().retrieve(request, *args, **kwargs)
+        snapshot = get_category_snapshot()
+        if self.kwargs[self.lookup_field] not in snapshot.by_slug:
+            return self.redirect_old_slug(request)
+        category = self.get_snapshot_object(snapshot)
+        serializer = self.get_serializer(category, **self.get_fields_query())
+        return Response(serializer.data)
 
     @extend_schema(
         responses={
@@ -165,6 +675,9 @@ class CategoryViewSet(ModelViewSet):
         ### Request body:
         - If creating a **single** category, provide the category data as a JSON object in the request body.
         - If creating **multiple** categories, provide a list of categories as JSON objects in the request body.
+        - `parent_name` (optional): Name of the parent category, used instead of `parent` to place a category
+        under another category created by the same request. Names of existing categories are accepted as well.
+        - All categories are validated together and inserted in bulk, either all of them are created or none.
         - *For more information about requests please check request examples in swagger.*
 
         ### Responses:
@@ -265,8 +778,167 @@ class CategoryViewSet(ModelViewSet):
         return super().partial_update(request, *args, **kwargs)
 
     @extend_schema(
+        request=CategorySerializer(many=True),
         responses={
+            200: CategorySerializer(many=True),
+            400: CategorySerializer,
+            401: CategorySerializer,
+            403: CategorySerializer,
+        },
+        examples=bulk_partial_update_category_examples(),
+    )
+    @action(
+        detail=False,
+        methods=["PATCH"],
+        url_path="bulk",
+        url_name="bulk",
+        pagination_class=None,
+    )
+    def bulk_partial_update(self, request, *args, **kwargs):
+        """
+        ## Partially update multiple categories.
+
+        This endpoint allows users to partially update many existing categories in a single request. Every item
+        identifies the category by its `id` and contains only the fields to be updated.
+
+        ### Circular Relationship Check:
+        New parents of all items are checked together, as if all of them were applied at once. Items whose new
+        parent would create a circular relationship are rejected with 400 Bad request status code.
+
+        ### Request Body:
+        - List of JSON objects, each with the `id` of the category and the fields to be updated.
+        - All items are validated together and either all of them are applied in a single transaction or none.
+        - *For more information about requests please check request examples in swagger.*
+
+        ### Responses:
+        - 200: The categories were successfully updated. Returns the updated categories in the order of the request.
+        - 400: Bad request. Returns the errors of every item in the order of the request, valid items have no errors.
+        - 401: Unauthorized. Authentication credentials were not provided or are invalid.
+        - 403: Forbidden. The user does not have permission to update categories.
+        - *For more information about responses please check response examples in swagger.*
+        """
+
+        serializer = self.get_serializer(
+            self.get_queryset(), data=request.data, many=True, partial=True
+        )
+        serializer.is_valid(raise_exception=True)
+        serializer.save()
+        return Response(serializer.data)
+
+    @extend_schema(
+        request=CategoryMoveSerializer,
+        responses={
+            200: CategoryMoveSerializer,
+            400: CategoryMoveSerializer,
+            401: CategoryMoveSerializer,
+            403: CategoryMoveSerializer,
+            404: CategoryMoveSerializer,
+        },
+        examples=move_category_examples(),
+    )
+    @action(detail=True, methods=["POST"], url_name="move")
+    def move(self, request, *args, **kwargs):
+        """
+        ## Move a category together with all of its subcategories.
+
+        This endpoint allows users to move an existing category identified by its slug, with its whole subtree,
+        under a new parent category. Unlike updating the `parent` field, the category and all of its descendants
+        are moved with set-based updates in a single transaction, so large branches can be moved in one request.
+
+        ### Path Parameters:
+        - `slug`: The unique slug of the category to be moved.
+
+        ### Circular Relationship Check:
+        This endpoint checks once that the new parent is not the category itself or one of its descendants.
+        Such moves are rejected with 400 Bad request status code.
+        Moves that would nest the category or any of its descendants deeper than the maximum depth of categories
+        are rejected as well.
+
+        ### Request Body:
+        - `parent`: The id of the new parent category, or `null` to move the category to the top level.
+        - *For more information about requests please check request examples in swagger.*
+
+        ### Responses:
+        - 200: The category was successfully moved. Returns the number of moved categories, including the category itself.
+        - 400: Bad request. The request body is invalid, or the move would create a circular relationship or
+        nest categories too deep.
+        - 401: Unauthorized. Authentication credentials were not provided or are invalid.
+        - 403: Forbidden. The user does not have permission to move the category.
+        - 404: Not found. The requested category does not exist.
+        - *For more information about responses please check response examples in swagger.*
+        """
+
+        category = self.get_object()
+        serializer = CategoryMoveSerializer(
+            data=request.data, context={"category": category}
+        )
+        serializer.is_valid(raise_exception=True)
+
+        try:
+            moved_count = category.move_to(serializer.validated_data["parent"])
+        except ValueError as error:
+            raise ValidationError({"parent": [str(error)]})
+
+        return Response(
+            {
+                "message": "Category was successfully moved.",
+                "moved_count": moved_count,
+            },
+            status=status.HTTP_200_OK,
+        )
+
+    @extend_schema(
+        request=CategoryReorderSerializer,
+        responses={
+            204: None,
+            400: CategoryReorderSerializer,
+            401: CategoryReorderSerializer,
+            403: CategoryReorderSerializer,
+            404: CategoryReorderSerializer,
+        },
+        examples=reorder_category_examples(),
+    )
+    @action(detail=True, methods=["POST"], url_name="reorder")
+    def reorder(self, request, *args, **kwargs):
+        """
+        ## Change the position of a category among its siblings.
+
+        This endpoint allows users to place an existing category identified by its slug right before or right
+        after another category with the same parent. Subcategories, tree and list endpoints return siblings in
+        this order. Only the row of the reordered category is updated.
+
+        ### Path Parameters:
+        - `slug`: The unique slug of the category to be reordered.
+
+        ### Request Body:
+        - `before`: The id of the sibling the category should be placed before.
+        - `after`: The id of the sibling the category should be placed after.
+        - Exactly one of the fields has to be provided.
+        - *For more information about requests please check request examples in swagger.*
+
+        ### Responses:
+        - 204: The category was successfully reordered. No content in the response body.
+        - 400: Bad request. The request body is invalid or the provided category is not a sibling.
+        - 401: Unauthorized. Authentication credentials were not provided or are invalid.
+        - 403: Forbidden. The user does not have permission to reorder the category.
+        - 404: Not found. The requested category does not exist.
+        - *For more information about responses please check response examples in swagger.*
+        """
+
+        category = self.get_object()
+        serializer = CategoryReorderSerializer(
+            data=request.data, context={"category": category}
+        )
+        serializer.is_valid(raise_exception=True)
+        category.reorder(**serializer.validated_data)
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+    @extend_schema(
+        parameters=[CategoryDeleteQuerySerializer],
+        responses={
+            202: CategoryDeletionSerializer,
             204: None,
+            400: CategorySerializer,
             401: CategorySerializer,
             403: CategorySerializer,
             404: CategorySerializer,
@@ -277,16 +949,273 @@ class CategoryViewSet(ModelViewSet):
         """
         ## Delete an existing category.
 
-        This endpoint allows users to delete an existing category identified by its slug.
+        This endpoint allows users to delete an existing category identified by its slug, together with all
+        of its subcategories.
 
         ### Path Parameters:
         - `slug`: The unique slug of the category to be deleted.
 
+        ### Background Deletion:
+        Categories with large subtrees are not deleted during the request. Instead, the category and all of its
+        descendants are marked for deletion and immediately disappear from all category endpoints, while a
+        background task deletes them from the bottom up in small batches. Response contains the deletion record,
+        its progress can be followed with the `deletions/{id}` endpoint.
+
+        ### Query Parameters:
+        - `background` (optional): Set to `true` to delete the category in the background regardless of the
+        size of its subtree.
+
         ### Responses:
+        - 202: The category was marked for deletion and will be deleted in the background. Returns the deletion record.
         - 204: The category was successfully deleted. No content in the response body.
+        - 400: Bad request. The query parameters are invalid.
         - 401: Unauthorized. Authentication credentials were not provided or are invalid.
         - 403: Forbidden. The user does not have permission to delete the category.
         - 404: Not found. The requested category does not exist.
         - *For more information about responses please check response examples in swagger.*
         """
-        return super().destroy(request, *args, **kwargs)
+
+        query_serializer = CategoryDeleteQuerySerializer(data=request.query_params)
+        query_serializer.is_valid(raise_exception=True)
+        category = self.get_object()
+
+        if not query_serializer.validated_data["background"] and (
+            category.get_descendants().count()
+            <= settings.CATEGORY_BACKGROUND_DELETE_THRESHOLD
+        ):
+            self.perform_destroy(category)
+            return Response(status=status.HTTP_204_NO_CONTENT)
+
+        deletion = category.schedule_deletion()
+        delete_category_subtree.delay(deletion.id)
+        serializer = CategoryDeletionSerializer(deletion)
+        return Response(serializer.data, status=status.HTTP_202_ACCEPTED)
+
+    @extend_schema(
+        request=CategoryBulkDeleteSerializer,
+        parameters=[CategoryDeleteQuerySerializer],
+        responses={
+            200: CategoryBulkDeleteSerializer,
+            202: CategoryBulkDeleteSerializer,
+            400: CategoryBulkDeleteSerializer,
+            401: CategoryBulkDeleteSerializer,
+            403: CategoryBulkDeleteSerializer,
+        },
+        examples=bulk_delete_category_examples(),
+    )
+    @bulk_partial_update.mapping.delete
+    def bulk_destroy(self, request, *args, **kwargs):
+        """
+        ## Delete multiple categories.
+
+        This endpoint allows users to delete many existing categories identified by their slugs or ids, together
+        with all of their subcategories. Categories are looked up with a single query and, unless they are deleted
+        in the background, all of their subtrees are removed with a single set-based delete.
+
+        ### Background Deletion:
+        When the categories have more descendants in total than the background deletion threshold, every requested
+        category is marked for deletion and deleted in the background, as with the delete endpoint. Results contain
+        the ids of the deletion records, their progress can be followed with the `deletions/{id}` endpoint.
+
+        ### Query Parameters:
+        - `background` (optional): Set to `true` to delete the categories in the background regardless of the size
+        of their subtrees.
+
+        ### Request Body:
+        - `slugs`: List of slugs of the categories to be deleted.
+        - `ids`: List of ids of the categories to be deleted.
+        - Exactly one of the fields has to be provided.
+        - *For more information about requests please check request examples in swagger.*
+
+        ### Responses:
+        - 200: The categories were deleted. Returns the result for every requested key, `deleted` or `not_found`.
+        - 202: The categories were marked for deletion and will be deleted in the background. Returns the result for
+        every requested key, `scheduled` with the id of the deletion record or `not_found`.
+        - 400: Bad request. The request body or the query parameters are invalid.
+        - 401: Unauthorized. Authentication credentials were not provided or are invalid.
+        - 403: Forbidden. The user does not have permission to delete categories.
+        - *For more information about responses please check response examples in swagger.*
+        """
+
+        query_serializer = CategoryDeleteQuerySerializer(data=request.query_params)
+        query_serializer.is_valid(raise_exception=True)
+        serializer = CategoryBulkDeleteSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        if "slugs" in serializer.validated_data:
+            key_field, keys = "slug", serializer.validated_data["slugs"]
+        else:
+            key_field, keys = "id", serializer.validated_data["ids"]
+        categories = {
+            getattr(category, key_field): category
+            for category in self.get_queryset()
+            .filter(**{f"{key_field}__in": keys})
+            .only("id", "slug", "name", "path", "descendant_count")
+        }
+
+        # Categories placed below another requested category are deleted together with it.
+        requested_ids = {category.pk for category in categories.values()}
+        roots = [
+            category
+            for category in categories.values()
+            if requested_ids.isdisjoint(category.ancestor_ids)
+        ]
+        background = query_serializer.validated_data["background"] or (
+            sum(1 + category.descendant_count for category in roots)
+            > settings.CATEGORY_BACKGROUND_DELETE_THRESHOLD
+        )
+
+        deletions = {}
+        if background:
+            for category in roots:
+                deletion = category.schedule_deletion()
+                delete_category_subtree.delay(deletion.id)
+                deletions[category.pk] = deletion
+        else:
+            Category.objects.delete_subtrees(
+                roots, batch_size=settings.CATEGORY_BULK_BATCH_SIZE
+            )
+
+        results = []
+        for key in keys:
+            category = categories.get(key)
+            if category is None:
+                results.append({key_field: key, "status": "not_found"})
+            elif background:
+                root_id = next(
+                    pk
+                    for pk in [*category.ancestor_ids, category.pk]
+                    if pk in deletions
+                )
+                results.append(
+                    {
+                        key_field: key,
+                        "status": "scheduled",
+                        "deletion_id": deletions[root_id].id,
+                    }
+                )
+            else:
+                results.append({key_field: key, "status": "deleted"})
+
+        return Response(
+            {"results": results},
+            status=status.HTTP_202_ACCEPTED if background else status.HTTP_200_OK,
+        )
+
+    @extend_schema(
+        responses={
+            200: CategoryDeletionSerializer,
+            401: CategoryDeletionSerializer,
+            403: CategoryDeletionSerializer,
+            404: CategoryDeletionSerializer,
+        },
+        examples=category_deletion_examples(),
+    )
+    @action(
+        detail=False,
+        methods=["GET"],
+        url_path=r"deletions/(?P<deletion_id>[0-9]+)",
+        url_name="deletion-detail",
+    )
+    def deletion(self, request, deletion_id, *args, **kwargs):
+        """
+        ## Retrieve the progress of a background category deletion.
+
+        This endpoint allows users to follow the background deletion of a category subtree started by
+        the delete endpoint.
+
+        ### Path Parameters:
+        - `deletion_id`: The id of the deletion record returned by the delete endpoint.
+
+        ### Responses:
+        - 200: Successfully retrieved the deletion record with its status and the number of deleted categories.
+        - 401: Unauthorized. Authentication credentials were not provided or are invalid.
+        - 403: Forbidden. The user does not have permission to delete categories.
+        - 404: Not found. The requested deletion record does not exist.
+        - *For more information about responses please check response examples in swagger.*
+        """
+
+        deletion = get_object_or_404(CategoryDeletion, pk=deletion_id)
+        serializer = CategoryDeletionSerializer(deletion)
+        return Response(serializer.data)
+
+    @extend_schema(
+        request={"multipart/form-data": CategoryImportSerializer},
+        responses={
+            202: CategoryImportSerializer,
+            400: CategoryImportSerializer,
+            401: CategoryImportSerializer,
+            403: CategoryImportSerializer,
+        },
+        examples=category_import_examples(),
+    )
+    @action(
+        detail=False,
+        methods=["POST"],
+        parser_classes=[MultiPartParser],
+        url_name="import-list",
+    )
+    def imports(self, request, *args, **kwargs):
+        """
+        ## Import categories from a file.
+
+        This endpoint allows users to upload a NDJSON or CSV file of categories, which is imported in the
+        background. Every row has the `name` of a category and optionally its `description` and the `parent_name`
+        of its parent, which can be an existing category or another row of the file. Existing categories with the
+        same names are updated, new ones are created. Rows are written in chunked transactions with parents before
+        their children, the progress and the rejected rows can be followed with the `imports/{id}` endpoint.
+
+        ### Request Body:
+        - `file`: The uploaded file, sent as `multipart/form-data`. Rows of NDJSON files are JSON objects, CSV files
+        have a header with the names of the columns.
+        - `format` (optional): `ndjson` or `csv`, detected from the extension of the file when not provided.
+
+        ### Responses:
+        - 202: The file was uploaded and will be imported in the background. Returns the import record.
+        - 400: Bad request. The file is missing or empty, or the format is invalid.
+        - 401: Unauthorized. Authentication credentials were not provided or are invalid.
+        - 403: Forbidden. The user does not have permission to import categories.
+        - *For more information about responses please check response examples in swagger.*
+        """
+
+        serializer = CategoryImportSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        category_import = serializer.save()
+        import_categories.delay(category_import.id)
+        return Response(serializer.data, status=status.HTTP_202_ACCEPTED)
+
+    @extend_schema(
+        responses={
+            200: CategoryImportSerializer,
+            401: CategoryImportSerializer,
+            403: CategoryImportSerializer,
+            404: CategoryImportSerializer,
+        },
+        examples=category_import_detail_examples(),
+    )
+    @action(
+        detail=False,
+        methods=["GET"],
+        url_path=r"imports/(?P<import_id>[0-9]+)",
+        url_name="import-detail",
+    )
+    def category_import(self, request, import_id, *args, **kwargs):
+        """
+        ## Retrieve the progress of a category import.
+
+        This endpoint allows users to follow an import of categories started by uploading a file.
+
+        ### Path Parameters:
+        - `import_id`: The id of the import record returned by the import endpoint.
+
+        ### Responses:
+        - 200: Successfully retrieved the import record with its status, counts and the first rejected rows.
+        - 401: Unauthorized. Authentication credentials were not provided or are invalid.
+        - 403: Forbidden. The user does not have permission to import categories.
+        - 404: Not found. The requested import record does not exist.
+        - *For more information about responses please check response examples in swagger.*
+        """
+
+        category_import = get_object_or_404(CategoryImport, pk=import_id)
+        serializer = CategoryImportSerializer(category_import)
+        return Response(serializer.data)
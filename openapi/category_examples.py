@@ -18,38 +18,50 @@ def list_category_examples():
         OpenApiExample(
             "Valid example (GET Response)",
             summary="List categories",
-            description="Example of listing categories with a `GET` request.",
-            value=[
-                {
-                    "id": 1,
-                    "name": "Category1",
-                    "slug": "category1",
-                    "description": "Description for Category1",
-                    "image": "category1_image.jpg",
-                    "parent": None,
-                },
-                {
-                    "id": 2,
-                    "name": "Category2",
-                    "slug": "category2",
-                    "description": "Description for Category2",
-                    "image": "category2_image.jpg",
-                    "parent": None,
-                },
-            ],
+            description="Example of a category on the first page of categories listed with a `GET` request. \
+                The `next` link contains the cursor of the following page, it is null on the last page.",
+            value={
+                "id": 1,
+                "name": "Category1",
+                "slug": "category1",
+                "description": "Description for Category1",
+                "image": "category1_image.jpg",
+                "parent": None,
+                "child_count": 0,
+                "descendant_count": 0,
+            },
             response_only=True,
             status_codes=[200],
         ),
         OpenApiExample(
-            "Valid example (GET Response) - Empty list",
-            summary="No categories",
-            description="Example of listing categories when there are no categories in DB.",
-            value=[],
+            "Valid example 5 (GET Response)",
+            summary="Search categories",
+            description="Example of searching categories with `search=lapt` and `fields=id,name,slug` query parameters. \
+                Matching categories are ordered from the best match.",
+            value={"id": 7, "name": "Laptops", "slug": "laptops"},
             response_only=True,
             status_codes=[200],
         ),
         OpenApiExample(
-            "Valid example 3 (Response)",
+            "Valid example 6 (GET Response)",
+            summary="Search categories without words",
+            description="Example of searching categories with `search=%26%26` query parameter.",
+            value={
+                "search": ["Search query must contain at least one letter or digit."]
+            },
+            response_only=True,
+            status_codes=[400],
+        ),
+        OpenApiExample(
+            "Valid example 3 (GET Response)",
+            summary="List categories with unknown fields",
+            description="Example of listing categories with `fields=id,password` query parameter.",
+            value={"fields": ["Unknown fields: password."]},
+            response_only=True,
+            status_codes=[400],
+        ),
+        OpenApiExample(
+            "Valid example 4 (Response)",
             summary="List categories with invalid token",
             description="This example demonstrates the response after trying to list categories with invalid token.",
             value={"detail": "Invalid token."},
@@ -76,7 +88,48 @@ def list_subcategories_examples():
         OpenApiExample(
             "Valid example 1 (GET Response)",
             summary="Retrieve subcategories response",
-            description="Example of retrieving subcategories with `GET` request.",
+            description="Example of retrieving the first page of subcategories with `GET` request and \
+                `page_size=3` query parameter.",
+            value={
+                "next": "http://api.example.org/inventory/categories/category/list_subcategories/?cursor=cD0xJTJDMzE0NTcyOCUyQzQ%3D&page_size=3",
+                "previous": None,
+                "results": [
+                    {
+                        "id": 2,
+                        "name": "First subcategory name",
+                        "slug": "first-subcategory-name",
+                        "description": "Description for first subcategory.",
+                        "image": None,
+                        "child_count": 0,
+                        "descendant_count": 0,
+                    },
+                    {
+                        "id": 3,
+                        "name": "Second subcategory name",
+                        "slug": "second-subcategory-name",
+                        "description": "Description for second subcategory.",
+                        "image": None,
+                        "child_count": 0,
+                        "descendant_count": 0,
+                    },
+                    {
+                        "id": 4,
+                        "name": "Third subcategory name",
+                        "slug": "third-subcategory-name",
+                        "description": "Description for third subcategory.",
+                        "image": None,
+                        "child_count": 0,
+                        "descendant_count": 0,
+                    },
+                ],
+            },
+            response_only=True,
+            status_codes=[200],
+        ),
+        OpenApiExample(
+            "Valid example 2 (GET Response)",
+            summary="Retrieve subcategories with depth",
+            description="Example of retrieving two levels of subcategories with `GET` request and `depth=2` query parameter.",
             value=[
                 {
                     "id": 2,
@@ -84,27 +137,27 @@ def list_subcategories_examples():
                     "slug": "first-subcategory-name",
                     "description": "Description for first subcategory.",
                     "image": None,
-                },
-                {
-                    "id": 3,
-                    "name": "Second subcategory name",
-                    "slug": "second-subcategory-name",
-                    "description": "Description for second subcategory.",
-                    "image": None,
-                },
-                {
-                    "id": 4,
-                    "name": "Third subcategory name",
-                    "slug": "third-subcategory-name",
-                    "description": "Description for third subcategory.",
-                    "image": None,
+                    "child_count": 1,
+                    "descendant_count": 3,
+                    "subcategories": [
+                        {
+                            "id": 5,
+                            "name": "Nested subcategory name",
+                            "slug": "nested-subcategory-name",
+                            "description": "Description for nested subcategory.",
+                            "image": None,
+                            "child_count": 2,
+                            "descendant_count": 2,
+                            "subcategories": [],
+                        },
+                    ],
                 },
             ],
             response_only=True,
             status_codes=[200],
         ),
         OpenApiExample(
-            "Valid example 2 (GET Response)",
+            "Valid example 3 (GET Response)",
             summary="No subcategories",
             description="Example of retrieving subcategories of a category that has no subcategories.",
             value=[],
@@ -112,7 +165,15 @@ def list_subcategories_examples():
             status_codes=[200],
         ),
         OpenApiExample(
-            "Valid example 3 (Response)",
+            "Valid example 4 (GET Response)",
+            summary="Invalid query parameters",
+            description="Example of retrieving subcategories with invalid `depth` query parameter.",
+            value={"depth": ["Ensure this value is greater than or equal to 1."]},
+            response_only=True,
+            status_codes=[400],
+        ),
+        OpenApiExample(
+            "Valid example 5 (Response)",
             summary="Retrieving subcategories with invalid token",
             description="This example demonstrates the response after trying to retrieve a category with invalid token.",
             value={"detail": "Invalid token."},
@@ -120,7 +181,7 @@ def list_subcategories_examples():
             status_codes=[401],
         ),
         OpenApiExample(
-            "Valid example 4 (GET Response)",
+            "Valid example 6 (GET Response)",
             summary="Retrieve subcategories of non-existing category",
             description="Example of retrieving subcategories of category that does not exist.",
             value={"detail": "Not found."},
@@ -130,47 +191,65 @@ def list_subcategories_examples():
     ]
 
 
-def retrieve_category_examples():
+def category_tree_examples():
     """
-    Provides examples for retrieving a category.
+    Provides examples for retrieving the category tree.
 
     Returns:
-        List[OpenApiExample]: A list of response examples for retrieving a category.
+        List[OpenApiExample]: A list of response examples for retrieving the category tree.
 
     Example Usage:
-        @extend_schema(examples=retrieve_category_examples())
-        def retrieve(self, request, *args, **kwargs):
+        @extend_schema(examples=category_tree_examples())
+        def tree(self, request, *args, **kwargs):
             pass
     """
 
     return [
         OpenApiExample(
             "Valid example 1 (GET Response)",
-            summary="Retrieve category",
-            description="Example of retrieving a category with `GET` request.",
+            summary="Retrieve category tree",
+            description="Example of a top level category of the category tree retrieved with `GET` request, \
+                every category contains its subcategories.",
             value={
                 "id": 1,
-                "name": "Some Category",
-                "slug": "some-category",
-                "description": "Description for the category",
-                "image": "category_image.jpg",
-                "parent": None,
+                "name": "Electronics",
+                "slug": "electronics",
+                "description": "Description for electronics.",
+                "image": None,
+                "subcategories": [
+                    {
+                        "id": 2,
+                        "name": "Mobile Phones",
+                        "slug": "mobile-phones",
+                        "description": "Description for mobile phones.",
+                        "image": None,
+                        "subcategories": [],
+                    },
+                ],
             },
             response_only=True,
             status_codes=[200],
         ),
         OpenApiExample(
-            "Valid example 2 (Response)",
-            summary="Retrieving category with invalid token",
-            description="This example demonstrates the response after trying to retrieve a category with invalid token.",
+            "Valid example 2 (GET Response)",
+            summary="Invalid query parameters",
+            description="Example of retrieving the category tree with invalid `max_depth` query parameter.",
+            value={"max_depth": ["A valid integer is required."]},
+            response_only=True,
+            status_codes=[400],
+        ),
+        OpenApiExample(
+            "Valid example 3 (Response)",
+            summary="Retrieving category tree with invalid token",
+            description="This example demonstrates the response after trying to retrieve the category tree with invalid token.",
             value={"detail": "Invalid token."},
             response_only=True,
             status_codes=[401],
         ),
         OpenApiExample(
-            "Valid example 3 (GET Response)",
-            summary="Retrieve non-existing category",
-            description="Example of retrieving a category that does not exist.",
+            "Valid example 4 (GET Response)",
+            summary="Retrieve tree of non-existing root category",
+            description="Example of retrieving the category tree with `root` category that does not exist.",
             value={"detail": "Not found."},
             response_only=True,
             status_codes=[404],
@@ -178,206 +257,669 @@ def retrieve_category_examples():
     ]
 
 
-def create_category_examples():
+def category_ancestors_examples():
     """
-    Provides examples for creating categories.
+    Provides examples for listing ancestors of a category.
 
     Returns:
-        List[OpenApiExample]: A list of request/response examples for creating categories.
+        List[OpenApiExample]: A list of response examples for listing ancestors of a category.
 
     Example Usage:
-        @extend_schema(examples=create_category_examples())
-        def create(self, request, *args, **kwargs):
+        @extend_schema(examples=category_ancestors_examples())
+        def ancestors(self, request, *args, **kwargs):
             pass
     """
 
     return [
         OpenApiExample(
-            "Valid example 1 (Request)",
-            summary="Creating multiple categories",
-            description="This example demonstrates how to create multiple categories in a single request.",
-            value=[
-                {
-                    "name": "Category1",
-                    "description": "Description for Category1",
-                    "image": None,
-                    "parent": None,
-                },
-                {
-                    "name": "Category2",
-                    "description": "Description for Category2",
-                    "image": None,
-                    "parent": None,
-                },
-            ],
-            request_only=True,
-        ),
-        OpenApiExample(
-            "Valid example 2 (Request)",
-            summary="Creating single category",
-            description="This example demonstrates how to create a single category in a request.",
+            "Valid example 1 (GET Response)",
+            summary="List ancestors response",
+            description="Example of an ancestor of a category listed with `GET` request. Ancestors are \
+                listed from the top level category down to the parent of the category.",
             value={
-                "name": "Category1",
-                "description": "Description for Category1",
+                "id": 1,
+                "name": "Electronics",
+                "slug": "electronics",
+                "description": "Description for electronics.",
                 "image": None,
-                "parent": None,
             },
-            request_only=True,
-        ),
-        OpenApiExample(
-            "Valid example 1 (Response)",
-            summary="Response after creating multiple categories",
-            description="This example demonstrates the response after successfully creating multiple categories.",
-            value=[
-                {
-                    "id": 1,
-                    "name": "Category1",
-                    "slug": "category1",
-                    "description": "Description for Category1",
-                    "image": None,
-                    "parent": None,
-                },
-                {
-                    "id": 2,
-                    "name": "Category2",
-                    "slug": "category2",
-                    "description": "Description for Category2",
-                    "image": None,
-                    "parent": None,
-                },
-            ],
             response_only=True,
+            status_codes=[200],
         ),
         OpenApiExample(
             "Valid example 2 (Response)",
-            summary="Response after category creation",
-            description="This example demonstrates the response after successfully creating a single category.",
-            value=[
-                {
-                    "id": 1,
-                    "name": "Category1",
-                    "description": "Description for Category1",
-                    "image": None,
-                    "parent": None,
-                }
-            ],
-            response_only=True,
-        ),
-        OpenApiExample(
-            "Valid example 3 (Response)",
-            summary="Creating category with invalid data",
-            description="Example of response for creating a category with invalid data.",
-            value=[
-                {"name": ["This field may not be blank."]},
-                {"name": ["Ensure this field has no more than 128 characters."]},
-                {
-                    "image": [
-                        "The submitted data was not a file. Check the encoding type on the form."
-                    ],
-                },
-                {"parent": ["Incorrect type. Expected pk value, received str."]},
-                {"parent": ['Invalid pk "99999" - object does not exist.']},
-            ],
+            summary="Listing ancestors with invalid token",
+            description="This example demonstrates the response after trying to list ancestors of a category with invalid token.",
+            value={"detail": "Invalid token."},
             response_only=True,
-            status_codes=[400],
+            status_codes=[401],
         ),
         OpenApiExample(
-            "Valid example 4 (Response)",
-            summary="Creating category with missing fields",
-            description="Example of response for creating a category with missing fields.",
-            value={"name": ["This field is required."]},
+            "Valid example 3 (GET Response)",
+            summary="List ancestors of non-existing category",
+            description="Example of listing ancestors of category that does not exist.",
+            value={"detail": "Not found."},
             response_only=True,
-            status_codes=[400],
+            status_codes=[404],
         ),
+    ]
+
+
+def category_batch_examples():
+    """
+    Provides examples for retrieving multiple categories at once.
+
+    Returns:
+        List[OpenApiExample]: A list of response examples for retrieving multiple categories.
+
+    Example Usage:
+        @extend_schema(examples=category_batch_examples())
+        def batch(self, request, *args, **kwargs):
+            pass
+    """
+
+    return [
         OpenApiExample(
-            "Valid example 5 (Response)",
-            summary="Creating category that already exists",
-            description="Example of response for creating a category that already exists.",
-            value={"name": ["category with this name already exists."]},
+            "Valid example 1 (GET Response)",
+            summary="Retrieve categories by slugs",
+            description="Example of retrieving categories with `GET` request and \
+                `slug__in=laptops,tablets,phones&fields=id,name,slug` query parameters, when `tablets` does not exist.",
+            value={
+                "results": [
+                    {"id": 3, "name": "Laptops", "slug": "laptops"},
+                    {"id": 2, "name": "Phones", "slug": "phones"},
+                ],
+                "missing": ["tablets"],
+            },
             response_only=True,
-            status_codes=[400],
+            status_codes=[200],
         ),
         OpenApiExample(
-            "Valid example 6 (Response)",
-            summary="Creating category with special characters",
-            description="Example of response for creating a category with special characters.",
-            value={"name": ["Category name cannot contain special characters."]},
+            "Valid example 2 (GET Response)",
+            summary="Retrieve categories without keys",
+            description="Example of retrieving categories with `GET` request without `slug__in` and `id__in` parameters.",
+            value={
+                "non_field_errors": [
+                    "Provide exactly one of 'slug__in' and 'id__in' parameters."
+                ]
+            },
             response_only=True,
             status_codes=[400],
         ),
         OpenApiExample(
-            "Valid example 7 (Response)",
-            summary="Creating category with unauthenticated user",
-            description="This example demonstrates the response after trying to create a category while unauthenticated.",
-            value={"detail": "Authentication credentials were not provided."},
-            response_only=True,
-            status_codes=[401],
-        ),
-        OpenApiExample(
-            "Valid example 8 (Response)",
-            summary="Creating category with invalid token",
-            description="This example demonstrates the response after trying to create a category with invalid token.",
+            "Valid example 3 (Response)",
+            summary="Retrieving categories with invalid token",
+            description="This example demonstrates the response after trying to retrieve categories with invalid token.",
             value={"detail": "Invalid token."},
             response_only=True,
             status_codes=[401],
         ),
-        OpenApiExample(
-            "Valid example 9 (Response)",
-            summary="Creating category with insufficient permissions",
-            description="This example demonstrates the response after trying to create a category with an user \
-                that does not have necessary permissions.",
-            value={"detail": "You do not have permission to perform this action."},
-            response_only=True,
-            status_codes=[403],
-        ),
     ]
 
 
-def update_category_examples():
+def category_changes_examples():
     """
-    Provides examples for updating categories.
+    Provides examples for listing changes of categories.
 
     Returns:
-        List[OpenApiExample]: A list of request/response examples for updating categories with `PUT` request.
+        List[OpenApiExample]: A list of response examples for listing changes of categories.
 
     Example Usage:
-        @extend_schema(examples=update_category_examples())
-        def update(self, request, *args, **kwargs):
+        @extend_schema(examples=category_changes_examples())
+        def changes(self, request, *args, **kwargs):
             pass
     """
 
     return [
         OpenApiExample(
-            "Valid example (PUT Request)",
-            summary="Update category",
-            description="Example of updating a category with `PUT` request.",
+            "Valid example 1 (GET Response)",
+            summary="List changes since the last synchronization",
+            description="Example of listing changes of categories with `GET` request and `since` query parameter.",
             value={
-                "name": "Updated Category",
-                "description": "Updated description for the category",
-                "image": "updated_image.jpg",
-                "parent": 1,
+                "updated": [
+                    {
+                        "id": 4,
+                        "name": "Tablets",
+                        "slug": "tablets",
+                        "description": "Description for Tablets",
+                        "image": None,
+                        "parent": 1,
+                        "child_count": 0,
+                        "descendant_count": 0,
+                    }
+                ],
+                "deleted": [2, 3],
+                "next_since": "MTc2MDY3NjUwMDAwMDAwMC4wLjQ=",
+                "has_more": False,
             },
-            request_only=True,
+            response_only=True,
+            status_codes=[200],
         ),
         OpenApiExample(
-            "Valid example 1 (PUT Response)",
-            summary="Update category response",
-            description="Example of response for successfully updating a category.",
+            "Valid example 2 (GET Response)",
+            summary="List changes with expired token",
+            description="Example of listing changes of categories with a token older than the retention of deleted categories.",
+            value={
+                "since": [
+                    "The token has expired, synchronize all categories again without it."
+                ]
+            },
+            response_only=True,
+            status_codes=[400],
+        ),
+        OpenApiExample(
+            "Valid example 3 (Response)",
+            summary="Listing changes with invalid token",
+            description="This example demonstrates the response after trying to list changes with invalid token.",
+            value={"detail": "Invalid token."},
+            response_only=True,
+            status_codes=[401],
+        ),
+    ]
+
+
+def category_export_examples():
+    """
+    Provides examples for exporting all categories.
+
+    Returns:
+        List[OpenApiExample]: A list of response examples for exporting categories.
+
+    Example Usage:
+        @extend_schema(examples=category_export_examples())
+        def export(self, request, *args, **kwargs):
+            pass
+    """
+
+    return [
+        OpenApiExample(
+            "Valid example 1 (GET Response)",
+            summary="Categories exported as NDJSON",
+            description="Example of response for exporting categories as NDJSON, one category per line.",
+            value='{"id": 1, "name": "Category1", "slug": "category1", "description": "Description for Category1", \
+"image": "", "parent": null, "child_count": 1, "descendant_count": 1}\n\
+{"id": 2, "name": "Subcategory1", "slug": "subcategory1", "description": null, "image": "", "parent": 1, \
+"child_count": 0, "descendant_count": 0}\n',
+            response_only=True,
+            status_codes=[200],
+        ),
+        OpenApiExample(
+            "Valid example 2 (GET Response)",
+            summary="Categories exported as CSV",
+            description="Example of response for exporting categories as CSV with `file_format=csv`.",
+            value="id,name,slug,description,image,parent,child_count,descendant_count\r\n\
+1,Category1,category1,Description for Category1,,,1,1\r\n\
+2,Subcategory1,subcategory1,,,1,0,0\r\n",
+            response_only=True,
+            status_codes=[200],
+        ),
+        OpenApiExample(
+            "Valid example 3 (GET Response)",
+            summary="Exporting categories with invalid format",
+            description="Example of response for exporting categories in a format that is not supported.",
+            value={"file_format": ['"xml" is not a valid choice.']},
+            response_only=True,
+            status_codes=[400],
+        ),
+        OpenApiExample(
+            "Valid example 4 (Response)",
+            summary="Exporting categories without authentication",
+            description="This example demonstrates the response after trying to export categories without authentication.",
+            value={"detail": "Authentication credentials were not provided."},
+            response_only=True,
+            status_codes=[401],
+        ),
+        OpenApiExample(
+            "Valid example 5 (Response)",
+            summary="Exporting categories without permissions",
+            description="This example demonstrates the response after trying to export categories without permissions.",
+            value={"detail": "You do not have permission to perform this action."},
+            response_only=True,
+            status_codes=[403],
+        ),
+    ]
+
+
+def retrieve_category_examples():
+    """
+    Provides examples for retrieving a category.
+
+    Returns:
+        List[OpenApiExample]: A list of response examples for retrieving a category.
+
+    Example Usage:
+        @extend_schema(examples=retrieve_category_examples())
+        def retrieve(self, request, *args, **kwargs):
+            pass
+    """
+
+    return [
+        OpenApiExample(
+            "Valid example 1 (GET Response)",
+            summary="Retrieve category",
+            description="Example of retrieving a category with `GET` request.",
+            value={
+                "id": 1,
+                "name": "Some Category",
+                "slug": "some-category",
+                "description": "Description for the category",
+                "image": "category_image.jpg",
+                "parent": None,
+                "child_count": 0,
+                "descendant_count": 0,
+            },
+            response_only=True,
+            status_codes=[200],
+        ),
+        OpenApiExample(
+            "Valid example 2 (GET Response)",
+            summary="Retrieve category with selected fields",
+            description="Example of retrieving only some fields of a category with `GET` request and \
+                `fields=id,name,slug` query parameter.",
+            value={"id": 1, "name": "Some Category", "slug": "some-category"},
+            response_only=True,
+            status_codes=[200],
+        ),
+        OpenApiExample(
+            "Valid example 3 (GET Response)",
+            summary="Retrieve category with expanded parent",
+            description="Example of retrieving a category with `GET` request and `expand=parent` query parameter.",
+            value={
+                "id": 2,
+                "name": "Some Subcategory",
+                "slug": "some-subcategory",
+                "description": "Description for the subcategory",
+                "image": None,
+                "parent": {
+                    "id": 1,
+                    "name": "Some Category",
+                    "slug": "some-category",
+                    "description": "Description for the category",
+                    "image": "category_image.jpg",
+                },
+                "child_count": 0,
+                "descendant_count": 0,
+            },
+            response_only=True,
+            status_codes=[200],
+        ),
+        OpenApiExample(
+            "Valid example 4 (Response)",
+            summary="Retrieving category with invalid token",
+            description="This example demonstrates the response after trying to retrieve a category with invalid token.",
+            value={"detail": "Invalid token."},
+            response_only=True,
+            status_codes=[401],
+        ),
+        OpenApiExample(
+            "Valid example 5 (GET Response)",
+            summary="Retrieve non-existing category",
+            description="Example of retrieving a category that does not exist.",
+            value={"detail": "Not found."},
+            response_only=True,
+            status_codes=[404],
+        ),
+    ]
+
+
+def create_category_examples():
+    """
+    Provides examples for creating categories.
+
+    Returns:
+        List[OpenApiExample]: A list of request/response examples for creating categories.
+
+    Example Usage:
+        @extend_schema(examples=create_category_examples())
+        def create(self, request, *args, **kwargs):
+            pass
+    """
+
+    return [
+        OpenApiExample(
+            "Valid example 1 (Request)",
+            summary="Creating multiple categories",
+            description="This example demonstrates how to create multiple categories in a single request.",
+            value=[
+                {
+                    "name": "Category1",
+                    "description": "Description for Category1",
+                    "image": None,
+                    "parent": None,
+                },
+                {
+                    "name": "Category2",
+                    "description": "Description for Category2",
+                    "image": None,
+                    "parent": None,
+                },
+            ],
+            request_only=True,
+        ),
+        OpenApiExample(
+            "Valid example 2 (Request)",
+            summary="Creating single category",
+            description="This example demonstrates how to create a single category in a request.",
+            value={
+                "name": "Category1",
+                "description": "Description for Category1",
+                "image": None,
+                "parent": None,
+            },
+            request_only=True,
+        ),
+        OpenApiExample(
+            "Valid example 3 (Request)",
+            summary="Creating categories with subcategories",
+            description="This example demonstrates how to create categories together with their subcategories, \
+                referencing parents created by the same request with `parent_name`.",
+            value=[
+                {"name": "Electronics", "description": "Electronic devices"},
+                {"name": "Laptops", "parent_name": "Electronics"},
+                {"name": "Gaming Laptops", "parent_name": "Laptops"},
+                {"name": "Phones", "parent": 1},
+            ],
+            request_only=True,
+        ),
+        OpenApiExample(
+            "Valid example 1 (Response)",
+            summary="Response after creating multiple categories",
+            description="This example demonstrates the response after successfully creating multiple categories.",
+            value=[
+                {
+                    "id": 1,
+                    "name": "Category1",
+                    "slug": "category1",
+                    "description": "Description for Category1",
+                    "image": None,
+                    "parent": None,
+                },
+                {
+                    "id": 2,
+                    "name": "Category2",
+                    "slug": "category2",
+                    "description": "Description for Category2",
+                    "image": None,
+                    "parent": None,
+                },
+            ],
+            response_only=True,
+        ),
+        OpenApiExample(
+            "Valid example 2 (Response)",
+            summary="Response after category creation",
+            description="This example demonstrates the response after successfully creating a single category.",
+            value=[
+                {
+                    "id": 1,
+                    "name": "Category1",
+                    "description": "Description for Category1",
+                    "image": None,
+                    "parent": None,
+                }
+            ],
+            response_only=True,
+        ),
+        OpenApiExample(
+            "Valid example 3 (Response)",
+            summary="Creating category with invalid data",
+            description="Example of response for creating a category with invalid data.",
+            value=[
+                {"name": ["This field may not be blank."]},
+                {"name": ["Ensure this field has no more than 128 characters."]},
+                {
+                    "image": [
+                        "The submitted data was not a file. Check the encoding type on the form."
+                    ],
+                },
+                {"parent": ["A valid integer is required."]},
+                {"parent": ['Invalid pk "99999" - object does not exist.']},
+                {"parent_name": ['Category with name "Unknown" does not exist.']},
+                {"parent_name": ["This change would create a circular relationship."]},
+            ],
+            response_only=True,
+            status_codes=[400],
+        ),
+        OpenApiExample(
+            "Valid example 4 (Response)",
+            summary="Creating category with missing fields",
+            description="Example of response for creating a category with missing fields.",
+            value={"name": ["This field is required."]},
+            response_only=True,
+            status_codes=[400],
+        ),
+        OpenApiExample(
+            "Valid example 5 (Response)",
+            summary="Creating category that already exists",
+            description="Example of response for creating a category that already exists.",
+            value={"name": ["category with this name already exists."]},
+            response_only=True,
+            status_codes=[400],
+        ),
+        OpenApiExample(
+            "Valid example 6 (Response)",
+            summary="Creating category with special characters",
+            description="Example of response for creating a category with special characters.",
+            value={"name": ["Category name cannot contain special characters."]},
+            response_only=True,
+            status_codes=[400],
+        ),
+        OpenApiExample(
+            "Valid example 7 (Response)",
+            summary="Creating category with unauthenticated user",
+            description="This example demonstrates the response after trying to create a category while unauthenticated.",
+            value={"detail": "Authentication credentials were not provided."},
+            response_only=True,
+            status_codes=[401],
+        ),
+        OpenApiExample(
+            "Valid example 8 (Response)",
+            summary="Creating category with invalid token",
+            description="This example demonstrates the response after trying to create a category with invalid token.",
+            value={"detail": "Invalid token."},
+            response_only=True,
+            status_codes=[401],
+        ),
+        OpenApiExample(
+            "Valid example 9 (Response)",
+            summary="Creating category with insufficient permissions",
+            description="This example demonstrates the response after trying to create a category with an user \
+                that does not have necessary permissions.",
+            value={"detail": "You do not have permission to perform this action."},
+            response_only=True,
+            status_codes=[403],
+        ),
+    ]
+
+
+def update_category_examples():
+    """
+    Provides examples for updating categories.
+
+    Returns:
+        List[OpenApiExample]: A list of request/response examples for updating categories with `PUT` request.
+
+    Example Usage:
+        @extend_schema(examples=update_category_examples())
+        def update(self, request, *args, **kwargs):
+            pass
+    """
+
+    return [
+        OpenApiExample(
+            "Valid example (PUT Request)",
+            summary="Update category",
+            description="Example of updating a category with `PUT` request.",
+            value={
+                "name": "Updated Category",
+                "description": "Updated description for the category",
+                "image": "updated_image.jpg",
+                "parent": 1,
+            },
+            request_only=True,
+        ),
+        OpenApiExample(
+            "Valid example 1 (PUT Response)",
+            summary="Update category response",
+            description="Example of response for successfully updating a category.",
+            value={
+                "id": 2,
+                "name": "Updated Category",
+                "slug": "updated-category",
+                "description": "Updated description for the category",
+                "image": "updated_image.jpg",
+                "parent": 1,
+            },
+            response_only=True,
+            status_codes=[200],
+        ),
+        OpenApiExample(
+            "Valid example 2 (PUT Response)",
+            summary="Update category with invalid data",
+            description="Example of response for updating a category with invalid data.",
+            value={
+                "name": ["Ensure this field has no more than 128 characters."],
+                "image": [
+                    "The submitted data was not a file. Check the encoding type on the form."
+                ],
+                "parent": ["Incorrect type. Expected pk value, received str."],
+            },
+            response_only=True,
+            status_codes=[400],
+        ),
+        OpenApiExample(
+            "Valid example 3 (PUT Response)",
+            summary="Update category with missing fields",
+            description="Example of response for updating a category with missing fields.",
+            value={
+                "name": ["This field is required."],
+            },
+            response_only=True,
+            status_codes=[400],
+        ),
+        OpenApiExample(
+            "Valid example 4 (PUT Response)",
+            summary="Updating category name with category name that already exists",
+            description="Example of response for updating a category name field with value that already exists.",
+            value={"name": ["category with this name already exists."]},
+            response_only=True,
+            status_codes=[400],
+        ),
+        OpenApiExample(
+            "Valid example 5 (PUT Response)",
+            summary="Updating category parent with its own id.",
+            description="Example of response for updating a category parent field with its own primary key value.",
+            value={"parent": ["A category cannot be its own parent."]},
+            response_only=True,
+            status_codes=[400],
+        ),
+        OpenApiExample(
+            "Valid example 6 (PUT Response)",
+            summary="Updating category name with parent that does not exist",
+            description="Example of response for updating a category parent field with value that does not exist.",
+            value={"parent": ['Invalid pk "99999" - object does not exist.']},
+            response_only=True,
+            status_codes=[400],
+        ),
+        OpenApiExample(
+            "Valid example 7 (PUT Response)",
+            summary="Updating category name with special characters",
+            description="Example of response for updating category with special characters.",
+            value={"name": ["Category name cannot contain special characters."]},
+            response_only=True,
+            status_codes=[400],
+        ),
+        OpenApiExample(
+            "Valid example 8 (PUT Response)",
+            summary="Updating category name with circular relationship",
+            description="An example of a scenario when the user tries to make a subcategory, parent of its parent, \
+            thus creating a circular relationship. (e.g. `A` is the parent of `B` and the user tries to make `B` the parent of `A`)",
+            value={
+                "non_field_errors": [
+                    "This change would create a circular relationship."
+                ]
+            },
+            response_only=True,
+            status_codes=[400],
+        ),
+        OpenApiExample(
+            "Valid example 9 (PUT Response)",
+            summary="Updating category with unauthenticated user",
+            description="This example demonstrates the response after trying to update a category while unauthenticated.",
+            value={"detail": "Authentication credentials were not provided."},
+            response_only=True,
+            status_codes=[401],
+        ),
+        OpenApiExample(
+            "Valid example 10 (PUT Response)",
+            summary="Updating category with invalid token",
+            description="This example demonstrates the response after trying to update a category with invalid token.",
+            value={"detail": "Invalid token."},
+            response_only=True,
+            status_codes=[401],
+        ),
+        OpenApiExample(
+            "Valid example 11 (PUT Response)",
+            summary="Updating category with insufficient permissions",
+            description="This example demonstrates the response after trying to update a category with an user \
+                that does not have necessary permissions.",
+            value={"detail": "You do not have permission to perform this action."},
+            response_only=True,
+            status_codes=[403],
+        ),
+        OpenApiExample(
+            "Valid example 12 (PUT Response)",
+            summary="Updating category that does not exist",
+            description="This example demonstrates the response after trying to update a category that does not exist.",
+            value={"detail": "Not found."},
+            response_only=True,
+            status_codes=[404],
+        ),
+    ]
+
+
+def partial_update_category_examples():
+    """
+    Provides examples for partially updating categories.
+
+    Returns:
+        List[OpenApiExample]: A list of request/response examples for partially updating categories with `PATCH` request.
+
+    Example Usage:
+        @extend_schema(examples=partial_update_category_examples())
+        def partial_update(self, request, *args, **kwargs):
+            pass
+    """
+
+    return [
+        OpenApiExample(
+            "Valid example 1 (PATCH Request)",
+            summary="Update category partially",
+            description="Example of partially updating a category with `PATCH` request.",
             value={
-                "id": 2,
-                "name": "Updated Category",
-                "slug": "updated-category",
                 "description": "Updated description for the category",
-                "image": "updated_image.jpg",
-                "parent": 1,
+            },
+            request_only=True,
+        ),
+        OpenApiExample(
+            "Valid example 1 (PATCH Response)",
+            summary="Partially updated category response",
+            description="Example of response for partially updating a category.",
+            value={
+                "id": 1,
+                "name": "Some Category",
+                "slug": "some-category",
+                "description": "Updated description for the category",
+                "image": None,
+                "parent": None,
             },
             response_only=True,
             status_codes=[200],
         ),
         OpenApiExample(
-            "Valid example 2 (PUT Response)",
-            summary="Update category with invalid data",
-            description="Example of response for updating a category with invalid data.",
+            "Valid example 2 (PATCH Response)",
+            summary="Partial update category with invalid data",
+            description="Example of response for partially updating a category with invalid data.",
             value={
                 "name": ["Ensure this field has no more than 128 characters."],
                 "image": [
@@ -389,9 +931,9 @@ def update_category_examples():
             status_codes=[400],
         ),
         OpenApiExample(
-            "Valid example 3 (PUT Response)",
-            summary="Update category with missing fields",
-            description="Example of response for updating a category with missing fields.",
+            "Valid example 3 (PATCH Response)",
+            summary="Partial update category with missing fields",
+            description="Example of response for partially updating a category with missing fields.",
             value={
                 "name": ["This field is required."],
             },
@@ -399,79 +941,368 @@ def update_category_examples():
             status_codes=[400],
         ),
         OpenApiExample(
-            "Valid example 4 (PUT Response)",
-            summary="Updating category name with category name that already exists",
+            "Valid example 4 (PATCH Response)",
+            summary="Partially updating category name with category name that already exists",
             description="Example of response for updating a category name field with value that already exists.",
             value={"name": ["category with this name already exists."]},
             response_only=True,
             status_codes=[400],
         ),
         OpenApiExample(
-            "Valid example 5 (PUT Response)",
-            summary="Updating category parent with its own id.",
-            description="Example of response for updating a category parent field with its own primary key value.",
+            "Valid example 5 (PATCH Response)",
+            summary="Partially updating category parent with its own id.",
+            description="Example of response for partially updating a category parent field with its own primary key value.",
             value={"parent": ["A category cannot be its own parent."]},
             response_only=True,
             status_codes=[400],
         ),
         OpenApiExample(
-            "Valid example 6 (PUT Response)",
-            summary="Updating category name with parent that does not exist",
-            description="Example of response for updating a category parent field with value that does not exist.",
+            "Valid example 6 (PATCH Response)",
+            summary="Partially updating category name with parent that does not exist",
+            description="Example of response for partially updating a category parent field with value that does not exist.",
             value={"parent": ['Invalid pk "99999" - object does not exist.']},
             response_only=True,
-            status_codes=[400],
+            status_codes=[400],
+        ),
+        OpenApiExample(
+            "Valid example 7 (PATCH Response)",
+            summary="Partially updating category name with special characters",
+            description="Example of response for partially updating category with special characters.",
+            value={"name": ["Category name cannot contain special characters."]},
+            response_only=True,
+            status_codes=[400],
+        ),
+        OpenApiExample(
+            "Valid example 8 (PATCH Response)",
+            summary="Partially updating category name with circular relationship",
+            description="An example of a scenario when the user tries to make a subcategory, parent of its parent, \
+            thus creating a circular relationship. (e.g. `A` is the parent of `B` and the user tries to make `B` the parent of `A`)",
+            value={
+                "non_field_errors": [
+                    "This change would create a circular relationship."
+                ]
+            },
+            response_only=True,
+            status_codes=[400],
+        ),
+        OpenApiExample(
+            "Valid example 9 (PATCH Response)",
+            summary="Partially updating category with unauthenticated user",
+            description="This example demonstrates the response after trying to partially update a category while unauthenticated.",
+            value={"detail": "Authentication credentials were not provided."},
+            response_only=True,
+            status_codes=[401],
+        ),
+        OpenApiExample(
+            "Valid example 10 (PATCH Response)",
+            summary="Partially updating category with invalid token",
+            description="This example demonstrates the response after trying to partially update a category with invalid token.",
+            value={"detail": "Invalid token."},
+            response_only=True,
+            status_codes=[401],
+        ),
+        OpenApiExample(
+            "Valid example 11 (PATCH Response)",
+            summary="Partially updating category with insufficient permissions",
+            description="This example demonstrates the response after trying to partially update a category with an user that does not have necessary permissions.",
+            value={"detail": "You do not have permission to perform this action."},
+            response_only=True,
+            status_codes=[403],
+        ),
+        OpenApiExample(
+            "Valid example 12 (PATCH Response)",
+            summary="Partially updating category that does not exist",
+            description="This example demonstrates the response after trying to partially update a category that does not exist.",
+            value={"detail": "Not found."},
+            response_only=True,
+            status_codes=[404],
+        ),
+    ]
+
+
+def bulk_partial_update_category_examples():
+    """
+    Provides examples for partially updating multiple categories.
+
+    Returns:
+        List[OpenApiExample]: A list of request/response examples for partially updating multiple categories.
+
+    Example Usage:
+        @extend_schema(examples=bulk_partial_update_category_examples())
+        def bulk_partial_update(self, request, *args, **kwargs):
+            pass
+    """
+
+    return [
+        OpenApiExample(
+            "Valid example 1 (Request)",
+            summary="Partially updating multiple categories",
+            description="This example demonstrates an item of the list of categories updated in a single \
+                request, every item identifies the category by its id and contains only the updated fields.",
+            value={"id": 2, "name": "Category2 Updated", "parent": 1},
+            request_only=True,
+        ),
+        OpenApiExample(
+            "Valid example 2 (PATCH Response)",
+            summary="Categories updated",
+            description="Example of an item of the response for successfully updating multiple categories, \
+                updated categories are listed in the order of the request.",
+            value={
+                "id": 2,
+                "name": "Category2 Updated",
+                "slug": "category2-updated",
+                "description": "Description for Category2",
+                "image": None,
+                "parent": 1,
+                "child_count": 0,
+                "descendant_count": 0,
+            },
+            response_only=True,
+            status_codes=[200],
+        ),
+        OpenApiExample(
+            "Valid example 3 (PATCH Response)",
+            summary="Updating categories with invalid data",
+            description="Example of response for updating multiple categories when some of the items are invalid, \
+                errors are reported for every item in the order of the request and no category is updated.",
+            value=[
+                {},
+                {"name": ["category with this name already exists."]},
+                {"parent": ["This change would create a circular relationship."]},
+                {"id": ['Invalid pk "99999" - object does not exist.']},
+            ],
+            response_only=True,
+            status_codes=[400],
+        ),
+        OpenApiExample(
+            "Valid example 4 (Response)",
+            summary="Updating categories without authentication",
+            description="This example demonstrates the response after trying to update categories without authentication.",
+            value={"detail": "Authentication credentials were not provided."},
+            response_only=True,
+            status_codes=[401],
+        ),
+        OpenApiExample(
+            "Valid example 5 (Response)",
+            summary="Updating categories without permissions",
+            description="This example demonstrates the response after trying to update categories without permissions.",
+            value={"detail": "You do not have permission to perform this action."},
+            response_only=True,
+            status_codes=[403],
+        ),
+    ]
+
+
+def move_category_examples():
+    """
+    Provides examples for moving a category with its subtree.
+
+    Returns:
+        List[OpenApiExample]: A list of request/response examples for moving a category.
+
+    Example Usage:
+        @extend_schema(examples=move_category_examples())
+        def move(self, request, *args, **kwargs):
+            pass
+    """
+
+    return [
+        OpenApiExample(
+            "Valid example 1 (Request)",
+            summary="Moving category under another category",
+            description="This example demonstrates how to move a category with its subcategories under another category.",
+            value={"parent": 2},
+            request_only=True,
+        ),
+        OpenApiExample(
+            "Valid example 2 (Request)",
+            summary="Moving category to the top level",
+            description="This example demonstrates how to move a category with its subcategories to the top level.",
+            value={"parent": None},
+            request_only=True,
+        ),
+        OpenApiExample(
+            "Valid example 3 (POST Response)",
+            summary="Category moved",
+            description="Example of a response after successfully moving a category with two subcategories.",
+            value={"message": "Category was successfully moved.", "moved_count": 3},
+            response_only=True,
+            status_codes=[200],
+        ),
+        OpenApiExample(
+            "Valid example 4 (POST Response)",
+            summary="Circular relationship",
+            description="Example of a response after trying to move a category under one of its own subcategories.",
+            value={"parent": ["This change would create a circular relationship."]},
+            response_only=True,
+            status_codes=[400],
+        ),
+        OpenApiExample(
+            "Valid example 5 (Response)",
+            summary="Moving category without authentication",
+            description="This example demonstrates the response after trying to move a category without authentication.",
+            value={"detail": "Authentication credentials were not provided."},
+            response_only=True,
+            status_codes=[401],
+        ),
+        OpenApiExample(
+            "Valid example 6 (Response)",
+            summary="Moving category without permissions",
+            description="This example demonstrates the response after trying to move a category without permissions.",
+            value={"detail": "You do not have permission to perform this action."},
+            response_only=True,
+            status_codes=[403],
+        ),
+        OpenApiExample(
+            "Valid example 7 (POST Response)",
+            summary="Moving non-existing category",
+            description="Example of moving a category that does not exist.",
+            value={"detail": "Not found."},
+            response_only=True,
+            status_codes=[404],
+        ),
+    ]
+
+
+def reorder_category_examples():
+    """
+    Provides examples for reordering a category among its siblings.
+
+    Returns:
+        List[OpenApiExample]: A list of request/response examples for reordering a category.
+
+    Example Usage:
+        @extend_schema(examples=reorder_category_examples())
+        def reorder(self, request, *args, **kwargs):
+            pass
+    """
+
+    return [
+        OpenApiExample(
+            "Valid example 1 (Request)",
+            summary="Placing category after a sibling",
+            description="This example demonstrates how to place a category right after one of its siblings.",
+            value={"after": 2},
+            request_only=True,
+        ),
+        OpenApiExample(
+            "Valid example 2 (Request)",
+            summary="Placing category before a sibling",
+            description="This example demonstrates how to place a category right before one of its siblings, \
+                placing it before the first sibling makes it the first one.",
+            value={"before": 3},
+            request_only=True,
+        ),
+        OpenApiExample(
+            "Valid example 3 (POST Response)",
+            summary="Category reordered",
+            description="Example of response for successfully reordering a category.",
+            value=None,
+            response_only=True,
+            status_codes=[204],
+        ),
+        OpenApiExample(
+            "Valid example 4 (POST Response)",
+            summary="Reordering next to category with different parent",
+            description="Example of response for trying to place a category next to a category that is not its sibling.",
+            value={"after": ["Categories must have the same parent."]},
+            response_only=True,
+            status_codes=[400],
+        ),
+        OpenApiExample(
+            "Valid example 5 (Response)",
+            summary="Reordering category without authentication",
+            description="This example demonstrates the response after trying to reorder a category without authentication.",
+            value={"detail": "Authentication credentials were not provided."},
+            response_only=True,
+            status_codes=[401],
+        ),
+        OpenApiExample(
+            "Valid example 6 (Response)",
+            summary="Reordering category without permissions",
+            description="This example demonstrates the response after trying to reorder a category without permissions.",
+            value={"detail": "You do not have permission to perform this action."},
+            response_only=True,
+            status_codes=[403],
+        ),
+        OpenApiExample(
+            "Valid example 7 (POST Response)",
+            summary="Reordering non-existing category",
+            description="Example of reordering a category that does not exist.",
+            value={"detail": "Not found."},
+            response_only=True,
+            status_codes=[404],
         ),
+    ]
+
+
+def delete_category_examples():
+    """
+    Provides examples for deleting categories.
+
+    Returns:
+        List[OpenApiExample]: A list of response examples for deleting categories.
+
+    Example Usage:
+        @extend_schema(examples=delete_category_examples())
+        def destroy(self, request, *args, **kwargs):
+            pass
+    """
+
+    return [
         OpenApiExample(
-            "Valid example 7 (PUT Response)",
-            summary="Updating category name with special characters",
-            description="Example of response for updating category with special characters.",
-            value={"name": ["Category name cannot contain special characters."]},
+            "Valid example 1 (DELETE Response)",
+            summary="Deleted category response",
+            description="Example of response for successfully deleting a category.",
+            value=None,  # No response body for DELETE request
             response_only=True,
-            status_codes=[400],
+            status_codes=[204],
         ),
         OpenApiExample(
-            "Valid example 8 (PUT Response)",
-            summary="Updating category name with circular relationship",
-            description="An example of a scenario when the user tries to make a subcategory, parent of its parent, \
-            thus creating a circular relationship. (e.g. `A` is the parent of `B` and the user tries to make `B` the parent of `A`)",
+            "Valid example 2 (DELETE Response)",
+            summary="Category scheduled for background deletion",
+            description="Example of response for deleting a category with a large subtree, which is deleted in the background.",
             value={
-                "non_field_errors": [
-                    "This change would create a circular relationship."
-                ]
+                "id": 1,
+                "category_id": 4,
+                "name": "Electronics",
+                "status": "pending",
+                "total_count": 12000,
+                "deleted_count": 0,
+                "created_at": "2024-02-10T12:00:00.000000+04:00",
+                "completed_at": None,
             },
             response_only=True,
-            status_codes=[400],
+            status_codes=[202],
         ),
         OpenApiExample(
-            "Valid example 9 (PUT Response)",
-            summary="Updating category with unauthenticated user",
-            description="This example demonstrates the response after trying to update a category while unauthenticated.",
+            "Valid example 3 (DELETE Response)",
+            summary="Deleting category with unauthenticated user",
+            description="This example demonstrates the response after trying to delete a category while unauthenticated.",
             value={"detail": "Authentication credentials were not provided."},
             response_only=True,
             status_codes=[401],
         ),
         OpenApiExample(
-            "Valid example 10 (PUT Response)",
-            summary="Updating category with invalid token",
-            description="This example demonstrates the response after trying to update a category with invalid token.",
+            "Valid example 4 (DELETE Response)",
+            summary="Deleting category with invalid token",
+            description="This example demonstrates the response after trying to delete a category with invalid token.",
             value={"detail": "Invalid token."},
             response_only=True,
             status_codes=[401],
         ),
         OpenApiExample(
-            "Valid example 11 (PUT Response)",
-            summary="Updating category with insufficient permissions",
-            description="This example demonstrates the response after trying to update a category with an user \
-                that does not have necessary permissions.",
+            "Valid example 5 (DELETE Response)",
+            summary="Deleting category with insufficient permissions",
+            description="This example demonstrates the response after trying to delete a category with an user that does not have necessary permissions.",
             value={"detail": "You do not have permission to perform this action."},
             response_only=True,
             status_codes=[403],
         ),
         OpenApiExample(
-            "Valid example 12 (PUT Response)",
-            summary="Updating category that does not exist",
-            description="This example demonstrates the response after trying to update a category that does not exist.",
+            "Valid example 6 (DELETE Response)",
+            summary="Trying to delete a category that does not exist",
+            description="This example demonstrates the response after trying to delete a category that does not exist.",
             value={"detail": "Not found."},
             response_only=True,
             status_codes=[404],
@@ -479,141 +1310,160 @@ def update_category_examples():
     ]
 
 
-def partial_update_category_examples():
+def bulk_delete_category_examples():
     """
-    Provides examples for partially updating categories.
+    Provides examples for deleting multiple categories.
 
     Returns:
-        List[OpenApiExample]: A list of request/response examples for partially updating categories with `PATCH` request.
+        List[OpenApiExample]: A list of request/response examples for deleting multiple categories.
 
     Example Usage:
-        @extend_schema(examples=partial_update_category_examples())
-        def partial_update(self, request, *args, **kwargs):
+        @extend_schema(examples=bulk_delete_category_examples())
+        def bulk_destroy(self, request, *args, **kwargs):
             pass
     """
 
     return [
         OpenApiExample(
-            "Valid example 1 (PATCH Request)",
-            summary="Update category partially",
-            description="Example of partially updating a category with `PATCH` request.",
-            value={
-                "description": "Updated description for the category",
-            },
+            "Valid example 1 (Request)",
+            summary="Deleting categories by slugs",
+            description="This example demonstrates how to delete multiple categories identified by their slugs.",
+            value={"slugs": ["summer-hats", "summer-shoes", "beach-toys"]},
             request_only=True,
         ),
         OpenApiExample(
-            "Valid example 1 (PATCH Response)",
-            summary="Partially updated category response",
-            description="Example of response for partially updating a category.",
+            "Valid example 2 (Request)",
+            summary="Deleting categories by ids",
+            description="This example demonstrates how to delete multiple categories identified by their ids.",
+            value={"ids": [4, 8, 15]},
+            request_only=True,
+        ),
+        OpenApiExample(
+            "Valid example 3 (DELETE Response)",
+            summary="Categories deleted",
+            description="Example of response for deleting multiple categories, one of which does not exist.",
             value={
-                "id": 1,
-                "name": "Some Category",
-                "slug": "some-category",
-                "description": "Updated description for the category",
-                "image": None,
-                "parent": None,
+                "results": [
+                    {"slug": "summer-hats", "status": "deleted"},
+                    {"slug": "summer-shoes", "status": "deleted"},
+                    {"slug": "beach-toys", "status": "not_found"},
+                ]
             },
             response_only=True,
             status_codes=[200],
         ),
         OpenApiExample(
-            "Valid example 2 (PATCH Response)",
-            summary="Partial update category with invalid data",
-            description="Example of response for partially updating a category with invalid data.",
+            "Valid example 4 (DELETE Response)",
+            summary="Categories deleted in the background",
+            description="Example of response for deleting multiple categories with large subtrees, \
+                which are deleted in the background.",
             value={
-                "name": ["Ensure this field has no more than 128 characters."],
-                "image": [
-                    "The submitted data was not a file. Check the encoding type on the form."
-                ],
-                "parent": ["Incorrect type. Expected pk value, received str."],
+                "results": [
+                    {"id": 4, "status": "scheduled", "deletion_id": 1},
+                    {"id": 8, "status": "scheduled", "deletion_id": 2},
+                    {"id": 15, "status": "not_found"},
+                ]
             },
             response_only=True,
-            status_codes=[400],
+            status_codes=[202],
         ),
         OpenApiExample(
-            "Valid example 3 (PATCH Response)",
-            summary="Partial update category with missing fields",
-            description="Example of response for partially updating a category with missing fields.",
+            "Valid example 5 (DELETE Response)",
+            summary="Deleting categories without keys",
+            description="Example of response for deleting multiple categories without providing slugs or ids.",
             value={
-                "name": ["This field is required."],
+                "non_field_errors": ["Provide exactly one of 'slugs' and 'ids' fields."]
             },
             response_only=True,
             status_codes=[400],
         ),
         OpenApiExample(
-            "Valid example 4 (PATCH Response)",
-            summary="Partially updating category name with category name that already exists",
-            description="Example of response for updating a category name field with value that already exists.",
-            value={"name": ["category with this name already exists."]},
-            response_only=True,
-            status_codes=[400],
-        ),
-        OpenApiExample(
-            "Valid example 5 (PATCH Response)",
-            summary="Partially updating category parent with its own id.",
-            description="Example of response for partially updating a category parent field with its own primary key value.",
-            value={"parent": ["A category cannot be its own parent."]},
+            "Valid example 6 (Response)",
+            summary="Deleting categories without authentication",
+            description="This example demonstrates the response after trying to delete categories without authentication.",
+            value={"detail": "Authentication credentials were not provided."},
             response_only=True,
-            status_codes=[400],
+            status_codes=[401],
         ),
         OpenApiExample(
-            "Valid example 6 (PATCH Response)",
-            summary="Partially updating category name with parent that does not exist",
-            description="Example of response for partially updating a category parent field with value that does not exist.",
-            value={"parent": ['Invalid pk "99999" - object does not exist.']},
+            "Valid example 7 (Response)",
+            summary="Deleting categories without permissions",
+            description="This example demonstrates the response after trying to delete categories without permissions.",
+            value={"detail": "You do not have permission to perform this action."},
             response_only=True,
-            status_codes=[400],
+            status_codes=[403],
         ),
+    ]
+
+
+def category_deletion_examples():
+    """
+    Provides examples for retrieving the progress of a background category deletion.
+
+    Returns:
+        List[OpenApiExample]: A list of response examples for retrieving a category deletion.
+
+    Example Usage:
+        @extend_schema(examples=category_deletion_examples())
+        def deletion(self, request, *args, **kwargs):
+            pass
+    """
+
+    return [
         OpenApiExample(
-            "Valid example 7 (PATCH Response)",
-            summary="Partially updating category name with special characters",
-            description="Example of response for partially updating category with special characters.",
-            value={"name": ["Category name cannot contain special characters."]},
+            "Valid example 1 (GET Response)",
+            summary="Deletion in progress",
+            description="Example of retrieving a deletion that is still in progress.",
+            value={
+                "id": 1,
+                "category_id": 4,
+                "name": "Electronics",
+                "status": "in_progress",
+                "total_count": 12000,
+                "deleted_count": 4500,
+                "created_at": "2024-02-10T12:00:00.000000+04:00",
+                "completed_at": None,
+            },
             response_only=True,
-            status_codes=[400],
+            status_codes=[200],
         ),
         OpenApiExample(
-            "Valid example 8 (PATCH Response)",
-            summary="Partially updating category name with circular relationship",
-            description="An example of a scenario when the user tries to make a subcategory, parent of its parent, \
-            thus creating a circular relationship. (e.g. `A` is the parent of `B` and the user tries to make `B` the parent of `A`)",
+            "Valid example 2 (GET Response)",
+            summary="Completed deletion",
+            description="Example of retrieving a deletion after all categories were deleted.",
             value={
-                "non_field_errors": [
-                    "This change would create a circular relationship."
-                ]
+                "id": 1,
+                "category_id": 4,
+                "name": "Electronics",
+                "status": "completed",
+                "total_count": 12000,
+                "deleted_count": 12000,
+                "created_at": "2024-02-10T12:00:00.000000+04:00",
+                "completed_at": "2024-02-10T12:01:30.000000+04:00",
             },
             response_only=True,
-            status_codes=[400],
+            status_codes=[200],
         ),
         OpenApiExample(
-            "Valid example 9 (PATCH Response)",
-            summary="Partially updating category with unauthenticated user",
-            description="This example demonstrates the response after trying to partially update a category while unauthenticated.",
+            "Valid example 3 (Response)",
+            summary="Retrieving deletion with unauthenticated user",
+            description="This example demonstrates the response after trying to retrieve a deletion while unauthenticated.",
             value={"detail": "Authentication credentials were not provided."},
             response_only=True,
             status_codes=[401],
         ),
         OpenApiExample(
-            "Valid example 10 (PATCH Response)",
-            summary="Partially updating category with invalid token",
-            description="This example demonstrates the response after trying to partially update a category with invalid token.",
-            value={"detail": "Invalid token."},
-            response_only=True,
-            status_codes=[401],
-        ),
-        OpenApiExample(
-            "Valid example 11 (PATCH Response)",
-            summary="Partially updating category with insufficient permissions",
-            description="This example demonstrates the response after trying to partially update a category with an user that does not have necessary permissions.",
+            "Valid example 4 (Response)",
+            summary="Retrieving deletion with insufficient permissions",
+            description="This example demonstrates the response after trying to retrieve a deletion with an user that does not have necessary permissions.",
             value={"detail": "You do not have permission to perform this action."},
             response_only=True,
             status_codes=[403],
         ),
         OpenApiExample(
-            "Valid example 12 (PATCH Response)",
-            summary="Partially updating category that does not exist",
-            description="This example demonstrates the response after trying to partially update a category that does not exist.",
+            "Valid example 5 (GET Response)",
+            summary="Retrieving deletion that does not exist",
+            description="This example demonstrates the response after trying to retrieve a deletion that does not exist.",
             value={"detail": "Not found."},
             response_only=True,
             status_codes=[404],
@@ -621,56 +1471,163 @@ def partial_update_category_examples():
     ]
 
 
-def delete_category_examples():
+def category_import_examples():
     """
-    Provides examples for deleting categories.
+    Provides examples for starting an import of categories from an uploaded file.
 
     Returns:
-        List[OpenApiExample]: A list of response examples for deleting categories.
+        List[OpenApiExample]: A list of response examples for starting a category import.
 
     Example Usage:
-        @extend_schema(examples=delete_category_examples())
-        def destroy(self, request, *args, **kwargs):
+        @extend_schema(examples=category_import_examples())
+        def imports(self, request, *args, **kwargs):
             pass
     """
 
     return [
         OpenApiExample(
-            "Valid example 1 (DELETE Response)",
-            summary="Deleted category response",
-            description="Example of response for successfully deleting a category.",
-            value=None,  # No response body for DELETE request
+            "Valid example 1 (POST Response)",
+            summary="Import started",
+            description="Example of the response after uploading a file, the categories are imported in the background.",
+            value={
+                "id": 1,
+                "source": "categories.csv",
+                "format": "csv",
+                "status": "pending",
+                "total_count": None,
+                "processed_count": 0,
+                "created_count": 0,
+                "updated_count": 0,
+                "rejected_count": 0,
+                "rejects": [],
+                "error": "",
+                "created_at": "2024-02-10T12:00:00.000000+04:00",
+                "completed_at": None,
+            },
             response_only=True,
-            status_codes=[204],
+            status_codes=[202],
         ),
         OpenApiExample(
-            "Valid example 2 (DELETE Response)",
-            summary="Deleting category with unauthenticated user",
-            description="This example demonstrates the response after trying to delete a category while unauthenticated.",
+            "Valid example 2 (POST Response)",
+            summary="Uploading an empty file",
+            description="This example demonstrates the response after trying to import an empty file.",
+            value={"file": ["The submitted file is empty."]},
+            response_only=True,
+            status_codes=[400],
+        ),
+        OpenApiExample(
+            "Valid example 3 (Response)",
+            summary="Starting import with unauthenticated user",
+            description="This example demonstrates the response after trying to import categories while unauthenticated.",
             value={"detail": "Authentication credentials were not provided."},
             response_only=True,
             status_codes=[401],
         ),
         OpenApiExample(
-            "Valid example 3 (DELETE Response)",
-            summary="Deleting category with invalid token",
-            description="This example demonstrates the response after trying to delete a category with invalid token.",
-            value={"detail": "Invalid token."},
+            "Valid example 4 (Response)",
+            summary="Starting import with insufficient permissions",
+            description="This example demonstrates the response after trying to import categories with an user that does not have necessary permissions.",
+            value={"detail": "You do not have permission to perform this action."},
+            response_only=True,
+            status_codes=[403],
+        ),
+    ]
+
+
+def category_import_detail_examples():
+    """
+    Provides examples for retrieving the progress of a category import.
+
+    Returns:
+        List[OpenApiExample]: A list of response examples for retrieving a category import.
+
+    Example Usage:
+        @extend_schema(examples=category_import_detail_examples())
+        def category_import(self, request, *args, **kwargs):
+            pass
+    """
+
+    return [
+        OpenApiExample(
+            "Valid example 1 (GET Response)",
+            summary="Import in progress",
+            description="Example of retrieving an import that is still in progress, with a rejected row.",
+            value={
+                "id": 1,
+                "source": "categories.csv",
+                "format": "csv",
+                "status": "in_progress",
+                "total_count": 50000,
+                "processed_count": 20000,
+                "created_count": 19000,
+                "updated_count": 999,
+                "rejected_count": 1,
+                "rejects": [
+                    {
+                        "line": 12,
+                        "name": "Phones & Tablets",
+                        "errors": {
+                            "name": ["Category name cannot contain special characters."]
+                        },
+                    }
+                ],
+                "error": "",
+                "created_at": "2024-02-10T12:00:00.000000+04:00",
+                "completed_at": None,
+            },
+            response_only=True,
+            status_codes=[200],
+        ),
+        OpenApiExample(
+            "Valid example 2 (GET Response)",
+            summary="Completed import",
+            description="Example of retrieving an import after all rows of the file were imported.",
+            value={
+                "id": 1,
+                "source": "categories.csv",
+                "format": "csv",
+                "status": "completed",
+                "total_count": 50000,
+                "processed_count": 50000,
+                "created_count": 48000,
+                "updated_count": 1999,
+                "rejected_count": 1,
+                "rejects": [
+                    {
+                        "line": 12,
+                        "name": "Phones & Tablets",
+                        "errors": {
+                            "name": ["Category name cannot contain special characters."]
+                        },
+                    }
+                ],
+                "error": "",
+                "created_at": "2024-02-10T12:00:00.000000+04:00",
+                "completed_at": "2024-02-10T12:00:40.000000+04:00",
+            },
+            response_only=True,
+            status_codes=[200],
+        ),
+        OpenApiExample(
+            "Valid example 3 (Response)",
+            summary="Retrieving import with unauthenticated user",
+            description="This example demonstrates the response after trying to retrieve an import while unauthenticated.",
+            value={"detail": "Authentication credentials were not provided."},
             response_only=True,
             status_codes=[401],
         ),
         OpenApiExample(
-            "Valid example 4 (DELETE Response)",
-            summary="Deleting category with insufficient permissions",
-            description="This example demonstrates the response after trying to delete a category with an user that does not have necessary permissions.",
+            "Valid example 4 (Response)",
+            summary="Retrieving import with insufficient permissions",
+            description="This example demonstrates the response after trying to retrieve an import with an user that does not have necessary permissions.",
             value={"detail": "You do not have permission to perform this action."},
             response_only=True,
             status_codes=[403],
         ),
         OpenApiExample(
-            "Valid example 5 (DELETE Response)",
-            summary="Trying to delete a category that does not exist",
-            description="This example demonstrates the response after trying to delete a category that does not exist.",
+            "Valid example 5 (GET Response)",
+            summary="Retrieving import that does not exist",
+            description="This example demonstrates the response after trying to retrieve an import that does not exist.",
             value={"detail": "Not found."},
             response_only=True,
             status_codes=[404],